@@ -48,14 +48,14 @@ def initialize_system():
     """Initialize and cache system components."""
     data_loader = DataLoader()
 
-    dem_result = data_loader.load_dem()
+    dem_result = data_loader.load_dem(bounds=STUDY_AREA_BOUNDS)
     if dem_result is None:
         st.info("No DEM found. Generating synthetic terrain...")
         elevation, transform = data_loader.create_synthetic_dem(STUDY_AREA_BOUNDS, save=True)
     else:
         elevation, transform = dem_result
 
-    terrain = TerrainAnalyzer(elevation, transform, STUDY_AREA_BOUNDS)
+    terrain = TerrainAnalyzer(elevation, transform, STUDY_AREA_BOUNDS, cache_dir="cache")
 
     threat_predictor = ThreatPredictor()
     incidents = data_loader.load_incidents()
@@ -64,7 +64,7 @@ def initialize_system():
         incidents = threat_predictor.generate_synthetic_incidents()
         data_loader.save_incidents(incidents)
 
-    threat_predictor.train_temporal_model(incidents)
+    threat_predictor.train_temporal_model(incidents, cache_dir=str(data_loader.synthetic_dir))
     threat_predictor.identify_kill_zones()
 
     graph_builder = GraphBuilder(terrain, threat_predictor, WeatherModel())
@@ -172,13 +172,12 @@ def main():
             departure_time = datetime.now().replace(hour=departure_hour, minute=0, second=0)
 
             observer_positions = [(48.3, 37.2), (48.25, 37.35)]
-            viewshed = terrain.calculate_viewshed(observer_positions)
 
             # Get kill zones from threat predictor
             kill_zones = threat_predictor.kill_zones if hasattr(threat_predictor, 'kill_zones') else []
 
             graph_builder.enrich_graph(
-                viewshed=viewshed,
+                observer_positions=observer_positions,
                 rf_coverage=None,
                 weather=weather,
                 timestamp=departure_time,
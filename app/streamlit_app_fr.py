@@ -48,14 +48,14 @@ def initialize_system():
     """Initialise le système."""
     data_loader = DataLoader()
 
-    dem_result = data_loader.load_dem()
+    dem_result = data_loader.load_dem(bounds=STUDY_AREA_BOUNDS)
     if dem_result is None:
         st.info("🔄 Génération du terrain synthétique...")
         elevation, transform = data_loader.create_synthetic_dem(STUDY_AREA_BOUNDS, save=True)
     else:
         elevation, transform = dem_result
 
-    terrain = TerrainAnalyzer(elevation, transform, STUDY_AREA_BOUNDS)
+    terrain = TerrainAnalyzer(elevation, transform, STUDY_AREA_BOUNDS, cache_dir="cache")
 
     threat_predictor = ThreatPredictor()
     incidents = data_loader.load_incidents()
@@ -64,7 +64,7 @@ def initialize_system():
         incidents = threat_predictor.generate_synthetic_incidents()
         data_loader.save_incidents(incidents)
 
-    threat_predictor.train_temporal_model(incidents)
+    threat_predictor.train_temporal_model(incidents, cache_dir=str(data_loader.synthetic_dir))
     threat_predictor.identify_kill_zones()
 
     graph_builder = GraphBuilder(terrain, threat_predictor, WeatherModel())
@@ -104,7 +104,6 @@ def main():
 
     system = initialize_system()
 
-    terrain = system["terrain"]
     elevation = system["elevation"]
     threat_predictor = system["threat_predictor"]
     graph_builder = system["graph_builder"]
@@ -166,12 +165,11 @@ def main():
             departure_time = datetime.now().replace(hour=departure_hour, minute=0, second=0)
 
             observer_positions = [(48.3, 37.2), (48.25, 37.35)]
-            viewshed = terrain.calculate_viewshed(observer_positions)
 
             kill_zones = threat_predictor.kill_zones if hasattr(threat_predictor, 'kill_zones') else []
 
             graph_builder.enrich_graph(
-                viewshed=viewshed,
+                observer_positions=observer_positions,
                 rf_coverage=None,
                 weather=weather_en,
                 timestamp=departure_time,
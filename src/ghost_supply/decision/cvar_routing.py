@@ -27,6 +27,7 @@ from ghost_supply.utils.constants import (
     CVAR_TIME_LIMIT_SEC,
     CVAR_WEIGHT_RISK,
     CVAR_WEIGHT_TIME,
+    RF_SHADOW_RISK_REDUCTION,
 )
 from ghost_supply.utils.geo import calculate_path_length
 
@@ -267,7 +268,11 @@ class CVaRRouter:
 
         for u, v, data in self.graph.edges(data=True):
             killzone_penalty = data.get("killzone_penalty", 1.0)
-            risk = data.get("detection_base", 0.3) * cargo_value / 10.0 * killzone_penalty
+            shadow_factor = 1.0 - RF_SHADOW_RISK_REDUCTION * data.get("rf_shadow_fraction", 0.0)
+            risk = (
+                data.get("detection_base", 0.3) * cargo_value / 10.0
+                * killzone_penalty * shadow_factor
+            )
             data["risk_weight"] = risk
 
         try:
@@ -323,12 +328,14 @@ class CVaRRouter:
         base_detection = data.get("detection_base", 0.3)
         visibility = data.get("visibility", 0.5)
         killzone_penalty = data.get("killzone_penalty", 1.0)
+        shadow_factor = 1.0 - RF_SHADOW_RISK_REDUCTION * data.get("rf_shadow_fraction", 0.0)
 
         scenario_risk = (
             base_detection * scenario["detection_mult"] *
             (1.0 + visibility * scenario["visibility_mult"] * 0.5) *
             scenario["patrol_presence"] *
-            killzone_penalty
+            killzone_penalty *
+            shadow_factor
         )
 
         weighted_risk = scenario_risk * (cargo_value / 10.0)
@@ -6,10 +6,13 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 from loguru import logger
 
+from ghost_supply.perception.rf_propagation import RFPropagationModel
 from ghost_supply.utils.constants import (
     DEPOT_MAX_DISTANCE_KM,
     DEPOT_MIN_DISTANCE_KM,
     FRONTLINE_BUFFER_KM,
+    RF_GOOD_SIGNAL_DBM,
+    RF_MIN_SIGNAL_DBM,
 )
 from ghost_supply.utils.geo import haversine_distance
 
@@ -34,6 +37,8 @@ def select_depots(
     frontline_lon: float,
     num_depots: int = 3,
     min_separation_km: float = 5.0,
+    rf_model: Optional[RFPropagationModel] = None,
+    base_stations: Optional[List[Tuple[float, float]]] = None,
 ) -> List[DepotCandidate]:
     """
     Select optimal depot locations from candidates.
@@ -43,12 +48,23 @@ def select_depots(
         frontline_lat, frontline_lon: Approximate frontline position
         num_depots: Number of depots to select
         min_separation_km: Minimum separation between depots
+        rf_model: RF model scoring candidates by signal from base_stations
+            (random score if None)
+        base_stations: Friendly (lat, lon) transmitter positions
 
     Returns:
         List of selected DepotCandidate objects
     """
     logger.info(f"Selecting {num_depots} depots from {len(candidates)} candidates")
 
+    rf_scores = None
+    if rf_model is not None and base_stations:
+        rf_scores = _score_rf_coverage(rf_model.signal_at_points(
+            base_stations,
+            [candidate[0] for candidate in candidates],
+            [candidate[1] for candidate in candidates],
+        ))
+
     depot_candidates = []
 
     for i, (lat, lon, name, protection, accessibility) in enumerate(candidates):
@@ -56,7 +72,10 @@ def select_depots(
 
         distance_score = _score_distance_to_front(distance_to_front)
 
-        rf_coverage_score = np.random.uniform(0.6, 1.0)
+        if rf_scores is not None:
+            rf_coverage_score = float(rf_scores[i])
+        else:
+            rf_coverage_score = np.random.uniform(0.6, 1.0)
 
         total_score = (
             0.3 * distance_score +
@@ -139,6 +158,23 @@ def _score_distance_to_front(distance_km: float) -> float:
     return max(score, 0.0)
 
 
+def _score_rf_coverage(signal_dbm: np.ndarray) -> np.ndarray:
+    """
+    Score depots based on friendly RF signal.
+
+    Linear from RF_MIN_SIGNAL_DBM (0) to RF_GOOD_SIGNAL_DBM (1).
+
+    Args:
+        signal_dbm: Signal strengths in dBm
+
+    Returns:
+        Scores (0-1)
+    """
+    score = (signal_dbm - RF_MIN_SIGNAL_DBM) / (RF_GOOD_SIGNAL_DBM - RF_MIN_SIGNAL_DBM)
+
+    return np.clip(score, 0.0, 1.0)
+
+
 def generate_candidate_depots(
     bounds: Dict[str, float],
     frontline_lat: float,
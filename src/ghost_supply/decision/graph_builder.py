@@ -6,14 +6,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 import osmnx as ox
 from loguru import logger
 
+from ghost_supply.perception.rf_propagation import RFPropagationModel, RFShadowOverlay
 from ghost_supply.perception.terrain import TerrainAnalyzer
-from ghost_supply.perception.threat_model import ThreatPredictor
+from ghost_supply.perception.threat_model import KillZoneIndex, ThreatPredictor
+from ghost_supply.perception.viewshed import CompositeViewshed
 from ghost_supply.perception.weather import WeatherModel
 from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
-from ghost_supply.utils.geo import haversine_distance
+from ghost_supply.utils.geo import haversine_distance, haversine_distances
 
 
 class GraphBuilder:
@@ -24,6 +27,7 @@ class GraphBuilder:
         terrain: Optional[TerrainAnalyzer] = None,
         threat_predictor: Optional[ThreatPredictor] = None,
         weather_model: Optional[WeatherModel] = None,
+        rf_model: Optional[RFPropagationModel] = None,
     ):
         """
         Initialise le constructeur de graphe.
@@ -32,14 +36,19 @@ class GraphBuilder:
             terrain: Instance de TerrainAnalyzer
             threat_predictor: Instance de ThreatPredictor
             weather_model: Instance de WeatherModel
+            rf_model: Instance de RFPropagationModel (signal RF des arcs)
         """
         self.terrain = terrain
         self.threat_predictor = threat_predictor
         self.weather_model = weather_model or WeatherModel()
+        self.rf_model = rf_model
 
         self.graph: Optional[nx.MultiDiGraph] = None
         self.simplified_graph: Optional[nx.DiGraph] = None
 
+        self._visibility_observers: Optional[int] = None
+        self._killzone_index: Optional[KillZoneIndex] = None
+
         logger.info("Initialized GraphBuilder")
 
     def build_from_osm(
@@ -205,16 +214,33 @@ class GraphBuilder:
         weather: str = "clear",
         timestamp: Optional[datetime] = None,
         kill_zones: Optional[List[Dict]] = None,
+        observer_positions: Optional[List[Tuple[float, float]]] = None,
+        slope_reduction: Optional[str] = "max",
+        base_stations: Optional[List[Tuple[float, float]]] = None,
+        rf_shadows: Optional[RFShadowOverlay] = None,
     ) -> None:
         """
         Enrichit les arcs du graphe avec des attributs tactiques.
 
         Args:
             viewshed: Tableau viewshed de TerrainAnalyzer
-            rf_coverage: Carte de couverture RF
+            rf_coverage: Carte de couverture RF (échantillonnée aux milieux des arcs
+                via rf_model, ou via la grille du terrain sans rf_model)
             weather: Condition météo
             timestamp: Horodatage de la mission
             kill_zones: Liste de dicts de kill zones avec 'center' et 'radius_km'
+            observer_positions: Positions (lat, lon) des observateurs. Si fourni,
+                la visibilité est calculée uniquement aux milieux des arcs
+                (viewshed creux) au lieu de lire un viewshed raster complet
+            slope_reduction: Pente retenue par arc le long de sa géométrie,
+                "max" (plus forte) ou "mean" (moyenne pondérée par la longueur);
+                None désactive la pénalité de pente
+            base_stations: Positions (lat, lon) des émetteurs amis. Sans carte
+                rf_coverage, le signal est calculé directement aux milieux des
+                arcs par rf_model (sans raster de couverture)
+            rf_shadows: Zones d'ombre RF (analyze_shadow_zones). Si fourni,
+                chaque arc reçoit rf_shadow_fraction, la part de sa longueur
+                en ombre, calculée en bloc le long de sa géométrie
         """
         if self.simplified_graph is None:
             raise ValueError("Graph not built. Call build_from_osm first.")
@@ -224,61 +250,230 @@ class GraphBuilder:
 
         logger.info("Enriching graph with tactical attributes...")
 
-        for u, v, data in self.simplified_graph.edges(data=True):
+        edges = list(self.simplified_graph.edges(data=True))
+
+        mid_lats, mid_lons = self._edge_midpoints(edges)
+
+        edge_visibility = None
+        if observer_positions is not None and self.terrain:
+            edge_visibility = self.terrain.calculate_visibility_at_points(
+                observer_positions, mid_lats, mid_lons
+            )
+        elif viewshed is not None and self.terrain:
+            edge_visibility = self.terrain.sample_visibility(mid_lats, mid_lons, viewshed)
+
+        edge_rf = None
+        if rf_coverage is not None:
+            if self.rf_model is not None:
+                edge_rf = self.rf_model.sample_signal(mid_lats, mid_lons, rf_coverage)
+            elif self.terrain and rf_coverage.shape == self.terrain.elevation.shape:
+                edge_rf = self.terrain.grid.sample(rf_coverage, mid_lats, mid_lons, fill=-200.0)
+            else:
+                logger.warning(
+                    "rf_coverage ignored: no rf_model and no terrain grid matching its shape"
+                )
+        elif self.rf_model is not None and base_stations:
+            edge_rf = self.rf_model.signal_at_points(base_stations, mid_lats, mid_lons)
+
+        road_types = [
+            self._classify_road_type(data.get("highway", "track")) for _, _, data in edges
+        ]
+
+        edge_killzone = self._compute_killzone_penalties(mid_lats, mid_lons, kill_zones)
+
+        edge_detection = None
+        if self.threat_predictor:
+            edge_detection = self.threat_predictor.risk_at_many(
+                mid_lats, mid_lons, timestamp, road_types, weather
+            )
+
+        path_lats, path_lons = None, None
+        if rf_shadows is not None or (self.terrain and slope_reduction is not None):
+            path_lats, path_lons = self._edge_paths(edges)
+
+        edge_shadow = None
+        if rf_shadows is not None:
+            edge_shadow = rf_shadows.edge_fractions(path_lats, path_lons)
+
+        edge_slopes = None
+        if self.terrain:
+            if slope_reduction is not None:
+                edge_slopes = self.terrain.sample_slope_along_paths(
+                    path_lats, path_lons, reduction=slope_reduction
+                )
+            edge_speeds = self.terrain.get_mobility_speeds(road_types, weather, edge_slopes)
+        else:
+            edge_speeds = np.full(len(edges), 40.0)
+
+        for i, (u, v, data) in enumerate(edges):
             u_lat = self.simplified_graph.nodes[u]["y"]
             u_lon = self.simplified_graph.nodes[u]["x"]
             v_lat = self.simplified_graph.nodes[v]["y"]
             v_lon = self.simplified_graph.nodes[v]["x"]
 
-            mid_lat = (u_lat + v_lat) / 2
-            mid_lon = (u_lon + v_lon) / 2
-
             distance_km = haversine_distance(u_lat, u_lon, v_lat, v_lon)
             data["distance_km"] = distance_km
 
-            road_type = self._classify_road_type(data.get("highway", "track"))
+            road_type = road_types[i]
             data["road_type"] = road_type
 
-            if self.terrain:
-                base_speed = self.terrain.get_mobility_speed(road_type, weather)
+            if edge_slopes is not None:
+                data["slope_deg"] = float(edge_slopes[i])
             else:
-                base_speed = 40.0
+                data.pop("slope_deg", None)
 
+            base_speed = float(edge_speeds[i])
             data["base_speed_kmh"] = base_speed
 
-            if viewshed is not None and self.terrain:
-                visibility = self.terrain.get_visibility_at(mid_lat, mid_lon, viewshed)
+            if edge_visibility is not None:
+                visibility = float(edge_visibility[i])
             else:
                 visibility = 0.5
 
             data["visibility"] = visibility
 
-            if rf_coverage is not None and hasattr(self, "_get_rf_signal"):
-                rf_signal = self._get_rf_signal(mid_lat, mid_lon, rf_coverage)
+            if edge_rf is not None:
+                rf_signal = float(edge_rf[i])
             else:
                 rf_signal = -80.0
 
             data["rf_coverage_dbm"] = rf_signal
 
-            if self.threat_predictor:
-                detection_prob = self.threat_predictor.risk_at(
-                    mid_lat, mid_lon, timestamp, road_type, weather
-                )
+            if edge_shadow is not None:
+                data["rf_shadow_fraction"] = float(edge_shadow[i])
+            else:
+                data.pop("rf_shadow_fraction", None)
+
+            if edge_detection is not None:
+                detection_prob = float(edge_detection[i])
             else:
                 detection_prob = visibility * 0.3
 
             data["detection_base"] = detection_prob
 
-            killzone_penalty = self._compute_killzone_penalty(
-                mid_lat, mid_lon, kill_zones
-            )
-            data["killzone_penalty"] = killzone_penalty
+            data["killzone_penalty"] = float(edge_killzone[i])
 
             travel_time_hours = distance_km / base_speed if base_speed > 0 else 999.0
             data["travel_time_hours"] = travel_time_hours
 
         logger.info("Graph enrichment complete")
 
+    def refresh_visibility(
+        self,
+        composite: CompositeViewshed,
+        window: Optional[Tuple[slice, slice]] = None,
+    ) -> int:
+        """
+        Met à jour la visibilité des seuls arcs affectés par un changement d'observateurs.
+
+        Seuls les arcs dont le milieu tombe dans la fenêtre modifiée sont
+        relus; si le nombre d'observateurs a changé, les arcs déjà vus sont
+        aussi relus (la fraction d'observateurs change). Les attributs ne sont
+        réécrits que pour les arcs dont la valeur a changé.
+
+        Args:
+            composite: Viewshed composite incrémental
+            window: Fenêtre (lignes, colonnes) modifiée; par défaut composite.pop_dirty()
+
+        Returns:
+            Nombre d'arcs mis à jour
+        """
+        if self.simplified_graph is None:
+            raise ValueError("Graph not built. Call build_from_osm first.")
+
+        if window is None:
+            window = composite.pop_dirty()
+
+        observers_changed = self._visibility_observers != composite.num_observers
+        self._visibility_observers = composite.num_observers
+
+        if window is None and not observers_changed:
+            return 0
+
+        edges = list(self.simplified_graph.edges(data=True))
+        mid_lats, mid_lons = self._edge_midpoints(edges)
+
+        candidates = np.zeros(len(edges), dtype=bool)
+
+        if window is not None:
+            rows, cols = composite.grid.rowcol(mid_lats, mid_lons)
+            row_slice, col_slice = window
+            candidates |= (
+                (rows >= row_slice.start) & (rows < row_slice.stop)
+                & (cols >= col_slice.start) & (cols < col_slice.stop)
+            )
+
+        if observers_changed:
+            candidates |= composite.grid.sample(composite.counts, mid_lats, mid_lons, fill=0.0) > 0
+            candidates |= np.array([data.get("visibility", 0.0) > 0 for _, _, data in edges])
+
+        indices = np.flatnonzero(candidates)
+        values = composite.sample(mid_lats[indices], mid_lons[indices])
+
+        updated = 0
+        for i, visibility in zip(indices, values):
+            data = edges[i][2]
+
+            if data.get("visibility") == float(visibility):
+                continue
+
+            data["visibility"] = float(visibility)
+            if not self.threat_predictor:
+                data["detection_base"] = float(visibility) * 0.3
+
+            updated += 1
+
+        logger.info(f"Refreshed visibility on {updated} edges ({len(indices)} candidates)")
+
+        return updated
+
+    def _edge_midpoints(self, edges: List[Tuple[Any, Any, Dict]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcule les milieux des arcs, alignés sur la liste d'arcs.
+
+        Args:
+            edges: Liste de (u, v, data) du graphe simplifié
+
+        Returns:
+            Tuple (latitudes, longitudes) des milieux
+        """
+        nodes = self.simplified_graph.nodes
+
+        mid_lats = np.array([(nodes[u]["y"] + nodes[v]["y"]) / 2 for u, v, _ in edges], dtype=float)
+        mid_lons = np.array([(nodes[u]["x"] + nodes[v]["x"]) / 2 for u, v, _ in edges], dtype=float)
+
+        return mid_lats, mid_lons
+
+    def _edge_paths(
+        self, edges: List[Tuple[Any, Any, Dict]]
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Extrait le tracé de chaque arc (géométrie OSM si présente, sinon segment u-v).
+
+        Args:
+            edges: Liste de (u, v, data) du graphe simplifié
+
+        Returns:
+            Tuple (latitudes, longitudes) des sommets de chaque arc
+        """
+        nodes = self.simplified_graph.nodes
+
+        path_lats = []
+        path_lons = []
+
+        for u, v, data in edges:
+            geometry = data.get("geometry")
+
+            if geometry is not None and hasattr(geometry, "coords"):
+                coords = np.asarray(geometry.coords, dtype=float)
+                path_lons.append(coords[:, 0])
+                path_lats.append(coords[:, 1])
+            else:
+                path_lats.append(np.array([nodes[u]["y"], nodes[v]["y"]], dtype=float))
+                path_lons.append(np.array([nodes[u]["x"], nodes[v]["x"]], dtype=float))
+
+        return path_lats, path_lons
+
     def _classify_road_type(self, highway: Any) -> str:
         """
         Classifie le tag highway OSM en type de route simplifié.
@@ -469,11 +664,13 @@ class GraphBuilder:
 
         min_penalty = 1.0
 
-        for kz in kill_zones:
+        for zone in self._get_killzone_index(kill_zones).candidates(lat, lon, scale=2.0):
+            kz = kill_zones[zone]
             center_lat, center_lon = kz["center"]
             radius_km = kz["radius_km"]
 
-            distance_km = haversine_distance(lat, lon, center_lat, center_lon)
+            # Même distance sphérique que _compute_killzone_penalties
+            distance_km = float(haversine_distances(lat, lon, center_lat, center_lon))
 
             if distance_km < radius_km:
                 penalty = 1000.0
@@ -488,3 +685,58 @@ class GraphBuilder:
             min_penalty = max(min_penalty, penalty)
 
         return min_penalty
+
+    def _compute_killzone_penalties(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        kill_zones: Optional[List[Dict]] = None,
+    ) -> np.ndarray:
+        """
+        Version vectorisée de _compute_killzone_penalty.
+
+        Seules les kill zones candidates renvoyées par l'index spatial
+        (à moins de 2× le rayon maximal) sont évaluées pour chaque point.
+
+        Args:
+            lats, lons: Coordonnées des milieux des arcs (tableaux)
+            kill_zones: Liste de dicts de kill zones
+
+        Returns:
+            Multiplicateurs de pénalité (>= 1.0)
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+
+        penalties = np.ones(len(lats))
+
+        if not kill_zones:
+            return penalties
+
+        index = self._get_killzone_index(kill_zones)
+        point_idx, zone_idx = index.query(lats, lons, scale=2.0)
+
+        distance_km = haversine_distances(
+            lats[point_idx], lons[point_idx], index.centers[zone_idx, 0], index.centers[zone_idx, 1]
+        )
+        radius_km = index.radii_km[zone_idx]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            proximity = 1.0 - (distance_km - radius_km) / (radius_km * 0.5)
+
+        pair_penalties = np.select(
+            [distance_km < radius_km, distance_km < radius_km * 1.5, distance_km < radius_km * 2.0],
+            [1000.0, 50.0 * np.exp(3.0 * proximity), 10.0],
+            default=1.0,
+        )
+
+        np.maximum.at(penalties, point_idx, pair_penalties)
+
+        return penalties
+
+    def _get_killzone_index(self, kill_zones: List[Dict]) -> KillZoneIndex:
+        """Index spatial des kill zones, reconstruit si des zones ont été ajoutées ou retirées."""
+        if self._killzone_index is None or not self._killzone_index.matches(kill_zones):
+            self._killzone_index = KillZoneIndex(kill_zones)
+
+        return self._killzone_index
@@ -0,0 +1,326 @@
+"""Horizon index that settles most line-of-sight queries in a few samples."""
+
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from ghost_supply.utils.constants import (
+    DEM_RESOLUTION_M,
+    HORIZON_NUM_BANDS,
+    HORIZON_NUM_SECTORS,
+    HORIZON_STEP_CELLS,
+    VIEWSHED_MAX_DISTANCE_KM,
+)
+
+# Samples read next to each end of a sight line before trusting the hints
+_END_PROBES = 2
+
+
+def line_of_sight(
+    elevation: np.ndarray,
+    obs_rows: Any, obs_cols: Any, obs_elevation: Any,
+    tgt_rows: Any, tgt_cols: Any, tgt_elevation: Any,
+    num_samples: Any = 50,
+) -> np.ndarray:
+    """
+    Vectorized sampled line of sight between observer/target pairs.
+
+    Sample i of a pair lies at ratio i / num_samples (i = 1..num_samples-1)
+    of the sight line, in the cell TerrainAnalyzer._check_line_of_sight
+    reads, so each pair gets the same answer as that scalar walk.
+
+    Args:
+        elevation: 2D elevation array in meters
+        obs_rows, obs_cols, obs_elevation: Observer cells and elevations (incl. height)
+        tgt_rows, tgt_cols, tgt_elevation: Target cells and elevations (incl. height)
+        num_samples: Number of samples per sight line (scalar or one per pair)
+
+    Returns:
+        Boolean array, True where line of sight is clear
+    """
+    arrays = np.broadcast_arrays(
+        np.asarray(obs_rows), np.asarray(obs_cols), np.asarray(obs_elevation),
+        np.asarray(tgt_rows), np.asarray(tgt_cols), np.asarray(tgt_elevation),
+        np.asarray(num_samples),
+    )
+    shape = arrays[0].shape
+    obs_rows, obs_cols, obs_elevation, tgt_rows, tgt_cols, tgt_elevation, num_samples = (
+        array.ravel() for array in arrays
+    )
+
+    if num_samples.size == 0 or num_samples.max() < 2:
+        return np.ones(shape, dtype=bool)
+
+    steps = np.arange(1, num_samples.max())
+    valid = steps < num_samples[:, None]
+    ratios = np.where(valid, steps / num_samples[:, None], 0.0)
+
+    blocked = valid & _above_sight_line(
+        elevation, obs_rows, obs_cols, obs_elevation, tgt_rows, tgt_cols, tgt_elevation, ratios
+    )
+
+    return ~blocked.any(axis=1).reshape(shape)
+
+
+def _above_sight_line(
+    elevation: np.ndarray,
+    obs_rows: np.ndarray, obs_cols: np.ndarray, obs_elevation: np.ndarray,
+    tgt_rows: np.ndarray, tgt_cols: np.ndarray, tgt_elevation: np.ndarray,
+    ratios: np.ndarray,
+) -> np.ndarray:
+    """Check terrain against the sight line at per-pair ratios (num_pairs, num_ratios)."""
+    sample_rows = (obs_rows[:, None] + (tgt_rows - obs_rows)[:, None] * ratios).astype(int)
+    sample_cols = (obs_cols[:, None] + (tgt_cols - obs_cols)[:, None] * ratios).astype(int)
+
+    sight_line = obs_elevation[:, None] + (tgt_elevation - obs_elevation)[:, None] * ratios
+
+    return elevation[sample_rows, sample_cols] > sight_line
+
+
+class HorizonMap:
+    """
+    Precomputed horizon distances per cell and azimuth sector.
+
+    For every cell, azimuth sector and distance band the map stores the
+    distance of the steepest terrain seen from an observer standing on the
+    cell, up to the band's outer distance. A query reads the sampled sight
+    line of line_of_sight only around the horizon distances of the two
+    sectors bracketing the target, and next to both ends: one sample above
+    the sight line proves the target hidden. Pairs no probe blocks take the
+    full walk, so is_visible always equals line_of_sight; the map only
+    changes how many samples are read.
+
+    num_sectors, num_bands and step_cells trade build time and memory
+    against the share of queries settled by probes.
+    """
+
+    def __init__(
+        self,
+        elevation: np.ndarray,
+        observer_height: float,
+        max_distance_km: float = VIEWSHED_MAX_DISTANCE_KM,
+        num_sectors: int = HORIZON_NUM_SECTORS,
+        num_bands: int = HORIZON_NUM_BANDS,
+        step_cells: int = HORIZON_STEP_CELLS,
+        cell_size_m: float = DEM_RESOLUTION_M,
+    ):
+        """
+        Build horizon map.
+
+        Args:
+            elevation: 2D elevation array in meters
+            observer_height: Observer height above ground the map is built for (m)
+            max_distance_km: Maximum horizon search distance (km)
+            num_sectors: Number of azimuth sectors
+            num_bands: Number of distance bands (geometrically spaced)
+            step_cells: Sampling stride along each sector direction (cells)
+            cell_size_m: Cell size in meters
+        """
+        self.elevation = elevation
+        self.observer_height = observer_height
+        self.num_sectors = num_sectors
+        self.step_cells = max(int(step_cells), 1)
+        self.cell_size_m = cell_size_m
+        self.height, self.width = elevation.shape
+
+        max_distance_cells = int(max_distance_km * 1000 / cell_size_m)
+        max_distance_cells = min(
+            max_distance_cells, int(np.hypot(self.height, self.width)), np.iinfo(np.uint16).max
+        )
+        max_distance_cells = max(max_distance_cells, 2)
+
+        self.band_edges = np.unique(
+            np.rint(np.geomspace(2, max_distance_cells, num_bands)).astype(int)
+        )
+
+        logger.info(
+            f"Building horizon map: {num_sectors} sectors, {len(self.band_edges)} bands, "
+            f"step {self.step_cells} cells..."
+        )
+
+        self.horizon_distances = self._build()
+
+        logger.info(f"Horizon map built ({self.horizon_distances.nbytes / 1e6:.1f} MB)")
+
+    def _build(self) -> np.ndarray:
+        """
+        Sweep every sector direction with shifted copies of the DEM.
+
+        Returns:
+            Array (num_sectors, num_bands, height, width) of horizon distances
+            in cells (0 where no terrain lies within the band)
+        """
+        shape = (self.num_sectors, len(self.band_edges), self.height, self.width)
+        horizon_distances = np.zeros(shape, dtype=np.uint16)
+
+        observer_elevation = self.elevation + self.observer_height
+        padded = np.full((self.height, self.width), -np.inf)
+
+        for sector in range(self.num_sectors):
+            azimuth = 2 * np.pi * sector / self.num_sectors
+            d_row, d_col = -np.cos(azimuth), np.sin(azimuth)
+
+            running = np.full((self.height, self.width), -np.inf)
+            running_distance = np.zeros((self.height, self.width))
+            band = 0
+
+            for step in range(self.step_cells, int(self.band_edges[-1]) + 1, self.step_cells):
+                while step > self.band_edges[band]:
+                    horizon_distances[sector, band] = np.rint(running_distance)
+                    band += 1
+
+                off_row = int(np.rint(step * d_row))
+                off_col = int(np.rint(step * d_col))
+
+                shifted = self._shift(padded, off_row, off_col)
+                distance_cells = np.hypot(off_row, off_col)
+
+                tangent = (shifted - observer_elevation) / distance_cells
+                steeper = tangent > running
+                running[steeper] = tangent[steeper]
+                running_distance[steeper] = distance_cells
+
+            horizon_distances[sector, band:] = np.rint(running_distance)
+
+        return horizon_distances
+
+    def _shift(self, out: np.ndarray, off_row: int, off_col: int) -> np.ndarray:
+        """Return elevation[row + off_row, col + off_col], -inf outside the raster."""
+        out.fill(-np.inf)
+
+        if abs(off_row) >= self.height or abs(off_col) >= self.width:
+            return out
+
+        src_rows = slice(max(off_row, 0), self.height + min(off_row, 0))
+        src_cols = slice(max(off_col, 0), self.width + min(off_col, 0))
+        dst_rows = slice(max(-off_row, 0), self.height + min(-off_row, 0))
+        dst_cols = slice(max(-off_col, 0), self.width + min(-off_col, 0))
+
+        out[dst_rows, dst_cols] = self.elevation[src_rows, src_cols]
+
+        return out
+
+    def matches(self, observer_height: Any) -> bool:
+        """Check whether the map was built for an observer height (or all heights of an array)."""
+        return bool(np.all(np.isclose(observer_height, self.observer_height)))
+
+    def probe_hidden(
+        self,
+        obs_rows: Any, obs_cols: Any,
+        tgt_rows: Any, tgt_cols: Any,
+        target_height: Any,
+        num_samples: Any = 50,
+    ) -> np.ndarray:
+        """
+        Read only the hinted samples of each sight line.
+
+        Args:
+            obs_rows, obs_cols: Observer cells
+            tgt_rows, tgt_cols: Target cells
+            target_height: Target height above ground (m)
+            num_samples: Samples per sight line of the line_of_sight walk
+
+        Returns:
+            Boolean array, True where a probed sample blocks the sight line
+            (the target is hidden); False means undecided
+        """
+        arrays = np.broadcast_arrays(
+            np.asarray(obs_rows), np.asarray(obs_cols),
+            np.asarray(tgt_rows), np.asarray(tgt_cols),
+            np.asarray(target_height), np.asarray(num_samples),
+        )
+        shape = arrays[0].shape
+        obs_rows, obs_cols, tgt_rows, tgt_cols, target_height, num_samples = (
+            array.ravel() for array in arrays
+        )
+
+        d_rows = tgt_rows - obs_rows
+        d_cols = tgt_cols - obs_cols
+        distance_cells = np.hypot(d_rows, d_cols)
+
+        azimuth = np.mod(np.arctan2(d_cols, -d_rows), 2 * np.pi)
+        sector_low = np.floor(azimuth / (2 * np.pi) * self.num_sectors).astype(int)
+        sector_low %= self.num_sectors
+        sector_high = (sector_low + 1) % self.num_sectors
+
+        # Horizons of the band reaching the target and of the last band closer than it
+        num_bands = len(self.band_edges)
+        band_outer = np.minimum(np.searchsorted(self.band_edges, distance_cells), num_bands - 1)
+        band_inner = np.searchsorted(self.band_edges, distance_cells - 1, side="right") - 1
+        band_inner = np.maximum(band_inner, 0)
+
+        probes = [np.full(len(num_samples), step) for step in range(1, _END_PROBES + 1)]
+        probes += [num_samples - step for step in range(1, _END_PROBES + 1)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            samples_per_cell = np.where(distance_cells > 0, num_samples / distance_cells, 0.0)
+
+        for sector in (sector_low, sector_high):
+            for band in (band_inner, band_outer):
+                hint = self.horizon_distances[sector, band, obs_rows, obs_cols]
+                center = np.rint(hint * samples_per_cell).astype(int)
+                probes += [center - 1, center, center + 1]
+
+        probes = np.clip(np.stack(probes, axis=1), 1, np.maximum(num_samples - 1, 1)[:, None])
+
+        blocked = _above_sight_line(
+            self.elevation,
+            obs_rows, obs_cols, self.elevation[obs_rows, obs_cols] + self.observer_height,
+            tgt_rows, tgt_cols, self.elevation[tgt_rows, tgt_cols] + target_height,
+            probes / np.maximum(num_samples, 2)[:, None],
+        )
+
+        hidden = blocked.any(axis=1) & (distance_cells > 0) & (num_samples >= 2)
+
+        return hidden.reshape(shape)
+
+    def is_visible(
+        self,
+        obs_rows: Any, obs_cols: Any,
+        tgt_rows: Any, tgt_cols: Any,
+        target_height: Any,
+        num_samples: Any = 50,
+        chunk_size: int = 4096,
+    ) -> np.ndarray:
+        """
+        Vectorized visibility test from observers to targets.
+
+        Args:
+            obs_rows, obs_cols: Observer cells
+            tgt_rows, tgt_cols: Target cells
+            target_height: Target height above ground (m)
+            num_samples: Samples per sight line of the line_of_sight walk
+            chunk_size: Undecided pairs walked per batch (bounds memory use)
+
+        Returns:
+            Boolean array, True where the line of sight is clear; equal to
+            line_of_sight with the same number of samples
+        """
+        arrays = np.broadcast_arrays(
+            np.asarray(obs_rows), np.asarray(obs_cols),
+            np.asarray(tgt_rows), np.asarray(tgt_cols),
+            np.asarray(target_height), np.asarray(num_samples),
+        )
+        shape = arrays[0].shape
+        obs_rows, obs_cols, tgt_rows, tgt_cols, target_height, num_samples = (
+            array.ravel() for array in arrays
+        )
+
+        visible = ~self.probe_hidden(
+            obs_rows, obs_cols, tgt_rows, tgt_cols, target_height, num_samples
+        )
+        undecided = np.flatnonzero(visible & ((tgt_rows != obs_rows) | (tgt_cols != obs_cols)))
+
+        for start in range(0, len(undecided), chunk_size):
+            batch = undecided[start:start + chunk_size]
+            visible[batch] = line_of_sight(
+                self.elevation,
+                obs_rows[batch], obs_cols[batch],
+                self.elevation[obs_rows[batch], obs_cols[batch]] + self.observer_height,
+                tgt_rows[batch], tgt_cols[batch],
+                self.elevation[tgt_rows[batch], tgt_cols[batch]] + target_height[batch],
+                num_samples[batch],
+            )
+
+        return visible.reshape(shape)
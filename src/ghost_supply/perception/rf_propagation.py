@@ -1,24 +1,127 @@
 """RF propagation modeling using simplified Longley-Rice model."""
 
 import math
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from loguru import logger
+from scipy.ndimage import distance_transform_edt, label
 
+from ghost_supply.perception.horizon import HorizonMap
+from ghost_supply.perception.viewshed import Window, assign_rays, march_rays
+from ghost_supply.utils.array_cache import ArrayCache, LRUArrayCache, array_fingerprint
 from ghost_supply.utils.constants import (
+    HORIZON_NUM_BANDS,
+    HORIZON_NUM_SECTORS,
+    HORIZON_STEP_CELLS,
+    RF_ADAPTIVE_BLOCK_CELLS,
+    RF_ADAPTIVE_TERRAIN_STD_M,
+    RF_ADAPTIVE_TOLERANCE_DB,
+    RF_ADAPTIVE_VALIDATION_CELLS,
+    RF_CHUNK_CELLS,
+    RF_COVERAGE_METHODS,
     RF_FREQUENCY_COMMS_MHZ,
     RF_FREQUENCY_DRONE_MHZ,
     RF_FRESNEL_CRITICAL,
     RF_FRESNEL_DEGRADED,
     RF_GOOD_SIGNAL_DBM,
     RF_JAMMING_THRESHOLD_DBM,
+    RF_JAMMING_TOLERANCE,
+    RF_LOS_CLEARANCE_M,
     RF_MIN_SIGNAL_DBM,
+    RF_PROFILE_SAMPLES,
     RF_RX_ANTENNA_HEIGHT_M,
+    RF_STATION_CACHE_MAX_MB,
+    RF_STORE_SCALE,
     RF_TX_ANTENNA_HEIGHT_M,
     RF_TX_POWER_DBM,
 )
-from ghost_supply.utils.geo import haversine_distance, latlon_to_meters
+from ghost_supply.utils.geo import haversine_distance, haversine_distances, latlon_to_meters
+from ghost_supply.utils.parallel import (
+    SharedArray,
+    attach_shared_array,
+    resolve_n_jobs,
+    shared_array,
+    split_chunks,
+)
+from ghost_supply.utils.raster import RasterGrid
+
+# (lat, lon, row, col) of a base station inside the raster
+Station = Tuple[float, float, int, int]
+# (row, col, frequency, tx power, tx height, rx height, method, range limited)
+StationKey = Tuple[int, int, float, float, float, float, str, bool]
+
+
+@dataclass
+class StationGeometry:
+    """Frequency-independent path terms of one station over a set of cells."""
+    rows: np.ndarray
+    cols: np.ndarray
+    distance_km: np.ndarray
+    obstruction: np.ndarray  # maximum terrain height above the direct path (m)
+    blocked: np.ndarray  # LOS blocked (with clearance margin)
+    irregularity: np.ndarray  # terrain irregularity loss (dB)
+
+
+@dataclass
+class RFShadowOverlay:
+    """Labelled RF shadow regions with their depth, ready to project on routes."""
+    mask: np.ndarray  # True where the signal is below the threshold
+    labels: np.ndarray  # region id per cell (0 = coverage)
+    region_sizes: np.ndarray  # cells per region id (index 0 = coverage)
+    depth_m: np.ndarray  # distance to the nearest covered cell (0 in coverage)
+    grid: RasterGrid
+
+    @property
+    def num_regions(self) -> int:
+        """Number of shadow regions."""
+        return len(self.region_sizes) - 1
+
+    def edge_fractions(
+        self,
+        path_lats: List[np.ndarray],
+        path_lons: List[np.ndarray],
+        spacing_m: float = 30.0,
+    ) -> np.ndarray:
+        """
+        Length-weighted fraction of each path lying in shadow.
+
+        Args:
+            path_lats, path_lons: Vertex coordinates of each path
+            spacing_m: Target distance between samples (m)
+
+        Returns:
+            Fraction (0-1) per path
+        """
+        return self.grid.sample_along_paths(
+            self.mask.astype(float), path_lats, path_lons, reduction="mean", spacing_m=spacing_m
+        )
+
+    def sample_depth(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Distance into shadow at many positions.
+
+        Args:
+            lats, lons: Coordinate arrays
+
+        Returns:
+            Depth in meters (0 in coverage or outside bounds)
+        """
+        return self.grid.sample(self.depth_m, lats, lons, fill=0.0)
+
+
+@dataclass
+class AdaptiveCoverage:
+    """Coverage map from coarse-to-fine refinement, with its error estimate."""
+    coverage_map: np.ndarray
+    refined_fraction: float  # cells evaluated at full resolution
+    mean_abs_error_db: float  # over validated interpolated cells
+    p95_abs_error_db: float
+    max_abs_error_db: float
+    threshold_mismatch_rate: float  # validated cells classified differently against a threshold
+    num_validation_cells: int
 
 
 class RFPropagationModel:
@@ -28,80 +131,1275 @@ class RFPropagationModel:
         self,
         elevation: np.ndarray,
         bounds: Dict[str, float],
-        resolution_m: float = 30.0
+        resolution_m: Optional[float] = None,
+        horizon_map: Optional[HorizonMap] = None,
+        transform: Optional[Any] = None,
+        cache_max_mb: float = RF_STATION_CACHE_MAX_MB,
+        cache_dir: Optional[str] = None,
     ):
         """
-        Initialize RF propagation model.
+        Initialize RF propagation model.
+
+        Args:
+            elevation: 2D elevation array in meters
+            bounds: Dict with north, south, east, west
+            resolution_m: DEM resolution in meters (longest cell side from the
+                transform or bounds if None)
+            horizon_map: Precomputed horizon map for is_shadowed queries (optional)
+            transform: Rasterio transform of the DEM (bounds are used if None)
+            cache_max_mb: Memory budget of the per-station coverage cache (MB)
+            cache_dir: Directory for the persistent coverage store (disabled if None)
+        """
+        self.elevation = elevation
+        self.bounds = bounds
+        self.transform = transform
+        self.height, self.width = elevation.shape
+        self.grid = RasterGrid(elevation.shape, bounds, transform)
+        self.resolution_m = (
+            resolution_m if resolution_m is not None else max(self.grid.cell_size_m())
+        )
+        self.horizon_map = horizon_map
+        self.station_cache = LRUArrayCache(int(cache_max_mb * 1e6))
+        self.coverage_store = ArrayCache(cache_dir, "rf_coverage") if cache_dir else None
+        self._dem_fingerprint: Optional[str] = None
+
+        logger.info(f"Initialized RFPropagationModel: {self.width}x{self.height} cells")
+
+    def calculate_coverage_map(
+        self,
+        base_stations: List[Tuple[float, float]],
+        frequency_mhz: float = RF_FREQUENCY_DRONE_MHZ,
+        tx_power_dbm: float = RF_TX_POWER_DBM,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
+        method: str = "vectorized",
+        n_jobs: int = 1,
+        range_limited: bool = False,
+    ) -> np.ndarray:
+        """
+        Calculate RF coverage map from base stations.
+
+        Per-station maps are kept in station_cache (and in coverage_store when
+        a cache directory is set), so stations already computed with the same
+        parameters are loaded instead of recomputed.
+
+        Args:
+            base_stations: List of (lat, lon) transmitter positions
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            method: "vectorized" (NumPy kernel over all cells of a station),
+                "radial" (ray marching with profile statistics shared along
+                each bearing) or "scalar" (per-cell reference implementation)
+            n_jobs: Worker processes for uncached stations (-1 = all cores).
+                Workers read the DEM from shared memory and return one map per
+                station; the maximum is taken in the parent.
+            range_limited: Evaluate each station only inside the window of its
+                maximum useful range (free space loss alone reaching
+                RF_MIN_SIGNAL_DBM); cells outside stay at -200 dBm
+
+        Returns:
+            2D array of received signal strength in dBm
+        """
+        if method not in RF_COVERAGE_METHODS:
+            raise ValueError(
+                f"Unknown coverage method '{method}', expected one of {RF_COVERAGE_METHODS}"
+            )
+
+        n_jobs = resolve_n_jobs(n_jobs)
+
+        logger.info(
+            f"Calculating RF coverage for {len(base_stations)} base stations "
+            f"at {frequency_mhz} MHz ({method})..."
+        )
+
+        coverage_map = np.full((self.height, self.width), -200.0)
+        pending: Dict[StationKey, Station] = {}
+
+        for bs_lat, bs_lon in base_stations:
+            bs_row, bs_col = self._latlon_to_rowcol(bs_lat, bs_lon)
+
+            if not (0 <= bs_row < self.height and 0 <= bs_col < self.width):
+                logger.warning(f"Base station ({bs_lat}, {bs_lon}) outside bounds")
+                continue
+
+            key = self._station_key(
+                bs_row, bs_col, frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m,
+                method, range_limited,
+            )
+            station_map = self._get_cached_station(key)
+
+            if station_map is None:
+                pending[key] = (bs_lat, bs_lon, bs_row, bs_col)
+                continue
+
+            np.maximum(coverage_map, station_map, out=coverage_map)
+
+        if n_jobs > 1 and len(pending) > 1:
+            station_maps = self._calculate_stations_parallel(
+                list(pending.values()), frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m,
+                method, range_limited, n_jobs,
+            )
+        else:
+            station_maps = [
+                self._calculate_station(
+                    station, frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m,
+                    method, range_limited,
+                )
+                for station in pending.values()
+            ]
+
+        for key, station_map in zip(pending, station_maps):
+            self.station_cache.put(key, station_map)
+
+            if self.coverage_store is not None:
+                self.coverage_store.save(self._store_key(key), quantize_dbm(station_map))
+
+            np.maximum(coverage_map, station_map, out=coverage_map)
+
+        logger.info(
+            f"Coverage calculated: {(coverage_map > RF_MIN_SIGNAL_DBM).sum()} cells with signal"
+        )
+
+        return coverage_map
+
+    def calculate_coverage_stack(
+        self,
+        base_stations: List[Tuple[float, float]],
+        frequencies_mhz: List[float],
+        tx_power_dbm: float = RF_TX_POWER_DBM,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
+        method: str = "vectorized",
+        range_limited: bool = False,
+    ) -> np.ndarray:
+        """
+        Calculate RF coverage maps at several frequencies in one geometric pass.
+
+        Distance, LOS, obstruction height and terrain irregularity do not
+        depend on frequency: they are computed once per station (once per
+        band window for radial range-limited stacks, whose rays depend on the
+        window radius), and only free space and diffraction losses are
+        evaluated per band. Each band
+        equals calculate_coverage_map at that frequency and shares its
+        per-station caches.
+
+        Args:
+            base_stations: List of (lat, lon) transmitter positions
+            frequencies_mhz: Frequencies in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            method: "vectorized" or "radial" ("scalar" computes each band separately)
+            range_limited: Evaluate each band inside its own useful range window
+
+        Returns:
+            Array (num_frequencies, height, width) of received signal strength in dBm
+        """
+        if method not in RF_COVERAGE_METHODS:
+            raise ValueError(
+                f"Unknown coverage method '{method}', expected one of {RF_COVERAGE_METHODS}"
+            )
+
+        if method == "scalar":
+            return np.stack([
+                self.calculate_coverage_map(
+                    base_stations, frequency, tx_power_dbm, tx_height_m, rx_height_m,
+                    method=method, range_limited=range_limited,
+                )
+                for frequency in frequencies_mhz
+            ])
+
+        logger.info(
+            f"Calculating RF coverage stack for {len(base_stations)} base stations "
+            f"at {list(frequencies_mhz)} MHz ({method})..."
+        )
+
+        stack = np.full((len(frequencies_mhz), self.height, self.width), -200.0)
+
+        for bs_lat, bs_lon in base_stations:
+            bs_row, bs_col = self._latlon_to_rowcol(bs_lat, bs_lon)
+
+            if not (0 <= bs_row < self.height and 0 <= bs_col < self.width):
+                logger.warning(f"Base station ({bs_lat}, {bs_lon}) outside bounds")
+                continue
+
+            keys = [
+                self._station_key(
+                    bs_row, bs_col, frequency, tx_power_dbm, tx_height_m, rx_height_m,
+                    method, range_limited,
+                )
+                for frequency in frequencies_mhz
+            ]
+            station_maps = [self._get_cached_station(key) for key in keys]
+            missing = [
+                band for band, station_map in enumerate(station_maps) if station_map is None
+            ]
+
+            windows: Dict[int, Optional[Window]] = {
+                band: self._station_window(
+                    bs_row, bs_col, self.max_range_km(frequencies_mhz[band], tx_power_dbm)
+                ) if range_limited else None
+                for band in missing
+            }
+
+            for bands, window in self._geometry_windows(windows, method):
+                if method == "radial":
+                    geometry = self._station_geometry_radial(
+                        bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, window
+                    )
+                else:
+                    geometry = self._station_geometry(
+                        bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, window=window
+                    )
+
+                for band in bands:
+                    station_map = self._geometry_signal(
+                        geometry, frequencies_mhz[band], tx_power_dbm
+                    )
+
+                    if range_limited:
+                        rows, cols = windows[band]
+                        band_map = np.full_like(station_map, -200.0)
+                        band_map[rows, cols] = station_map[rows, cols]
+                        station_map = band_map
+
+                    self.station_cache.put(keys[band], station_map)
+
+                    if self.coverage_store is not None:
+                        self.coverage_store.save(
+                            self._store_key(keys[band]), quantize_dbm(station_map)
+                        )
+
+                    station_maps[band] = station_map
+
+            for band, station_map in enumerate(station_maps):
+                np.maximum(stack[band], station_map, out=stack[band])
+
+        return stack
+
+
+    @staticmethod
+    def _geometry_windows(
+        windows: Dict[int, Optional[Window]], method: str
+    ) -> List[Tuple[List[int], Optional[Window]]]:
+        """
+        Group bands that can share one geometry pass.
+
+        Vectorized geometry is evaluated per cell, so the widest band window
+        (lowest frequency; the windows are nested around the station) serves
+        every band. Radial ray marching depends on the window radius, so
+        radial bands only share a pass when their windows are equal, which
+        keeps each band identical to calculate_coverage_map.
+
+        Args:
+            windows: Evaluation window per band (None = whole raster)
+            method: "vectorized" or "radial"
+
+        Returns:
+            List of (bands, window) geometry passes
+        """
+        if not windows:
+            return []
+
+        if method != "radial":
+            if any(window is None for window in windows.values()):
+                return [(list(windows), None)]
+
+            widest = max(
+                windows.values(),
+                key=lambda window: (window[0].stop - window[0].start)
+                * (window[1].stop - window[1].start),
+            )
+            return [(list(windows), widest)]
+
+        groups: Dict[Any, Tuple[List[int], Optional[Window]]] = {}
+        for band, window in windows.items():
+            bounds = None if window is None else (
+                window[0].start, window[0].stop, window[1].start, window[1].stop
+            )
+            groups.setdefault(bounds, ([], window))[0].append(band)
+
+        return list(groups.values())
+
+    def calculate_coverage_adaptive(
+        self,
+        base_stations: List[Tuple[float, float]],
+        frequency_mhz: float = RF_FREQUENCY_DRONE_MHZ,
+        tx_power_dbm: float = RF_TX_POWER_DBM,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
+        thresholds_dbm: Tuple[float, ...] = (RF_MIN_SIGNAL_DBM, RF_JAMMING_THRESHOLD_DBM),
+        tolerance_db: float = RF_ADAPTIVE_TOLERANCE_DB,
+        block_cells: int = RF_ADAPTIVE_BLOCK_CELLS,
+        terrain_std_m: float = RF_ADAPTIVE_TERRAIN_STD_M,
+        validation_cells: int = RF_ADAPTIVE_VALIDATION_CELLS,
+        seed: int = 0,
+    ) -> AdaptiveCoverage:
+        """
+        Calculate RF coverage coarse-to-fine, refining only where it matters.
+
+        Each station is first evaluated at the corners of blocks of
+        block_cells x block_cells cells and bilinearly interpolated. Blocks are
+        then evaluated at full resolution (same model as the "vectorized"
+        method) when their corner signals come within tolerance_db of a
+        threshold, when their terrain standard deviation exceeds terrain_std_m,
+        or when they surround the station. A random sample of the remaining
+        interpolated cells is evaluated exactly to estimate the error.
+
+        Args:
+            base_stations: List of (lat, lon) transmitter positions
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            thresholds_dbm: Signal levels whose crossings must be exact
+            tolerance_db: Margin around the thresholds (larger = more blocks
+                refined: more accurate, slower)
+            block_cells: Coarse grid spacing in cells
+            terrain_std_m: Terrain standard deviation above which a block is refined
+            validation_cells: Interpolated cells per station checked at full resolution
+            seed: Random seed of the validation sample
+
+        Returns:
+            AdaptiveCoverage with the map and its error estimate
+        """
+        if block_cells < 2:
+            raise ValueError(f"block_cells must be at least 2, got {block_cells}")
+
+        logger.info(
+            f"Calculating adaptive RF coverage for {len(base_stations)} base stations "
+            f"at {frequency_mhz} MHz..."
+        )
+
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.unique(
+            np.append(np.arange(0, self.height - 1, block_cells), self.height - 1)
+        )
+        sample_cols = np.unique(
+            np.append(np.arange(0, self.width - 1, block_cells), self.width - 1)
+        )
+
+        rough = self._rough_blocks(sample_rows[:-1], sample_cols[:-1], terrain_std_m)
+
+        coverage_map = np.full((self.height, self.width), -200.0)
+        refined = np.zeros((self.height, self.width), dtype=bool)
+        errors: List[np.ndarray] = []
+        mismatches: List[np.ndarray] = []
+
+        for bs_lat, bs_lon in base_stations:
+            bs_row, bs_col = self._latlon_to_rowcol(bs_lat, bs_lon)
+
+            if not (0 <= bs_row < self.height and 0 <= bs_col < self.width):
+                logger.warning(f"Base station ({bs_lat}, {bs_lon}) outside bounds")
+                continue
+
+            # Coarse pass on block corners, bilinear interpolation in between
+            coarse_rows, coarse_cols = np.meshgrid(sample_rows, sample_cols, indexing="ij")
+            coarse = self._cells_signal(
+                bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m,
+                coarse_rows.ravel(), coarse_cols.ravel(), frequency_mhz, tx_power_dbm,
+            ).reshape(coarse_rows.shape)
+
+            station_map = self._interpolate_coarse(coarse, sample_rows, sample_cols)
+
+            # Blocks to refine: near a threshold, rough terrain, or around the station
+            corners = np.stack([coarse[:-1, :-1], coarse[1:, :-1], coarse[:-1, 1:], coarse[1:, 1:]])
+            low, high = corners.min(axis=0) - tolerance_db, corners.max(axis=0) + tolerance_db
+
+            flagged = rough.copy()
+            for threshold in thresholds_dbm:
+                flagged |= (low <= threshold) & (threshold <= high)
+
+            station_block_row = np.searchsorted(sample_rows[:-1], bs_row, side="right") - 1
+            station_block_col = np.searchsorted(sample_cols[:-1], bs_col, side="right") - 1
+            flagged[
+                max(station_block_row - 1, 0):station_block_row + 2,
+                max(station_block_col - 1, 0):station_block_col + 2,
+            ] = True
+
+            station_refined = flagged[
+                np.searchsorted(sample_rows[:-1], np.arange(self.height), side="right") - 1
+            ][:, np.searchsorted(sample_cols[:-1], np.arange(self.width), side="right") - 1]
+
+            rows, cols = np.nonzero(station_refined)
+            station_map[rows, cols] = self._cells_signal(
+                bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m,
+                rows, cols, frequency_mhz, tx_power_dbm,
+            )
+
+            # Error estimate on interpolated cells
+            rows, cols = np.nonzero(~station_refined)
+            if len(rows) > 0 and validation_cells > 0:
+                pick = rng.choice(len(rows), size=min(validation_cells, len(rows)), replace=False)
+                rows, cols = rows[pick], cols[pick]
+
+                exact = self._cells_signal(
+                    bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m,
+                    rows, cols, frequency_mhz, tx_power_dbm,
+                )
+                errors.append(np.abs(station_map[rows, cols] - exact))
+                mismatches.append(np.any(
+                    [(station_map[rows, cols] > t) != (exact > t) for t in thresholds_dbm], axis=0
+                ))
+
+                station_map[rows, cols] = exact
+
+            refined |= station_refined
+            np.maximum(coverage_map, station_map, out=coverage_map)
+
+        error = np.concatenate(errors) if errors else np.zeros(0)
+        mismatch = np.concatenate(mismatches) if mismatches else np.zeros(0, dtype=bool)
+
+        result = AdaptiveCoverage(
+            coverage_map=coverage_map,
+            refined_fraction=float(refined.mean()),
+            mean_abs_error_db=float(error.mean()) if len(error) else 0.0,
+            p95_abs_error_db=float(np.percentile(error, 95)) if len(error) else 0.0,
+            max_abs_error_db=float(error.max()) if len(error) else 0.0,
+            threshold_mismatch_rate=float(mismatch.mean()) if len(mismatch) else 0.0,
+            num_validation_cells=len(error),
+        )
+
+        logger.info(
+            f"Adaptive coverage: {result.refined_fraction:.0%} cells refined, "
+            f"mean error {result.mean_abs_error_db:.2f} dB (p95 {result.p95_abs_error_db:.2f} dB)"
+        )
+
+        return result
+
+    def _cells_signal(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        tx_height_m: float, rx_height_m: float,
+        rows: np.ndarray, cols: np.ndarray,
+        frequency_mhz: float, tx_power_dbm: float,
+    ) -> np.ndarray:
+        """
+        Signal of one station at arbitrary cells (same model as "vectorized").
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            rows, cols: Receiver cells
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+
+        Returns:
+            Signal strengths in dBm aligned with the cells
+        """
+        geometry = self._cells_geometry(
+            bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, rows, cols
+        )
+        path_loss = self._combine_losses(
+            geometry.distance_km, geometry.obstruction, geometry.blocked, geometry.irregularity,
+            frequency_mhz,
+        )
+
+        return np.where(geometry.distance_km < 0.01, tx_power_dbm, tx_power_dbm - path_loss)
+
+    def _rough_blocks(
+        self, row_starts: np.ndarray, col_starts: np.ndarray, terrain_std_m: float
+    ) -> np.ndarray:
+        """
+        Flag blocks whose terrain standard deviation exceeds a limit.
+
+        Args:
+            row_starts, col_starts: First row/col of each block (the last block
+                runs to the edge)
+            terrain_std_m: Standard deviation limit (m)
+
+        Returns:
+            Boolean array (num_row_blocks, num_col_blocks)
+        """
+        elevation = self.elevation.astype(float)
+
+        def block_sums(values: np.ndarray) -> np.ndarray:
+            return np.add.reduceat(np.add.reduceat(values, row_starts, axis=0), col_starts, axis=1)
+
+        counts = block_sums(np.ones_like(elevation))
+        mean = block_sums(elevation) / counts
+        variance = np.maximum(block_sums(elevation ** 2) / counts - mean ** 2, 0.0)
+
+        return np.sqrt(variance) > terrain_std_m
+
+    def _interpolate_coarse(
+        self, coarse: np.ndarray, sample_rows: np.ndarray, sample_cols: np.ndarray
+    ) -> np.ndarray:
+        """
+        Bilinear interpolation of values known on a coarse grid of cells.
+
+        Args:
+            coarse: Values at (sample_rows x sample_cols)
+            sample_rows, sample_cols: Increasing cell indices spanning the raster
+
+        Returns:
+            2D array with the raster's shape
+        """
+        all_rows = np.arange(self.height)
+        all_cols = np.arange(self.width)
+
+        along_cols = np.stack([np.interp(all_cols, sample_cols, values) for values in coarse])
+
+        return np.stack(
+            [np.interp(all_rows, sample_rows, values) for values in along_cols.T], axis=1
+        )
+
+    def _station_key(
+        self,
+        bs_row: int, bs_col: int,
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        method: str,
+        range_limited: bool,
+    ) -> StationKey:
+        """Build the cache key identifying one station's coverage map."""
+        return (
+            int(bs_row), int(bs_col),
+            float(frequency_mhz), float(tx_power_dbm), float(tx_height_m), float(rx_height_m),
+            method, bool(range_limited),
+        )
+
+    def _store_key(self, key: StationKey) -> str:
+        """Build the persistent store key: DEM content hash and geometry plus station parameters."""
+        if self._dem_fingerprint is None:
+            self._dem_fingerprint = array_fingerprint(self.elevation)
+
+        geometry = (self.grid.a, self.grid.b, self.grid.c, self.grid.d, self.grid.e, self.grid.f)
+
+        return ArrayCache.make_key(self._dem_fingerprint, geometry, "int16", *key)
+
+    def _get_cached_station(self, key: StationKey) -> Optional[np.ndarray]:
+        """
+        Look up a station map in memory, then in the persistent store.
+
+        Args:
+            key: Station key
+
+        Returns:
+            Cached signal map in dBm or None
+        """
+        station_map = self.station_cache.get(key)
+
+        if station_map is None and self.coverage_store is not None:
+            stored = self.coverage_store.load(self._store_key(key))
+
+            if stored is not None:
+                station_map = dequantize_dbm(stored)
+                self.station_cache.put(key, station_map)
+
+        return station_map
+
+    def max_range_km(
+        self,
+        frequency_mhz: float,
+        tx_power_dbm: float,
+        min_signal_dbm: float = RF_MIN_SIGNAL_DBM,
+    ) -> float:
+        """
+        Maximum useful range of a transmitter from its link budget.
+
+        Free space loss is a lower bound of the path loss (diffraction and
+        irregularity only add to it), so no cell beyond this distance can
+        receive more than min_signal_dbm.
+
+        Args:
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            min_signal_dbm: Weakest useful signal in dBm
+
+        Returns:
+            Range in kilometers
+        """
+        budget_db = tx_power_dbm - min_signal_dbm - 32.45 - 20 * math.log10(frequency_mhz)
+
+        return 10 ** (budget_db / 20)
+
+    def _station_window(self, bs_row: int, bs_col: int, range_km: float) -> Window:
+        """
+        Bounding window of the cells within range of a station.
+
+        Args:
+            bs_row, bs_col: Station cell
+            range_km: Radius in kilometers
+
+        Returns:
+            (row slice, col slice) clipped to the raster
+        """
+        cell_height_m, cell_width_m = self.grid.cell_size_m()
+
+        # +1 cell: distances are measured to cell corners
+        radius_rows = int(math.ceil(range_km * 1000 / cell_height_m)) + 1
+        radius_cols = int(math.ceil(range_km * 1000 / cell_width_m)) + 1
+
+        return (
+            slice(max(bs_row - radius_rows, 0), min(bs_row + radius_rows + 1, self.height)),
+            slice(max(bs_col - radius_cols, 0), min(bs_col + radius_cols + 1, self.width)),
+        )
+
+    def _window_cells(self, window: Optional[Window]) -> Tuple[Window, np.ndarray, np.ndarray]:
+        """
+        Flat row/col indices of the cells of a window (whole raster if None).
+
+        Returns:
+            Tuple of (window, rows, cols)
+        """
+        if window is None:
+            window = (slice(0, self.height), slice(0, self.width))
+
+        rows, cols = np.meshgrid(
+            np.arange(window[0].start, window[0].stop),
+            np.arange(window[1].start, window[1].stop),
+            indexing="ij",
+        )
+
+        return window, rows.ravel(), cols.ravel()
+
+    def _calculate_station(
+        self,
+        station: Station,
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        method: str,
+        range_limited: bool = False,
+        window: Optional[Window] = None,
+    ) -> np.ndarray:
+        """
+        Signal map of one station with the selected kernel.
+
+        Args:
+            station: (lat, lon, row, col) of the station
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            method: Coverage method (see calculate_coverage_map)
+            range_limited: Restrict evaluation to the station's useful range window
+            window: Explicit window to evaluate (overrides range_limited)
+
+        Returns:
+            2D array of received signal strength in dBm
+        """
+        if window is None and range_limited:
+            window = self._station_window(
+                station[2], station[3], self.max_range_km(frequency_mhz, tx_power_dbm)
+            )
+
+        if method == "radial":
+            kernel = self._station_coverage_radial
+        elif method == "vectorized":
+            kernel = self._station_coverage
+        else:
+            kernel = self._station_coverage_scalar
+
+        return kernel(
+            *station, frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m, window=window
+        )
+
+    def _calculate_stations_parallel(
+        self,
+        stations: List[Station],
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        method: str,
+        range_limited: bool,
+        n_jobs: int,
+    ) -> List[np.ndarray]:
+        """
+        Compute station maps across a process pool.
+
+        Args:
+            stations: Stations to compute
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            method: Coverage method
+            range_limited: Restrict evaluation to each station's range window
+            n_jobs: Number of worker processes
+
+        Returns:
+            Station maps in the order of stations
+        """
+        indexed = list(enumerate(stations))
+        chunks = split_chunks(indexed, n_jobs)
+
+        logger.info(f"Distributing {len(stations)} stations across {len(chunks)} workers")
+
+        station_maps: List[Optional[np.ndarray]] = [None] * len(stations)
+
+        with shared_array(np.ascontiguousarray(self.elevation)) as elevation_handle:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(
+                        station_coverage_worker, elevation_handle,
+                        self.bounds, self.resolution_m, self.transform,
+                        [station for _, station in chunk],
+                        frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m,
+                        method, range_limited,
+                    )
+                    for chunk in chunks
+                ]
+
+                for chunk, future in zip(chunks, futures):
+                    for (index, _), station_map in zip(chunk, future.result()):
+                        station_maps[index] = station_map
+
+        return station_maps
+
+    def _station_coverage_scalar(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        window: Optional[Window] = None,
+    ) -> np.ndarray:
+        """
+        Signal map of one station, one cell at a time (reference implementation).
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            window: Cells to evaluate (whole raster if None; others stay at -200 dBm)
+
+        Returns:
+            2D array of received signal strength in dBm
+        """
+        station_map = np.full((self.height, self.width), -200.0)
+
+        bs_elevation = self.elevation[bs_row, bs_col] + tx_height_m
+
+        if window is None:
+            window = (slice(0, self.height), slice(0, self.width))
+
+        for row in range(window[0].start, window[0].stop):
+            for col in range(window[1].start, window[1].stop):
+                rx_lat, rx_lon = self._rowcol_to_latlon(row, col)
+                distance_km = haversine_distance(bs_lat, bs_lon, rx_lat, rx_lon)
+
+                if distance_km < 0.01:
+                    signal_dbm = tx_power_dbm
+                else:
+                    rx_elevation = self.elevation[row, col] + rx_height_m
+
+                    path_loss = self._calculate_path_loss(
+                        bs_row, bs_col, bs_elevation,
+                        row, col, rx_elevation,
+                        distance_km, frequency_mhz
+                    )
+
+                    signal_dbm = tx_power_dbm - path_loss
+
+                station_map[row, col] = signal_dbm
+
+        return station_map
+
+    def _station_coverage(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        chunk_size: int = RF_CHUNK_CELLS,
+        window: Optional[Window] = None,
+    ) -> np.ndarray:
+        """
+        Signal map of one station for all cells at once.
+
+        Cells are processed in chunks through _path_geometry, so every
+        terrain profile is extracted once and reduced with array operations.
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            chunk_size: Cells processed per batch (bounds memory use)
+            window: Cells to evaluate (whole raster if None; others stay at -200 dBm)
+
+        Returns:
+            2D array of received signal strength in dBm
+        """
+        geometry = self._station_geometry(
+            bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, chunk_size, window
+        )
+
+        return self._geometry_signal(geometry, frequency_mhz, tx_power_dbm)
+
+    def _station_geometry(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        tx_height_m: float, rx_height_m: float,
+        chunk_size: int = RF_CHUNK_CELLS,
+        window: Optional[Window] = None,
+    ) -> "StationGeometry":
+        """
+        Frequency-independent path terms of one station (vectorized kernel).
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            chunk_size: Cells processed per batch (bounds memory use)
+            window: Cells to evaluate (whole raster if None)
+
+        Returns:
+            StationGeometry of the evaluated cells
+        """
+        _, rows, cols = self._window_cells(window)
+
+        return self._cells_geometry(
+            bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, rows, cols, chunk_size
+        )
+
+    def _cells_geometry(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        tx_height_m: float, rx_height_m: float,
+        rows: np.ndarray, cols: np.ndarray,
+        chunk_size: int = RF_CHUNK_CELLS,
+    ) -> "StationGeometry":
+        """
+        Frequency-independent path terms of one station for arbitrary cells.
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            rows, cols: Receiver cells
+            chunk_size: Cells processed per batch (bounds memory use)
+
+        Returns:
+            StationGeometry of the cells
+        """
+        obstruction = np.empty(len(rows))
+        blocked = np.empty(len(rows), dtype=bool)
+        irregularity = np.empty(len(rows))
+
+        tx_elevation = self.elevation[bs_row, bs_col] + tx_height_m
+
+        for start in range(0, len(rows), chunk_size):
+            batch = slice(start, start + chunk_size)
+            rx_rows, rx_cols = rows[batch], cols[batch]
+
+            obstruction[batch], blocked[batch], irregularity[batch] = self._path_geometry(
+                bs_row, bs_col, tx_elevation,
+                rx_rows, rx_cols, self.elevation[rx_rows, rx_cols] + rx_height_m,
+            )
+
+        rx_lats, rx_lons = self.grid.xy(rows, cols, offset="ul")
+        distance_km = haversine_distances(bs_lat, bs_lon, rx_lats, rx_lons)
+
+        return StationGeometry(rows, cols, distance_km, obstruction, blocked, irregularity)
+
+    def _station_coverage_radial(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        frequency_mhz: float, tx_power_dbm: float, tx_height_m: float, rx_height_m: float,
+        window: Optional[Window] = None,
+    ) -> np.ndarray:
+        """
+        Signal map of one station by radial ray marching.
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            window: Cells to evaluate (whole raster if None; others stay at -200 dBm)
+
+        Returns:
+            2D array of received signal strength in dBm
+        """
+        geometry = self._station_geometry_radial(
+            bs_lat, bs_lon, bs_row, bs_col, tx_height_m, rx_height_m, window
+        )
+
+        return self._geometry_signal(geometry, frequency_mhz, tx_power_dbm)
+
+    def _station_geometry_radial(
+        self,
+        bs_lat: float, bs_lon: float, bs_row: int, bs_col: int,
+        tx_height_m: float, rx_height_m: float,
+        window: Optional[Window] = None,
+    ) -> "StationGeometry":
+        """
+        Frequency-independent path terms of one station by radial ray marching.
+
+        Rays are cast from the station to every cell of the bounding ring and
+        profile statistics are accumulated once along each ray: the running
+        maximum clearance slope (LOS), the running dominant obstacle
+        (knife-edge diffraction) and cumulative sums of elevation and its
+        square (terrain irregularity). Every cell then reads the statistics of
+        the ray through it up to the previous step, so the cost is O(cells)
+        instead of O(cells x samples).
+
+        Args:
+            bs_lat, bs_lon: Station position
+            bs_row, bs_col: Station cell
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            window: Cells to evaluate (whole raster if None)
+
+        Returns:
+            StationGeometry of the evaluated cells
+        """
+        (row_slice, col_slice), rows, cols = self._window_cells(window)
+        radius = max(
+            bs_row - row_slice.start, row_slice.stop - 1 - bs_row,
+            bs_col - col_slice.start, col_slice.stop - 1 - bs_col,
+            1,
+        )
+
+        tx_ground = self.elevation[bs_row, bs_col]
+        tx_elevation = tx_ground + tx_height_m
+
+        terrain, ray_distance, valid = march_rays(self.elevation, bs_row, bs_col, radius)
+        num_rays = terrain.shape[0]
+
+        # LOS: running max of clearance slopes; diffraction: index of the dominant edge
+        clearance_slopes = np.where(
+            valid, (terrain + RF_LOS_CLEARANCE_M - tx_elevation) / ray_distance, -np.inf
+        )
+        horizon = np.maximum.accumulate(clearance_slopes, axis=1)
+
+        slopes = np.where(valid, (terrain - tx_elevation) / ray_distance, -np.inf)
+        steps = np.broadcast_to(np.arange(radius), slopes.shape)
+        edge_step = np.maximum.accumulate(
+            np.where(slopes >= np.maximum.accumulate(slopes, axis=1), steps, 0), axis=1
+        )
+
+        # Irregularity: cumulative moments including the station cell
+        profile = np.concatenate([np.full((num_rays, 1), tx_ground), terrain], axis=1)
+        cum_sum = np.cumsum(profile, axis=1)
+        cum_sq = np.cumsum(profile ** 2, axis=1)
+
+        d_rows, d_cols = rows - bs_row, cols - bs_col
+        same_cell = (d_rows == 0) & (d_cols == 0)
+
+        rays, ray_steps = assign_rays(
+            np.where(same_cell, 1, d_rows), np.where(same_cell, 0, d_cols), radius
+        )
+        before = ray_steps - 2  # column of the ray sample one step before the cell
+        has_before = before >= 0
+        before = np.maximum(before, 0)
+
+        rx_elevation = self.elevation[rows, cols] + rx_height_m
+        cell_distance = np.hypot(d_rows, d_cols)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            target_slope = (rx_elevation - tx_elevation) / cell_distance
+
+        blocked = has_before & (horizon[rays, before] > target_slope) & ~same_cell
+
+        edge = edge_step[rays, before]
+        edge_distance = ray_distance[rays, edge]
+        los_at_edge = tx_elevation + (
+            edge_distance / np.maximum(cell_distance, 1e-9) * (rx_elevation - tx_elevation)
+        )
+        obstruction = np.where(has_before, np.maximum(terrain[rays, edge] - los_at_edge, 0.0), 0.0)
+
+        count = ray_steps + 1
+        mean = cum_sum[rays, ray_steps] / count
+        variance = np.maximum(cum_sq[rays, ray_steps] / count - mean ** 2, 0.0)
+        irregularity = np.minimum(np.sqrt(variance) / 10.0, 15.0)
+
+        rx_lats, rx_lons = self.grid.xy(rows, cols, offset="ul")
+        distance_km = haversine_distances(bs_lat, bs_lon, rx_lats, rx_lons)
+
+        return StationGeometry(rows, cols, distance_km, obstruction, blocked, irregularity)
+
+    def _geometry_signal(
+        self, geometry: "StationGeometry", frequency_mhz: float, tx_power_dbm: float
+    ) -> np.ndarray:
+        """
+        Signal map from precomputed station geometry at one frequency.
+
+        Args:
+            geometry: Output of _station_geometry or _station_geometry_radial
+            frequency_mhz: Frequency in MHz
+            tx_power_dbm: Transmit power in dBm
+
+        Returns:
+            2D array of received signal strength in dBm (-200 outside the evaluated cells)
+        """
+        path_loss = self._combine_losses(
+            geometry.distance_km, geometry.obstruction, geometry.blocked, geometry.irregularity,
+            frequency_mhz,
+        )
+
+        station_map = np.full((self.height, self.width), -200.0)
+        station_map[geometry.rows, geometry.cols] = np.where(
+            geometry.distance_km < 0.01, tx_power_dbm, tx_power_dbm - path_loss
+        )
+
+        return station_map
+
+    def _combine_losses(
+        self,
+        distance_km: np.ndarray,
+        obstruction: np.ndarray,
+        blocked: np.ndarray,
+        irregularity: np.ndarray,
+        frequency_mhz: float,
+    ) -> np.ndarray:
+        """Path loss from geometric terms: free space + diffraction (if blocked) + irregularity."""
+        diffraction = np.where(blocked, self._diffraction_losses(obstruction, frequency_mhz), 0.0)
+
+        return self._free_space_losses(distance_km, frequency_mhz) + diffraction + irregularity
+
+    def path_loss(
+        self,
+        tx_points: Any,
+        rx_points: Any,
+        frequency_mhz: float = RF_FREQUENCY_DRONE_MHZ,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
+        chunk_size: int = RF_CHUNK_CELLS,
+    ) -> np.ndarray:
+        """
+        Path loss between arbitrary transmitter/receiver pairs.
+
+        Same model as the coverage maps, evaluated only for the given pairs
+        (batched, one profile extraction per pair).
 
         Args:
-            elevation: 2D elevation array in meters
-            bounds: Dict with north, south, east, west
-            resolution_m: DEM resolution in meters
+            tx_points: (lat, lon) transmitter positions, one per pair (or a single one)
+            rx_points: (lat, lon) receiver positions, one per pair (or a single one)
+            frequency_mhz: Frequency in MHz
+            tx_height_m: Transmitter antenna height in meters
+            rx_height_m: Receiver antenna height in meters
+            chunk_size: Pairs processed per batch (bounds memory use)
+
+        Returns:
+            Path losses in dB (0 within 10 m, inf where a point is outside the raster)
         """
-        self.elevation = elevation
-        self.bounds = bounds
-        self.resolution_m = resolution_m
-        self.height, self.width = elevation.shape
+        tx = np.asarray(tx_points, dtype=float).reshape(-1, 2)
+        rx = np.asarray(rx_points, dtype=float).reshape(-1, 2)
 
-        logger.info(f"Initialized RFPropagationModel: {self.width}x{self.height} cells")
+        tx_lats, rx_lats = np.broadcast_arrays(tx[:, 0], rx[:, 0])
+        tx_lons, rx_lons = np.broadcast_arrays(tx[:, 1], rx[:, 1])
 
-    def calculate_coverage_map(
+        tx_rows, tx_cols = self.grid.rowcol(tx_lats, tx_lons)
+        rx_rows, rx_cols = self.grid.rowcol(rx_lats, rx_lons)
+
+        distance_km = haversine_distances(tx_lats, tx_lons, rx_lats, rx_lons)
+        loss = np.full(distance_km.shape, np.inf)
+
+        valid = np.flatnonzero(
+            self.grid.contains(tx_rows, tx_cols) & self.grid.contains(rx_rows, rx_cols)
+        )
+
+        for start in range(0, len(valid), chunk_size):
+            batch = valid[start:start + chunk_size]
+
+            obstruction, blocked, irregularity = self._path_geometry(
+                tx_rows[batch], tx_cols[batch],
+                self.elevation[tx_rows[batch], tx_cols[batch]] + tx_height_m,
+                rx_rows[batch], rx_cols[batch],
+                self.elevation[rx_rows[batch], rx_cols[batch]] + rx_height_m,
+            )
+
+            loss[batch] = self._combine_losses(
+                distance_km[batch], obstruction, blocked, irregularity, frequency_mhz
+            )
+
+        return np.where(distance_km < 0.01, 0.0, loss)
+
+    def signal_at_points(
         self,
         base_stations: List[Tuple[float, float]],
+        lats: Any,
+        lons: Any,
         frequency_mhz: float = RF_FREQUENCY_DRONE_MHZ,
         tx_power_dbm: float = RF_TX_POWER_DBM,
         tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
         rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
     ) -> np.ndarray:
         """
-        Calculate RF coverage map from base stations.
+        Best-server signal at arbitrary points without computing a coverage raster.
 
         Args:
             base_stations: List of (lat, lon) transmitter positions
+            lats, lons: Receiver coordinates
             frequency_mhz: Frequency in MHz
             tx_power_dbm: Transmit power in dBm
             tx_height_m: Transmitter antenna height in meters
             rx_height_m: Receiver antenna height in meters
 
         Returns:
-            2D array of received signal strength in dBm
+            Strongest signal over stations in dBm (-200 without any usable station)
         """
-        logger.info(f"Calculating RF coverage for {len(base_stations)} base stations at {frequency_mhz} MHz...")
+        lats = np.atleast_1d(np.asarray(lats, dtype=float))
+        lons = np.atleast_1d(np.asarray(lons, dtype=float))
+        points = np.column_stack([lats.ravel(), lons.ravel()])
 
-        coverage_map = np.full((self.height, self.width), -200.0)
+        if len(base_stations) == 0 or len(points) == 0:
+            return np.full(lats.shape, -200.0)
 
-        for bs_lat, bs_lon in base_stations:
-            bs_row, bs_col = self._latlon_to_rowcol(bs_lat, bs_lon)
+        stations = np.asarray(base_stations, dtype=float).reshape(-1, 2)
 
-            if not (0 <= bs_row < self.height and 0 <= bs_col < self.width):
-                logger.warning(f"Base station ({bs_lat}, {bs_lon}) outside bounds")
-                continue
+        loss = self.path_loss(
+            np.repeat(stations, len(points), axis=0), np.tile(points, (len(stations), 1)),
+            frequency_mhz, tx_height_m, rx_height_m,
+        ).reshape(len(stations), len(points))
 
-            bs_elevation = self.elevation[bs_row, bs_col] + tx_height_m
+        signal = np.where(np.isfinite(loss), tx_power_dbm - loss, -200.0).max(axis=0)
 
-            for row in range(self.height):
-                for col in range(self.width):
-                    rx_lat, rx_lon = self._rowcol_to_latlon(row, col)
-                    distance_km = haversine_distance(bs_lat, bs_lon, rx_lat, rx_lon)
+        return signal.reshape(lats.shape)
 
-                    if distance_km < 0.01:
-                        signal_dbm = tx_power_dbm
-                    else:
-                        rx_elevation = self.elevation[row, col] + rx_height_m
+    def _free_space_losses(self, distance_km: np.ndarray, frequency_mhz: float) -> np.ndarray:
+        """Vectorized _free_space_loss."""
+        distance_km = np.maximum(distance_km, 0.001)
 
-                        path_loss = self._calculate_path_loss(
-                            bs_row, bs_col, bs_elevation,
-                            row, col, rx_elevation,
-                            distance_km, frequency_mhz
-                        )
+        return 32.45 + 20 * np.log10(frequency_mhz) + 20 * np.log10(distance_km)
+
+    def extract_profiles(
+        self,
+        tx_row: Any, tx_col: Any,
+        rx_rows: np.ndarray, rx_cols: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Sample the terrain profiles of many paths in a single pass.
+
+        Sample k lies at ratio k / (RF_PROFILE_SAMPLES - 1) of the path, so the
+        grid contains both the 50-step LOS/diffraction samples and the 20-step
+        irregularity samples of the scalar helpers.
+
+        Args:
+            tx_row, tx_col: Transmitter cell (scalars, or one per path)
+            rx_rows, rx_cols: Receiver cells
 
-                        signal_dbm = tx_power_dbm - path_loss
+        Returns:
+            Array (num_paths, RF_PROFILE_SAMPLES) of terrain elevations
+        """
+        ratios = np.arange(RF_PROFILE_SAMPLES) / (RF_PROFILE_SAMPLES - 1)
 
-                    coverage_map[row, col] = max(coverage_map[row, col], signal_dbm)
+        rx_rows = np.atleast_1d(rx_rows)
+        rx_cols = np.atleast_1d(rx_cols)
+        tx_rows = np.broadcast_to(tx_row, rx_rows.shape)
+        tx_cols = np.broadcast_to(tx_col, rx_cols.shape)
 
-        logger.info(f"Coverage calculated: {(coverage_map > RF_MIN_SIGNAL_DBM).sum()} cells with signal")
+        sample_rows = (tx_rows[:, None] + (rx_rows - tx_rows)[:, None] * ratios).astype(int)
+        sample_cols = (tx_cols[:, None] + (rx_cols - tx_cols)[:, None] * ratios).astype(int)
 
-        return coverage_map
+        return self.elevation[sample_rows, sample_cols]
+
+    def _path_geometry(
+        self,
+        tx_row: Any, tx_col: Any, tx_elevation: Any,
+        rx_rows: np.ndarray, rx_cols: np.ndarray, rx_elevation: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Frequency-independent terms of many paths from one transmitter.
+
+        Each profile is extracted once; LOS, knife-edge obstruction and
+        terrain irregularity are reductions over the profile array.
+
+        Args:
+            tx_row, tx_col, tx_elevation: Transmitter position and elevation (scalars or per path)
+            rx_rows, rx_cols, rx_elevation: Receiver positions and elevations
+
+        Returns:
+            Tuple of (max_obstruction_m, blocked, irregularity_db) arrays
+        """
+        rx_rows = np.atleast_1d(rx_rows)
+        rx_cols = np.atleast_1d(rx_cols)
+        rx_elevation = np.atleast_1d(rx_elevation)
+
+        profiles = self.extract_profiles(tx_row, tx_col, rx_rows, rx_cols)
+
+        obstruction, blocked = self._profile_obstruction(
+            profiles, tx_row, tx_col, tx_elevation, rx_rows, rx_cols, rx_elevation
+        )
+
+        return obstruction, blocked, self._terrain_irregularity_factors(profiles)
+
+    def _profile_obstruction(
+        self,
+        profiles: np.ndarray,
+        tx_row: int, tx_col: int, tx_elev: float,
+        rx_rows: np.ndarray, rx_cols: np.ndarray, rx_elev: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce profiles to LOS blockage and maximum obstruction.
+
+        Uses the samples of _check_line_of_sight and
+        _knife_edge_diffraction_loss (ratios i / 50, i = 1..49).
+
+        Args:
+            profiles: Output of extract_profiles
+            tx_row, tx_col, tx_elev: Transmitter position and elevation (scalars or per path)
+            rx_rows, rx_cols, rx_elev: Receiver positions and elevations
+
+        Returns:
+            Tuple of (max_obstruction_m >= 0, blocked) arrays; blocked applies
+            the LOS clearance margin
+        """
+        step = (RF_PROFILE_SAMPLES - 1) // 50
+        ratios = np.arange(step, RF_PROFILE_SAMPLES - 1, step) / (RF_PROFILE_SAMPLES - 1)
+
+        tx_elev = np.broadcast_to(tx_elev, rx_elev.shape)
+        los_elevation = tx_elev[:, None] + (rx_elev - tx_elev)[:, None] * ratios
+        excess = profiles[:, step:RF_PROFILE_SAMPLES - 1:step] - los_elevation
+
+        same_cell = (rx_rows == tx_row) & (rx_cols == tx_col)
+        blocked = np.any(excess > -RF_LOS_CLEARANCE_M, axis=1) & ~same_cell
+
+        return np.maximum(excess.max(axis=1), 0.0), blocked
+
+    def _diffraction_losses(self, obstruction_m: np.ndarray, frequency_mhz: float) -> np.ndarray:
+        """
+        Vectorized knife-edge diffraction loss from the maximum obstruction.
+
+        Args:
+            obstruction_m: Maximum terrain height above the direct path (m)
+            frequency_mhz: Frequency in MHz
+
+        Returns:
+            Diffraction loss in dB (0 where unobstructed)
+        """
+        wavelength_m = 299.792458 / frequency_mhz
+
+        v = obstruction_m * np.sqrt(2 / wavelength_m)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loss = np.select(
+                [v < -1, v < 0, v < 1, v < 2.4],
+                [
+                    np.zeros_like(v),
+                    20 * np.log10(0.5 - 0.62 * v),
+                    20 * np.log10(0.5 * np.exp(-0.95 * v)),
+                    20 * np.log10(0.4 - np.sqrt(np.abs(0.1184 - (0.38 - 0.1 * v)**2))),
+                ],
+                default=20 * np.log10(0.225 / np.maximum(v, 2.4)),
+            )
+
+        return np.where(obstruction_m > 0, np.maximum(loss, 0.0), 0.0)
+
+    def _terrain_irregularity_factors(self, profiles: np.ndarray) -> np.ndarray:
+        """
+        Reduce profiles to terrain irregularity loss.
+
+        Uses the samples of _terrain_irregularity_factor (ratios i / 20).
+
+        Args:
+            profiles: Output of extract_profiles
+
+        Returns:
+            Additional loss in dB
+        """
+        std_dev = profiles[:, ::(RF_PROFILE_SAMPLES - 1) // 20].std(axis=1)
+
+        return np.minimum(std_dev / 10.0, 15.0)
 
     def _calculate_path_loss(
         self,
@@ -113,6 +1411,10 @@ class RFPropagationModel:
         """
         Calculate path loss using simplified Longley-Rice model.
 
+        Scalar reference for path_loss and the coverage kernels, built from
+        the per-effect helpers one sample at a time. LOS always walks the
+        profile, even when a horizon map is loaded.
+
         Args:
             tx_row, tx_col, tx_elevation: Transmitter position and elevation
             rx_row, rx_col, rx_elevation: Receiver position and elevation
@@ -164,6 +1466,91 @@ class RFPropagationModel:
 
         return loss_db
 
+    def build_horizon_map(
+        self,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        num_sectors: int = HORIZON_NUM_SECTORS,
+        num_bands: int = HORIZON_NUM_BANDS,
+        step_cells: int = HORIZON_STEP_CELLS,
+    ) -> HorizonMap:
+        """
+        Precompute a horizon map for transmitters at a given antenna height.
+
+        The LOS clearance margin is folded into the observer height, so the map
+        answers the same question as _check_line_of_sight. It only speeds up
+        is_shadowed; coverage maps and path losses read the LOS from the
+        profiles they extract anyway.
+
+        Args:
+            tx_height_m: Transmitter antenna height (m)
+            num_sectors: Azimuth sectors (more = more queries settled by probes, slower build)
+            num_bands: Distance bands (more = more queries settled by probes, more memory)
+            step_cells: Sampling stride in cells (larger = faster build, weaker probes)
+
+        Returns:
+            HorizonMap instance (also stored on self.horizon_map)
+        """
+        max_distance_km = np.hypot(self.height, self.width) * self.resolution_m / 1000
+
+        self.horizon_map = HorizonMap(
+            self.elevation, tx_height_m - RF_LOS_CLEARANCE_M, max_distance_km,
+            num_sectors=num_sectors, num_bands=num_bands, step_cells=step_cells,
+            cell_size_m=self.resolution_m,
+        )
+
+        return self.horizon_map
+
+    def is_shadowed(
+        self,
+        tx_lat: float, tx_lon: float,
+        rx_lat: float, rx_lon: float,
+        tx_height_m: float = RF_TX_ANTENNA_HEIGHT_M,
+        rx_height_m: float = RF_RX_ANTENNA_HEIGHT_M,
+    ) -> bool:
+        """
+        Check whether a receiver is terrain-shadowed from a transmitter.
+
+        Args:
+            tx_lat, tx_lon: Transmitter position
+            rx_lat, rx_lon: Receiver position
+            tx_height_m: Transmitter antenna height (m)
+            rx_height_m: Receiver antenna height (m)
+
+        Returns:
+            True if the terrain blocks line of sight (or a point is outside the area)
+        """
+        tx_row, tx_col = self._latlon_to_rowcol(tx_lat, tx_lon)
+        rx_row, rx_col = self._latlon_to_rowcol(rx_lat, rx_lon)
+
+        for row, col in ((tx_row, tx_col), (rx_row, rx_col)):
+            if not (0 <= row < self.height and 0 <= col < self.width):
+                return True
+
+        return not self._line_of_sight_clear(
+            tx_row, tx_col, self.elevation[tx_row, tx_col] + tx_height_m,
+            rx_row, rx_col, self.elevation[rx_row, rx_col] + rx_height_m,
+        )
+
+    def _line_of_sight_clear(
+        self,
+        tx_row: int, tx_col: int, tx_elev: float,
+        rx_row: int, rx_col: int, rx_elev: float,
+    ) -> bool:
+        """
+        Check LOS with the horizon map when it matches the transmitter height.
+
+        The map probes return the same answer as the profile walk in
+        _check_line_of_sight, which is used otherwise.
+        """
+        if self.horizon_map is not None:
+            tx_height = tx_elev - self.elevation[tx_row, tx_col] - RF_LOS_CLEARANCE_M
+
+            if self.horizon_map.matches(tx_height):
+                rx_height = rx_elev - self.elevation[rx_row, rx_col] - RF_LOS_CLEARANCE_M
+                return bool(self.horizon_map.is_visible(tx_row, tx_col, rx_row, rx_col, rx_height))
+
+        return self._check_line_of_sight(tx_row, tx_col, tx_elev, rx_row, rx_col, rx_elev)
+
     def _check_line_of_sight(
         self,
         tx_row: int, tx_col: int, tx_elev: float,
@@ -197,7 +1584,7 @@ class RFPropagationModel:
 
             terrain_elev = self.elevation[sample_row, sample_col]
 
-            if terrain_elev > los_elev - 5:
+            if terrain_elev > los_elev - RF_LOS_CLEARANCE_M:
                 return False
 
         return True
@@ -310,11 +1697,85 @@ class RFPropagationModel:
 
         return shadow_zones
 
+    def analyze_shadow_zones(
+        self,
+        coverage_map: np.ndarray,
+        min_signal_dbm: float = RF_MIN_SIGNAL_DBM,
+        min_region_cells: int = 1,
+    ) -> RFShadowOverlay:
+        """
+        Label RF shadow regions and measure how deep each cell lies in shadow.
+
+        Regions are 8-connected components of the cells below min_signal_dbm;
+        the depth is the Euclidean distance to the nearest covered cell.
+
+        Args:
+            coverage_map: RF coverage map in dBm
+            min_signal_dbm: Signal below which a cell is in shadow
+            min_region_cells: Regions smaller than this are treated as coverage
+
+        Returns:
+            RFShadowOverlay
+        """
+        mask = coverage_map < min_signal_dbm
+        labels, num_regions = label(mask, structure=np.ones((3, 3), dtype=bool))
+        region_sizes = np.bincount(labels.ravel(), minlength=num_regions + 1)
+
+        if min_region_cells > 1:
+            keep = region_sizes >= min_region_cells
+            keep[0] = False
+
+            mask = keep[labels]
+            labels, num_regions = label(mask, structure=np.ones((3, 3), dtype=bool))
+            region_sizes = np.bincount(labels.ravel(), minlength=num_regions + 1)
+
+        depth_m = distance_transform_edt(mask, sampling=self.grid.cell_size_m())
+
+        logger.info(
+            f"Identified {num_regions} shadow regions "
+            f"({mask.sum()} cells, max depth {depth_m.max():.0f} m)"
+        )
+
+        return RFShadowOverlay(mask, labels, region_sizes, depth_m, self.grid)
+
+    def create_jamming_picture(
+        self,
+        coverage_map: np.ndarray,
+        jammer_power_dbm: float = 40.0,
+        tolerance: float = RF_JAMMING_TOLERANCE,
+        method: str = "vectorized",
+    ) -> "JammingPicture":
+        """
+        Create an empty jamming picture for incremental jammer updates.
+
+        Args:
+            coverage_map: Friendly RF coverage in dBm
+            jammer_power_dbm: Jammer transmit power
+            tolerance: Vulnerability change below which a cell is left out of
+                a jammer's footprint
+            method: Coverage method for jammer footprints
+
+        Returns:
+            JammingPicture whose vulnerability matches
+            calculate_jamming_vulnerability for the jammers added, to within
+            tolerance (plus the int16 storage step)
+        """
+        if not 0.0 < tolerance < 0.5:
+            raise ValueError(f"tolerance must be in (0, 0.5), got {tolerance}")
+
+        if method not in RF_COVERAGE_METHODS:
+            raise ValueError(
+                f"Unknown coverage method '{method}', expected one of {RF_COVERAGE_METHODS}"
+            )
+
+        return JammingPicture(self, coverage_map, jammer_power_dbm, tolerance, method)
+
     def calculate_jamming_vulnerability(
         self,
         coverage_map: np.ndarray,
         jammer_positions: List[Tuple[float, float]],
-        jammer_power_dbm: float = 40.0
+        jammer_power_dbm: float = 40.0,
+        n_jobs: int = 1,
     ) -> np.ndarray:
         """
         Calculate vulnerability to jamming.
@@ -323,6 +1784,7 @@ class RFPropagationModel:
             coverage_map: Friendly RF coverage in dBm
             jammer_positions: Enemy jammer positions
             jammer_power_dbm: Jammer transmit power
+            n_jobs: Worker processes for the jammer coverage (-1 = all cores)
 
         Returns:
             Vulnerability map (0-1, higher = more vulnerable)
@@ -335,6 +1797,7 @@ class RFPropagationModel:
             tx_power_dbm=jammer_power_dbm,
             tx_height_m=10.0,
             rx_height_m=RF_RX_ANTENNA_HEIGHT_M,
+            n_jobs=n_jobs,
         )
 
         signal_to_jammer_ratio = coverage_map - jammer_coverage
@@ -354,29 +1817,310 @@ class RFPropagationModel:
         Returns:
             Signal strength in dBm
         """
-        row, col = self._latlon_to_rowcol(lat, lon)
+        return float(self.sample_signal(lat, lon, coverage_map))
 
-        if 0 <= row < self.height and 0 <= col < self.width:
-            return float(coverage_map[row, col])
+    def sample_signal(
+        self, lats: np.ndarray, lons: np.ndarray, coverage_map: np.ndarray, method: str = "nearest"
+    ) -> np.ndarray:
+        """
+        Sample signal strength at many positions.
+
+        Args:
+            lats, lons: Coordinate arrays
+            coverage_map: Coverage map
+            method: "nearest" or "bilinear"
 
-        return -200.0
+        Returns:
+            Signal strengths in dBm (-200 outside bounds)
+        """
+        return self.grid.sample(coverage_map, lats, lons, method=method, fill=-200.0)
 
     def _latlon_to_rowcol(self, lat: float, lon: float) -> Tuple[int, int]:
         """Convert lat/lon to array indices."""
-        x = (lon - self.bounds["west"]) / (self.bounds["east"] - self.bounds["west"])
-        y = (self.bounds["north"] - lat) / (self.bounds["north"] - self.bounds["south"])
-
-        col = int(x * self.width)
-        row = int(y * self.height)
+        row, col = self.grid.rowcol(lat, lon)
 
-        return row, col
+        return int(row), int(col)
 
     def _rowcol_to_latlon(self, row: int, col: int) -> Tuple[float, float]:
-        """Convert array indices to lat/lon."""
-        x = col / self.width
-        y = row / self.height
+        """Convert array indices to lat/lon (upper-left corner of the cell)."""
+        lat, lon = self.grid.xy(row, col, offset="ul")
+
+        return float(lat), float(lon)
+
+
+class JammingPicture:
+    """
+    Jamming vulnerability maintained incrementally as jammers change.
+
+    Keeps each jammer's signal over its footprint and the running maximum
+    jammer signal, so adding or removing one jammer only touches that
+    jammer's footprint (plus the overlapping layers when removing).
+
+    A jammer at J dBm raises the vulnerability of a cell with friendly signal
+    S by at most 1 / (1 + exp((S - J) / 10)), so the footprint is cut to the
+    cells where J >= S - margin_db, margin_db being the SJR at which that
+    bound equals the tolerance. Footprints are stored cropped to their
+    bounding window as int16 (quantize_dbm).
+    """
+
+    def __init__(
+        self,
+        model: RFPropagationModel,
+        coverage_map: np.ndarray,
+        jammer_power_dbm: float,
+        tolerance: float,
+        method: str,
+    ):
+        """
+        Initialize an empty jamming picture.
+
+        Args:
+            model: RF model computing jammer footprints
+            coverage_map: Friendly RF coverage in dBm
+            jammer_power_dbm: Jammer transmit power
+            tolerance: Vulnerability change below which a cell is left out of
+                a jammer's footprint
+            method: Coverage method for jammer footprints
+        """
+        self.model = model
+        self.coverage_map = coverage_map
+        self.jammer_power_dbm = jammer_power_dbm
+        self.method = method
+
+        self.margin_db = 10.0 * math.log((1.0 - tolerance) / tolerance)
+
+        # Free-space reach down to the lowest cutoff on the raster
+        self.range_km = model.max_range_km(
+            RF_FREQUENCY_DRONE_MHZ, jammer_power_dbm, float(coverage_map.min()) - self.margin_db
+        )
+
+        self.jammer_map = np.full(coverage_map.shape, -200.0)
+        self.vulnerability = self._vulnerability((slice(None), slice(None)))
+        self.layers: Dict[int, Tuple[slice, slice, np.ndarray]] = {}
+        self.positions: Dict[int, Tuple[float, float]] = {}
+
+        self._next_id = 0
+        self._dirty: Optional[Window] = None
+
+    @property
+    def num_jammers(self) -> int:
+        """Number of jammers in the picture."""
+        return len(self.layers)
+
+    def add_jammer(self, lat: float, lon: float) -> int:
+        """
+        Add a jammer and raise the jammer map over its footprint.
+
+        Args:
+            lat, lon: Jammer position
+
+        Returns:
+            Jammer id used by remove_jammer
+        """
+        row, col = self.model._latlon_to_rowcol(lat, lon)
+
+        if not self.model.grid.contains(row, col):
+            raise ValueError(f"Jammer position ({lat}, {lon}) outside bounds")
+
+        # Free space loss bounds the path loss from below: only evaluate the
+        # cells the jammer could reach above their cutoff without terrain
+        window, cell_rows, cell_cols = self.model._window_cells(
+            self.model._station_window(row, col, self.range_km)
+        )
+        rx_lats, rx_lons = self.model.grid.xy(cell_rows, cell_cols, offset="ul")
+        free_space_dbm = self.jammer_power_dbm - self.model._free_space_losses(
+            haversine_distances(lat, lon, rx_lats, rx_lons), RF_FREQUENCY_DRONE_MHZ
+        )
+        cutoff = self._cutoff(window)
+        window = self._crop(window, free_space_dbm.reshape(cutoff.shape) >= cutoff)
+
+        if window is not None:
+            station_map = self.model._calculate_station(
+                (lat, lon, row, col), RF_FREQUENCY_DRONE_MHZ, self.jammer_power_dbm,
+                10.0, RF_RX_ANTENNA_HEIGHT_M, self.method, window=window,
+            )
+            window = self._crop(window, station_map[window] >= self._cutoff(window))
+
+        if window is None:
+            rows, cols = slice(row, row), slice(col, col)
+            layer = np.empty((0, 0), dtype=np.int16)
+        else:
+            rows, cols = window
+            signal = station_map[rows, cols]
+            layer = quantize_dbm(np.where(signal >= self._cutoff(window), signal, -200.0))
+
+            np.maximum(
+                self.jammer_map[rows, cols], dequantize_dbm(layer),
+                out=self.jammer_map[rows, cols],
+            )
+            self._update(rows, cols)
+
+        jammer_id = self._next_id
+        self._next_id += 1
+
+        self.layers[jammer_id] = (rows, cols, layer)
+        self.positions[jammer_id] = (lat, lon)
+
+        return jammer_id
+
+    def remove_jammer(self, jammer_id: int) -> None:
+        """
+        Remove a jammer and rebuild the jammer map over its footprint.
+
+        Args:
+            jammer_id: Id returned by add_jammer
+        """
+        if jammer_id not in self.layers:
+            raise ValueError(f"Unknown jammer id {jammer_id}")
+
+        rows, cols, _ = self.layers.pop(jammer_id)
+        del self.positions[jammer_id]
+
+        self.jammer_map[rows, cols] = -200.0
+
+        for other_rows, other_cols, layer in self.layers.values():
+            overlap_rows = slice(max(rows.start, other_rows.start), min(rows.stop, other_rows.stop))
+            overlap_cols = slice(max(cols.start, other_cols.start), min(cols.stop, other_cols.stop))
+
+            if overlap_rows.start >= overlap_rows.stop or overlap_cols.start >= overlap_cols.stop:
+                continue
+
+            other = layer[
+                overlap_rows.start - other_rows.start:overlap_rows.stop - other_rows.start,
+                overlap_cols.start - other_cols.start:overlap_cols.stop - other_cols.start,
+            ]
+            np.maximum(
+                self.jammer_map[overlap_rows, overlap_cols], dequantize_dbm(other),
+                out=self.jammer_map[overlap_rows, overlap_cols],
+            )
+
+        self._update(rows, cols)
+
+    def pop_dirty(self) -> Optional[Window]:
+        """
+        Return the window changed since the last call and reset it.
+
+        Returns:
+            (row_slice, col_slice) bounding all changed cells, or None
+        """
+        dirty, self._dirty = self._dirty, None
+
+        return dirty
+
+    def _cutoff(self, window: Window) -> np.ndarray:
+        """Jammer signal below which a cell's vulnerability moves by less than tolerance."""
+        return self.coverage_map[window] - self.margin_db
+
+    @staticmethod
+    def _crop(window: Window, mask: np.ndarray) -> Optional[Window]:
+        """Bounding window of the True cells of a mask laid over window (None if empty)."""
+        hit_rows = np.flatnonzero(mask.any(axis=1))
+
+        if len(hit_rows) == 0:
+            return None
+
+        hit_cols = np.flatnonzero(mask.any(axis=0))
+        rows, cols = window
+
+        return (
+            slice(rows.start + int(hit_rows[0]), rows.start + int(hit_rows[-1]) + 1),
+            slice(cols.start + int(hit_cols[0]), cols.start + int(hit_cols[-1]) + 1),
+        )
+
+    def _vulnerability(self, window: Window) -> np.ndarray:
+        """Vulnerability (0-1) over a window, as calculate_jamming_vulnerability."""
+        signal_to_jammer_ratio = self.coverage_map[window] - self.jammer_map[window]
+
+        return 1.0 / (1.0 + np.exp(signal_to_jammer_ratio / 10.0))
+
+    def _update(self, rows: slice, cols: slice) -> None:
+        """Refresh vulnerability over a footprint and grow the dirty window."""
+        if rows.start >= rows.stop or cols.start >= cols.stop:
+            return
+
+        self.vulnerability[rows, cols] = self._vulnerability((rows, cols))
+
+        if self._dirty is None:
+            self._dirty = (rows, cols)
+            return
+
+        dirty_rows, dirty_cols = self._dirty
+        self._dirty = (
+            slice(min(dirty_rows.start, rows.start), max(dirty_rows.stop, rows.stop)),
+            slice(min(dirty_cols.start, cols.start), max(dirty_cols.stop, cols.stop)),
+        )
+
+
+def station_coverage_worker(
+    elevation_handle: SharedArray,
+    bounds: Dict[str, float],
+    resolution_m: float,
+    transform: Optional[Any],
+    stations: List[Station],
+    frequency_mhz: float,
+    tx_power_dbm: float,
+    tx_height_m: float,
+    rx_height_m: float,
+    method: str,
+    range_limited: bool = False,
+) -> List[np.ndarray]:
+    """
+    Compute the coverage maps of a chunk of stations inside a worker process.
+
+    The elevation raster is read from shared memory rather than pickled.
+
+    Args:
+        elevation_handle: Shared elevation array handle
+        bounds: Dict with north, south, east, west
+        resolution_m: DEM resolution in meters
+        transform: Rasterio transform of the DEM (optional)
+        stations: List of (lat, lon, row, col) stations
+        frequency_mhz: Frequency in MHz
+        tx_power_dbm: Transmit power in dBm
+        tx_height_m: Transmitter antenna height in meters
+        rx_height_m: Receiver antenna height in meters
+        method: Coverage method
+        range_limited: Restrict evaluation to each station's range window
+
+    Returns:
+        One signal map (dBm) per station
+    """
+    model = RFPropagationModel(
+        attach_shared_array(elevation_handle), bounds, resolution_m,
+        transform=transform, cache_max_mb=0,
+    )
+
+    return [
+        model._calculate_station(
+            station, frequency_mhz, tx_power_dbm, tx_height_m, rx_height_m, method, range_limited
+        )
+        for station in stations
+    ]
+
+
+def quantize_dbm(signal_dbm: np.ndarray) -> np.ndarray:
+    """
+    Quantize a signal map to int16 in steps of 1 / RF_STORE_SCALE dB.
+
+    Args:
+        signal_dbm: Signal map in dBm
+
+    Returns:
+        int16 array (4x smaller than float64)
+    """
+    limit = np.iinfo(np.int16).max / RF_STORE_SCALE
+
+    return np.round(np.clip(signal_dbm, -limit, limit) * RF_STORE_SCALE).astype(np.int16)
+
+
+def dequantize_dbm(quantized: np.ndarray) -> np.ndarray:
+    """
+    Restore a signal map stored by quantize_dbm.
 
-        lon = self.bounds["west"] + x * (self.bounds["east"] - self.bounds["west"])
-        lat = self.bounds["north"] - y * (self.bounds["north"] - self.bounds["south"])
+    Args:
+        quantized: int16 array
 
-        return lat, lon
+    Returns:
+        Signal map in dBm (float)
+    """
+    return quantized.astype(float) / RF_STORE_SCALE
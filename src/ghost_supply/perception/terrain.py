@@ -1,8 +1,10 @@
 """Terrain analysis module for visibility and mobility calculations."""
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+
 try:
     import richdem as rd
     HAS_RICHDEM = True
@@ -11,26 +13,52 @@ except ImportError:
 from loguru import logger
 from scipy.ndimage import distance_transform_edt
 
+from ghost_supply.perception.horizon import HorizonMap, line_of_sight
+from ghost_supply.perception.viewshed import (
+    CompositeViewshed,
+    composite_viewshed_worker,
+    pack_layer,
+    sweep_viewshed,
+    unpack_layer,
+)
+from ghost_supply.utils.array_cache import ArrayCache, LRUArrayCache, array_fingerprint
 from ghost_supply.utils.constants import (
-    DEM_RESOLUTION_M,
+    EDGE_SLOPE_REDUCTIONS,
+    HORIZON_NUM_BANDS,
+    HORIZON_NUM_SECTORS,
+    HORIZON_STEP_CELLS,
     SLOPE_PENALTY,
+    SLOPE_PENALTY_BINS_PCT,
     SPEED_OFFROAD_DRY,
     SPEED_PATH_DRY,
     SPEED_PRIMARY_DRY,
     SPEED_SECONDARY_DRY,
     SPEED_TERTIARY_DRY,
     SPEED_TRACK_DRY,
+    VIEWSHED_CACHE_MAX_MB,
     VIEWSHED_MAX_DISTANCE_KM,
+    VIEWSHED_METHODS,
     VIEWSHED_OBSERVER_HEIGHT_M,
     VIEWSHED_TARGET_HEIGHT_M,
 )
 from ghost_supply.utils.geo import haversine_distance, latlon_to_meters
+from ghost_supply.utils.parallel import resolve_n_jobs, shared_array, split_chunks
+from ghost_supply.utils.raster import RasterGrid
+
+ViewshedKey = Tuple[int, int, float, float, float, str]
 
 
 class TerrainAnalyzer:
     """Analyzes terrain for tactical route planning."""
 
-    def __init__(self, elevation: np.ndarray, transform: any, bounds: Dict[str, float]):
+    def __init__(
+        self,
+        elevation: np.ndarray,
+        transform: any,
+        bounds: Dict[str, float],
+        cache_dir: Optional[str] = None,
+        cache_max_mb: float = VIEWSHED_CACHE_MAX_MB,
+    ):
         """
         Initialize terrain analyzer.
 
@@ -38,14 +66,26 @@ class TerrainAnalyzer:
             elevation: 2D array of elevation values in meters
             transform: Rasterio transform object
             bounds: Dict with north, south, east, west bounds
+            cache_dir: Directory for the persistent viewshed store (disabled if None)
+            cache_max_mb: Memory budget of the in-memory viewshed cache (MB)
         """
         self.elevation = elevation
         self.transform = transform
         self.bounds = bounds
         self.height, self.width = elevation.shape
+        self.grid = RasterGrid(elevation.shape, bounds, transform)
+
+        # Cell size from the transform (30 m × decimation for a decimated DEM);
+        # distances in cells use the longest side so they never reach past
+        # the requested distance
+        self.cell_height_m, self.cell_width_m = self.grid.cell_size_m()
+        self.resolution_m = max(self.cell_height_m, self.cell_width_m)
 
         self.slope_array: Optional[np.ndarray] = None
-        self.viewshed_cache: Dict[Tuple[int, int], np.ndarray] = {}
+        self.viewshed_cache = LRUArrayCache(int(cache_max_mb * 1e6))
+        self.viewshed_store = ArrayCache(cache_dir, "viewshed") if cache_dir else None
+        self._dem_fingerprint: Optional[str] = None
+        self.horizon_map: Optional[HorizonMap] = None
 
         logger.info(f"Initialized TerrainAnalyzer: {self.width}x{self.height} cells")
 
@@ -64,11 +104,12 @@ class TerrainAnalyzer:
 
         if HAS_RICHDEM:
             dem = rd.rdarray(self.elevation, no_data=-9999)
+            dem.geotransform = [0, self.cell_width_m, 0, 0, 0, -self.cell_height_m]
             slope = rd.TerrainAttribute(dem, attrib='slope_degrees')
             self.slope_array = np.array(slope)
         else:
             logger.warning("richdem not available, using numpy gradient fallback")
-            dy, dx = np.gradient(self.elevation, DEM_RESOLUTION_M)
+            dy, dx = np.gradient(self.elevation, self.cell_height_m, self.cell_width_m)
             slope_rad = np.arctan(np.sqrt(dx**2 + dy**2))
             self.slope_array = np.degrees(slope_rad)
 
@@ -82,6 +123,8 @@ class TerrainAnalyzer:
         observer_height: float = VIEWSHED_OBSERVER_HEIGHT_M,
         target_height: float = VIEWSHED_TARGET_HEIGHT_M,
         max_distance_km: float = VIEWSHED_MAX_DISTANCE_KM,
+        method: str = "sweep",
+        n_jobs: int = 1,
     ) -> np.ndarray:
         """
         Calculate composite viewshed from multiple observer positions.
@@ -91,13 +134,31 @@ class TerrainAnalyzer:
             observer_height: Height of observer above ground (m)
             target_height: Height of target above ground (m)
             max_distance_km: Maximum observation distance (km)
+            method: Viewshed engine - "sweep" (vectorized radial horizon
+                propagation) or "los" (per-cell line-of-sight reference)
+            n_jobs: Worker processes for uncached observers (-1 = all cores).
+                Workers read the DEM from shared memory and return partial
+                composites; their layers are not added to viewshed_cache.
 
         Returns:
             2D array where values range 0 (invisible) to 1 (visible by all)
         """
-        logger.info(f"Calculating viewshed for {len(observer_positions)} observers...")
+        if method not in VIEWSHED_METHODS:
+            raise ValueError(
+                f"Unknown viewshed method '{method}', expected one of {VIEWSHED_METHODS}"
+            )
+
+        n_jobs = resolve_n_jobs(n_jobs)
+        if n_jobs > 1 and method != "sweep":
+            logger.warning(
+                f"Parallel viewshed requires the sweep engine, running '{method}' serially"
+            )
+            n_jobs = 1
+
+        logger.info(f"Calculating viewshed for {len(observer_positions)} observers ({method})...")
 
         composite_viewshed = np.zeros((self.height, self.width), dtype=float)
+        pending: List[ViewshedKey] = []
 
         for obs_lat, obs_lon in observer_positions:
             obs_row, obs_col = self._latlon_to_rowcol(obs_lat, obs_lon)
@@ -106,12 +167,22 @@ class TerrainAnalyzer:
                 logger.warning(f"Observer position ({obs_lat}, {obs_lon}) outside bounds")
                 continue
 
+            key = self._viewshed_key(
+                obs_row, obs_col, observer_height, target_height, max_distance_km, method
+            )
+            if n_jobs > 1 and self._get_cached_viewshed(key) is None:
+                pending.append(key)
+                continue
+
             viewshed = self._calculate_single_viewshed(
-                obs_row, obs_col, observer_height, target_height, max_distance_km
+                obs_row, obs_col, observer_height, target_height, max_distance_km, method
             )
 
             composite_viewshed += viewshed
 
+        if pending:
+            composite_viewshed += self._calculate_viewshed_parallel(pending, n_jobs)
+
         if len(observer_positions) > 0:
             composite_viewshed /= len(observer_positions)
 
@@ -119,6 +190,186 @@ class TerrainAnalyzer:
 
         return composite_viewshed
 
+    def create_composite_viewshed(
+        self,
+        observer_positions: List[Tuple[float, float]],
+        observer_height: float = VIEWSHED_OBSERVER_HEIGHT_M,
+        target_height: float = VIEWSHED_TARGET_HEIGHT_M,
+        max_distance_km: float = VIEWSHED_MAX_DISTANCE_KM,
+    ) -> CompositeViewshed:
+        """
+        Build an incrementally updatable composite viewshed.
+
+        Args:
+            observer_positions: Initial (lat, lon) observer positions
+            observer_height: Height of observer above ground (m)
+            target_height: Height of target above ground (m)
+            max_distance_km: Maximum observation distance (km)
+
+        Returns:
+            CompositeViewshed holding one footprint per in-bounds observer
+        """
+        composite = CompositeViewshed(
+            self.elevation, self.grid, observer_height, target_height,
+            int(max_distance_km * 1000 / self.resolution_m),
+        )
+
+        for obs_lat, obs_lon in observer_positions:
+            try:
+                composite.add_observer(obs_lat, obs_lon)
+            except ValueError:
+                logger.warning(f"Observer position ({obs_lat}, {obs_lon}) outside bounds")
+
+        composite.pop_dirty()
+
+        return composite
+
+    def calculate_visibility_at_points(
+        self,
+        observer_positions: List[Tuple[float, float]],
+        target_lats: np.ndarray,
+        target_lons: np.ndarray,
+        observer_height: float = VIEWSHED_OBSERVER_HEIGHT_M,
+        target_height: float = VIEWSHED_TARGET_HEIGHT_M,
+        max_distance_km: float = VIEWSHED_MAX_DISTANCE_KM,
+        num_samples: int = 50,
+        chunk_size: int = 4096,
+    ) -> np.ndarray:
+        """
+        Calculate composite visibility at target points only (sparse viewshed).
+
+        Evaluates observer-to-target line of sight for the given points in a
+        vectorized batch instead of computing full-raster viewsheds. Values
+        match calculate_viewshed(method="los") sampled at the same cells; the
+        default sweep engine discretizes sight lines along rays and can
+        differ on a small fraction of cells. A horizon map built for this
+        observer height settles most sight lines in a few samples without
+        changing the result.
+
+        Args:
+            observer_positions: List of (lat, lon) observer positions
+            target_lats, target_lons: Target point coordinates
+            observer_height: Height of observer above ground (m)
+            target_height: Height of target above ground (m)
+            max_distance_km: Maximum observation distance (km)
+            num_samples: Number of points sampled along each sight line
+            chunk_size: Targets processed per batch (bounds memory use)
+
+        Returns:
+            Array aligned with the targets, from 0 (invisible) to 1 (visible by all)
+        """
+        target_rows, target_cols = self.grid.rowcol(target_lats, target_lons)
+        inside = self.grid.contains(target_rows, target_cols)
+
+        visibility = np.zeros(len(target_rows), dtype=float)
+
+        if not observer_positions:
+            return visibility
+
+        max_distance_cells = int(max_distance_km * 1000 / self.resolution_m)
+        rows, cols = target_rows[inside], target_cols[inside]
+        counts = np.zeros(len(rows), dtype=float)
+
+        use_horizon = self.horizon_map is not None and self.horizon_map.matches(observer_height)
+
+        for obs_lat, obs_lon in observer_positions:
+            obs_row, obs_col = self._latlon_to_rowcol(obs_lat, obs_lon)
+
+            if not (0 <= obs_row < self.height and 0 <= obs_col < self.width):
+                logger.warning(f"Observer position ({obs_lat}, {obs_lon}) outside bounds")
+                continue
+
+            in_range = np.hypot(rows - obs_row, cols - obs_col) <= max_distance_cells
+
+            if use_horizon:
+                visible = self.horizon_map.is_visible(
+                    obs_row, obs_col, rows, cols, target_height, num_samples, chunk_size
+                )
+            else:
+                visible = np.empty(len(rows), dtype=bool)
+
+                for start in range(0, len(rows), chunk_size):
+                    batch = slice(start, start + chunk_size)
+                    visible[batch] = self._check_line_of_sight_batch(
+                        obs_row, obs_col, observer_height,
+                        rows[batch], cols[batch], target_height, num_samples,
+                    )
+
+            counts += visible & in_range
+
+        visibility[inside] = counts / len(observer_positions)
+
+        return visibility
+
+    def _check_line_of_sight_batch(
+        self,
+        obs_row: int, obs_col: int, observer_height: float,
+        target_rows: np.ndarray, target_cols: np.ndarray, target_height: float,
+        num_samples: int = 50,
+    ) -> np.ndarray:
+        """
+        Vectorized _check_line_of_sight from one observer to many targets.
+
+        Args:
+            obs_row, obs_col: Observer position
+            observer_height: Height of observer above ground (m)
+            target_rows, target_cols: Target positions (inside the raster)
+            target_height: Height of target above ground (m)
+            num_samples: Number of points to sample along each line
+
+        Returns:
+            Boolean array, True where line of sight is clear
+        """
+        obs_elev = self.elevation[obs_row, obs_col] + observer_height
+        target_elev = self.elevation[target_rows, target_cols] + target_height
+
+        return line_of_sight(
+            self.elevation, obs_row, obs_col, obs_elev,
+            target_rows, target_cols, target_elev, num_samples,
+        )
+
+    def _calculate_viewshed_parallel(self, keys: List[ViewshedKey], n_jobs: int) -> np.ndarray:
+        """
+        Sum sweep viewsheds of several observers across a process pool.
+
+        Workers write their layers to the persistent store when it is enabled.
+
+        Args:
+            keys: Viewshed keys sharing the same heights and distance
+            n_jobs: Number of worker processes
+
+        Returns:
+            Per-cell count of observers seeing the cell
+        """
+        _, _, observer_height, target_height, max_distance_km, _ = keys[0]
+        max_distance_cells = int(max_distance_km * 1000 / self.resolution_m)
+
+        observers = [
+            (key[0], key[1], self._store_key(key) if self.viewshed_store else None)
+            for key in keys
+        ]
+        chunks = split_chunks(observers, n_jobs)
+
+        logger.info(f"Distributing {len(observers)} observers across {len(chunks)} workers")
+
+        total = np.zeros((self.height, self.width), dtype=float)
+
+        with shared_array(np.ascontiguousarray(self.elevation)) as elevation_handle:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                futures = [
+                    executor.submit(
+                        composite_viewshed_worker, elevation_handle, chunk,
+                        observer_height, target_height, max_distance_cells,
+                        self.viewshed_store,
+                    )
+                    for chunk in chunks
+                ]
+
+                for future in futures:
+                    total += future.result()
+
+        return total
+
     def _calculate_single_viewshed(
         self,
         obs_row: int,
@@ -126,29 +377,122 @@ class TerrainAnalyzer:
         observer_height: float,
         target_height: float,
         max_distance_km: float,
+        method: str = "sweep",
     ) -> np.ndarray:
         """
-        Calculate viewshed from single observer using simplified algorithm.
+        Calculate viewshed from single observer.
 
         Args:
             obs_row, obs_col: Observer position in array coordinates
             observer_height: Height of observer (m)
             target_height: Height of target (m)
             max_distance_km: Maximum distance (km)
+            method: Viewshed engine ("sweep" or "los")
 
         Returns:
             Binary viewshed array
         """
-        cache_key = (obs_row, obs_col)
-        if cache_key in self.viewshed_cache:
-            return self.viewshed_cache[cache_key]
+        cache_key = self._viewshed_key(
+            obs_row, obs_col, observer_height, target_height, max_distance_km, method
+        )
+        cached = self._get_cached_viewshed(cache_key)
+        if cached is not None:
+            return cached
+
+        max_distance_cells = int(max_distance_km * 1000 / self.resolution_m)
+
+        if method == "sweep":
+            viewshed = sweep_viewshed(
+                self.elevation, obs_row, obs_col,
+                observer_height, target_height, max_distance_cells
+            )
+        else:
+            viewshed = self._calculate_los_viewshed(
+                obs_row, obs_col, observer_height, target_height, max_distance_cells
+            )
+
+        packed = pack_layer(viewshed)
+        self.viewshed_cache.put(cache_key, packed)
+
+        if self.viewshed_store is not None:
+            self.viewshed_store.save(self._store_key(cache_key), packed)
+
+        return viewshed
+
+    def _viewshed_key(
+        self,
+        obs_row: int,
+        obs_col: int,
+        observer_height: float,
+        target_height: float,
+        max_distance_km: float,
+        method: str,
+    ) -> ViewshedKey:
+        """Build the cache key identifying one observer's viewshed."""
+        return (
+            int(obs_row), int(obs_col),
+            float(observer_height), float(target_height), float(max_distance_km),
+            method,
+        )
+
+    def _store_key(self, key: ViewshedKey) -> str:
+        """Build the persistent store key: DEM content hash plus viewshed parameters."""
+        if self._dem_fingerprint is None:
+            self._dem_fingerprint = array_fingerprint(self.elevation)
+
+        transform = (self.grid.a, self.grid.b, self.grid.c, self.grid.d, self.grid.e, self.grid.f)
+
+        return ArrayCache.make_key(self._dem_fingerprint, transform, "packbits", *key)
+
+    def _get_cached_viewshed(self, key: ViewshedKey) -> Optional[np.ndarray]:
+        """
+        Look up a viewshed in memory, then in the persistent store.
+
+        Args:
+            key: Viewshed key
+
+        Returns:
+            Cached binary viewshed (unpacked from its bit-packed form) or None
+        """
+        packed = self.viewshed_cache.get(key)
+
+        if packed is None and self.viewshed_store is not None:
+            packed = self.viewshed_store.load(self._store_key(key))
+            if packed is not None:
+                packed = np.array(packed)
+                self.viewshed_cache.put(key, packed)
+
+        if packed is None:
+            return None
+
+        return unpack_layer(packed, (self.height, self.width))
+
+    def _calculate_los_viewshed(
+        self,
+        obs_row: int,
+        obs_col: int,
+        observer_height: float,
+        target_height: float,
+        max_distance_cells: int,
+    ) -> np.ndarray:
+        """
+        Calculate viewshed with one line-of-sight check per cell.
+
+        Slow reference implementation kept to validate the sweep engine.
 
+        Args:
+            obs_row, obs_col: Observer position in array coordinates
+            observer_height: Height of observer (m)
+            target_height: Height of target (m)
+            max_distance_cells: Maximum distance in cells
+
+        Returns:
+            Binary viewshed array
+        """
         viewshed = np.zeros((self.height, self.width), dtype=float)
 
         observer_elevation = self.elevation[obs_row, obs_col] + observer_height
 
-        max_distance_cells = int(max_distance_km * 1000 / DEM_RESOLUTION_M)
-
         row_min = max(0, obs_row - max_distance_cells)
         row_max = min(self.height, obs_row + max_distance_cells + 1)
         col_min = max(0, obs_col - max_distance_cells)
@@ -175,8 +519,6 @@ class TerrainAnalyzer:
                 if visible:
                     viewshed[target_row, target_col] = 1.0
 
-        self.viewshed_cache[cache_key] = viewshed
-
         return viewshed
 
     def _check_line_of_sight(
@@ -216,6 +558,74 @@ class TerrainAnalyzer:
 
         return True
 
+    def build_horizon_map(
+        self,
+        observer_height: float = VIEWSHED_OBSERVER_HEIGHT_M,
+        max_distance_km: float = VIEWSHED_MAX_DISTANCE_KM,
+        num_sectors: int = HORIZON_NUM_SECTORS,
+        num_bands: int = HORIZON_NUM_BANDS,
+        step_cells: int = HORIZON_STEP_CELLS,
+    ) -> HorizonMap:
+        """
+        Precompute the horizon map used by is_visible and calculate_visibility_at_points.
+
+        Args:
+            observer_height: Observer height above ground (m)
+            max_distance_km: Maximum horizon search distance (km)
+            num_sectors: Azimuth sectors (more = more queries settled by probes, slower build)
+            num_bands: Distance bands (more = more queries settled by probes, more memory)
+            step_cells: Sampling stride in cells (larger = faster build, weaker probes)
+
+        Returns:
+            HorizonMap instance (also stored on self.horizon_map)
+        """
+        self.horizon_map = HorizonMap(
+            self.elevation, observer_height, max_distance_km,
+            num_sectors=num_sectors, num_bands=num_bands, step_cells=step_cells,
+            cell_size_m=self.resolution_m,
+        )
+
+        return self.horizon_map
+
+    def is_visible(
+        self,
+        obs_lat: float, obs_lon: float,
+        target_lat: float, target_lon: float,
+        observer_height: float = VIEWSHED_OBSERVER_HEIGHT_M,
+        target_height: float = VIEWSHED_TARGET_HEIGHT_M,
+    ) -> bool:
+        """
+        Check whether a target point is visible from an observer point.
+
+        Probes the horizon map first when one was built for this observer
+        height (same answer as the profile walk, fewer samples read).
+
+        Args:
+            obs_lat, obs_lon: Observer position
+            target_lat, target_lon: Target position
+            observer_height: Observer height above ground (m)
+            target_height: Target height above ground (m)
+
+        Returns:
+            True if line of sight is clear (False if either point is outside bounds)
+        """
+        obs_row, obs_col = self._latlon_to_rowcol(obs_lat, obs_lon)
+        target_row, target_col = self._latlon_to_rowcol(target_lat, target_lon)
+
+        for row, col in [(obs_row, obs_col), (target_row, target_col)]:
+            if not (0 <= row < self.height and 0 <= col < self.width):
+                return False
+
+        if self.horizon_map is not None and self.horizon_map.matches(observer_height):
+            return bool(self.horizon_map.is_visible(
+                obs_row, obs_col, target_row, target_col, target_height
+            ))
+
+        return self._check_line_of_sight(
+            obs_row, obs_col, self.elevation[obs_row, obs_col] + observer_height,
+            target_row, target_col, self.elevation[target_row, target_col] + target_height,
+        )
+
     def get_mobility_speed(
         self,
         road_type: str,
@@ -230,6 +640,51 @@ class TerrainAnalyzer:
             weather: Weather condition (clear, fog, rain, snow, rasputitsa)
             slope_deg: Slope in degrees (optional)
 
+        Returns:
+            Speed in km/h
+        """
+        speed = self._road_speed(road_type, weather)
+
+        if slope_deg is not None:
+            speed *= float(self.slope_penalty_factors(slope_deg))
+
+        return max(speed, 1.0)
+
+    def get_mobility_speeds(
+        self,
+        road_types: List[str],
+        weather: str,
+        slope_deg: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized get_mobility_speed for many edges.
+
+        Args:
+            road_types: Road type per edge
+            weather: Weather condition
+            slope_deg: Slope per edge in degrees (optional)
+
+        Returns:
+            Speeds in km/h
+        """
+        unique_types, inverse = np.unique(np.asarray(road_types, dtype=str), return_inverse=True)
+
+        road_speeds = np.array([self._road_speed(road_type, weather) for road_type in unique_types])
+        speeds = road_speeds[inverse.reshape(-1)]
+
+        if slope_deg is not None:
+            speeds = speeds * self.slope_penalty_factors(slope_deg)
+
+        return np.maximum(speeds, 1.0)
+
+    def _road_speed(self, road_type: str, weather: str) -> float:
+        """
+        Weather-adjusted dry speed for a road type, before slope penalty.
+
+        Args:
+            road_type: Road type
+            weather: Weather condition
+
         Returns:
             Speed in km/h
         """
@@ -250,24 +705,55 @@ class TerrainAnalyzer:
         if road_type in ["track", "path", "offroad"]:
             weather_factor = WEATHER_IMPACT.get(weather, {}).get("speed_offroad", 1.0)
 
-        speed = base_speed * weather_factor
+        return base_speed * weather_factor
 
-        if slope_deg is not None:
-            slope_pct = np.tan(np.radians(slope_deg)) * 100
-            if slope_pct < 5:
-                slope_factor = SLOPE_PENALTY["0-5"]
-            elif slope_pct < 10:
-                slope_factor = SLOPE_PENALTY["5-10"]
-            elif slope_pct < 15:
-                slope_factor = SLOPE_PENALTY["10-15"]
-            elif slope_pct < 20:
-                slope_factor = SLOPE_PENALTY["15-20"]
-            else:
-                slope_factor = SLOPE_PENALTY[">20"]
+    def slope_penalty_factors(self, slope_deg: np.ndarray) -> np.ndarray:
+        """
+        Look up SLOPE_PENALTY multipliers for slopes in degrees.
 
-            speed *= slope_factor
+        Args:
+            slope_deg: Slopes in degrees (scalar or array)
 
-        return max(speed, 1.0)
+        Returns:
+            Speed multipliers with the same shape
+        """
+        slope_pct = np.tan(np.radians(np.asarray(slope_deg, dtype=float))) * 100
+
+        factors = np.array(list(SLOPE_PENALTY.values()))
+
+        return factors[np.digitize(slope_pct, SLOPE_PENALTY_BINS_PCT)]
+
+    def sample_slope_along_paths(
+        self,
+        path_lats: List[np.ndarray],
+        path_lons: List[np.ndarray],
+        reduction: str = "max",
+        spacing_m: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Sample the slope raster along polylines and reduce to one slope per path.
+
+        See RasterGrid.sample_along_paths for the densification.
+
+        Args:
+            path_lats, path_lons: Vertex coordinates of each path
+            reduction: "max" (steepest sample) or "mean" (length-weighted)
+            spacing_m: Target distance between samples (m, default one cell)
+
+        Returns:
+            Slope per path in degrees (0 for degenerate or out-of-bounds paths)
+        """
+        if reduction not in EDGE_SLOPE_REDUCTIONS:
+            raise ValueError(
+                f"Unknown slope reduction '{reduction}', expected one of {EDGE_SLOPE_REDUCTIONS}"
+            )
+
+        if spacing_m is None:
+            spacing_m = self.resolution_m
+
+        return self.grid.sample_along_paths(
+            self.calculate_slope(), path_lats, path_lons, reduction=reduction, spacing_m=spacing_m
+        )
 
     def get_elevation_at(self, lat: float, lon: float) -> Optional[float]:
         """
@@ -279,12 +765,9 @@ class TerrainAnalyzer:
         Returns:
             Elevation in meters or None if outside bounds
         """
-        row, col = self._latlon_to_rowcol(lat, lon)
-
-        if 0 <= row < self.height and 0 <= col < self.width:
-            return float(self.elevation[row, col])
+        elevation = self.grid.sample(self.elevation, lat, lon)
 
-        return None
+        return None if np.isnan(elevation) else float(elevation)
 
     def get_visibility_at(self, lat: float, lon: float, viewshed: np.ndarray) -> float:
         """
@@ -297,12 +780,38 @@ class TerrainAnalyzer:
         Returns:
             Visibility score (0-1)
         """
-        row, col = self._latlon_to_rowcol(lat, lon)
+        return float(self.sample_visibility(lat, lon, viewshed))
 
-        if 0 <= row < self.height and 0 <= col < self.width:
-            return float(viewshed[row, col])
+    def sample_elevation(
+        self, lats: np.ndarray, lons: np.ndarray, method: str = "nearest"
+    ) -> np.ndarray:
+        """
+        Sample elevation at many coordinates.
 
-        return 0.0
+        Args:
+            lats, lons: Coordinate arrays
+            method: "nearest" or "bilinear"
+
+        Returns:
+            Elevations in meters (NaN outside bounds)
+        """
+        return self.grid.sample(self.elevation, lats, lons, method=method)
+
+    def sample_visibility(
+        self, lats: np.ndarray, lons: np.ndarray, viewshed: np.ndarray, method: str = "nearest"
+    ) -> np.ndarray:
+        """
+        Sample a viewshed at many coordinates.
+
+        Args:
+            lats, lons: Coordinate arrays
+            viewshed: Viewshed array
+            method: "nearest" or "bilinear"
+
+        Returns:
+            Visibility scores (0 outside bounds)
+        """
+        return self.grid.sample(viewshed, lats, lons, method=method, fill=0.0)
 
     def _latlon_to_rowcol(self, lat: float, lon: float) -> Tuple[int, int]:
         """
@@ -314,13 +823,9 @@ class TerrainAnalyzer:
         Returns:
             Tuple of (row, col)
         """
-        x = (lon - self.bounds["west"]) / (self.bounds["east"] - self.bounds["west"])
-        y = (self.bounds["north"] - lat) / (self.bounds["north"] - self.bounds["south"])
-
-        col = int(x * self.width)
-        row = int(y * self.height)
+        row, col = self.grid.rowcol(lat, lon)
 
-        return row, col
+        return int(row), int(col)
 
     def _rowcol_to_latlon(self, row: int, col: int) -> Tuple[float, float]:
         """
@@ -330,12 +835,8 @@ class TerrainAnalyzer:
             row, col: Array indices
 
         Returns:
-            Tuple of (lat, lon)
+            Tuple of (lat, lon) of the cell's upper-left corner
         """
-        x = col / self.width
-        y = row / self.height
-
-        lon = self.bounds["west"] + x * (self.bounds["east"] - self.bounds["west"])
-        lat = self.bounds["north"] - y * (self.bounds["north"] - self.bounds["south"])
+        lat, lon = self.grid.xy(row, col, offset="ul")
 
-        return lat, lon
+        return float(lat), float(lon)
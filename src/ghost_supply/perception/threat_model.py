@@ -1,14 +1,20 @@
 """Threat prediction using time series and spatial clustering."""
 
+import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import prophet
 from loguru import logger
 from prophet import Prophet
+from prophet.serialize import model_from_json, model_to_json
+from scipy.spatial import cKDTree
 from sklearn.cluster import DBSCAN
 
+from ghost_supply.utils.array_cache import ArrayCache, array_fingerprint
 from ghost_supply.utils.constants import (
     STUDY_AREA_BOUNDS,
     SYNTHETIC_DAYS_HISTORY,
@@ -21,10 +27,149 @@ from ghost_supply.utils.constants import (
     THREAT_CLUSTER_MIN_SAMPLES,
     THREAT_DAY_NIGHT_RATIO,
     THREAT_FOG_REDUCTION,
+    THREAT_FORECAST_HORIZON_HOURS,
+    THREAT_KILLZONE_INDEX_MARGIN,
     THREAT_RAIN_REDUCTION,
     THREAT_SNOW_REDUCTION,
 )
-from ghost_supply.utils.geo import haversine_distance, latlon_to_meters
+from ghost_supply.utils.geo import haversine_distance, haversine_distances, latlon_to_meters
+
+# Prophet hyperparameters of the temporal threat model (part of the model cache key)
+PROPHET_PARAMS = {
+    "yearly_seasonality": False,
+    "weekly_seasonality": True,
+    "daily_seasonality": True,
+    "changepoint_prior_scale": 0.05,
+}
+PROPHET_REGRESSORS = ["hour"]
+
+# Base detection probability per road type; any other type is off-road
+ROAD_BASE_RISK = {
+    "primary": THREAT_BASE_DETECTION_ROAD,
+    "secondary": THREAT_BASE_DETECTION_ROAD * 0.8,
+    "tertiary": THREAT_BASE_DETECTION_ROAD * 0.8,
+    "track": THREAT_BASE_DETECTION_TRACK,
+    "path": THREAT_BASE_DETECTION_TRACK,
+}
+
+# Detection multiplier per weather condition; any other condition is 1.0
+WEATHER_RISK_FACTORS = {
+    "rain": 1.0 - THREAT_RAIN_REDUCTION,
+    "fog": 1.0 - THREAT_FOG_REDUCTION,
+    "snow": 1.0 - THREAT_SNOW_REDUCTION,
+}
+
+
+class KillZoneIndex:
+    """
+    KD-tree over kill-zone centers for radius-bounded candidate lookups.
+
+    Centers are projected to local meters around their mean position. A query
+    returns every zone whose center lies within scale × the largest zone radius
+    of a point, widened by THREAT_KILLZONE_INDEX_MARGIN to cover projection
+    error; callers check exact distances on the candidates only.
+    """
+
+    def __init__(self, kill_zones: List[Dict]):
+        """
+        Build index.
+
+        Args:
+            kill_zones: Kill zone dicts with 'center' and 'radius_km'
+        """
+        self.kill_zones = list(kill_zones)
+        self.centers, self.radii_km = self._geometry(kill_zones)
+
+        if len(kill_zones) > 0:
+            self.ref_lat, self.ref_lon = self.centers.mean(axis=0)
+            self.max_radius_km = float(self.radii_km.max())
+            self.tree = cKDTree(self._project(self.centers[:, 0], self.centers[:, 1]))
+        else:
+            self.ref_lat, self.ref_lon = 0.0, 0.0
+            self.max_radius_km = 0.0
+            self.tree = None
+
+    def __len__(self) -> int:
+        return len(self.kill_zones)
+
+    @staticmethod
+    def _geometry(kill_zones: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (N, 2) centers and N radii (km) of kill zones."""
+        centers = np.array([kz["center"] for kz in kill_zones], dtype=float).reshape(-1, 2)
+        radii_km = np.array([kz["radius_km"] for kz in kill_zones], dtype=float)
+
+        return centers, radii_km
+
+    def matches(self, kill_zones: List[Dict]) -> bool:
+        """
+        Check whether the index was built from these kill zone dicts.
+
+        Cheap enough for every query: compares the zones by identity only, so
+        zones appended, removed or replaced are detected but a zone dict
+        edited in place is not (replace the dict instead).
+
+        Args:
+            kill_zones: Current kill zone dicts
+
+        Returns:
+            True if the index is up to date
+        """
+        return len(kill_zones) == len(self.kill_zones) and all(
+            zone is indexed for zone, indexed in zip(kill_zones, self.kill_zones)
+        )
+
+    def _project(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Project positions to an (N, 2) array of local meters."""
+        x, y = latlon_to_meters(
+            np.atleast_1d(lats), np.atleast_1d(lons), self.ref_lat, self.ref_lon
+        )
+
+        return np.column_stack([x, y])
+
+    def _search_radius_m(self, scale: float) -> float:
+        return scale * self.max_radius_km * 1000 * (1.0 + THREAT_KILLZONE_INDEX_MARGIN)
+
+    def candidates(self, lat: float, lon: float, scale: float = 1.0) -> np.ndarray:
+        """
+        Candidate zones near a single position.
+
+        Args:
+            lat, lon: Position
+            scale: Search radius as a multiple of the zone radius
+
+        Returns:
+            Sorted indices into kill_zones
+        """
+        if self.tree is None:
+            return np.empty(0, dtype=int)
+
+        neighbours = self.tree.query_ball_point(
+            self._project(lat, lon)[0], self._search_radius_m(scale)
+        )
+
+        return np.sort(np.asarray(neighbours, dtype=int))
+
+    def query(
+        self, lats: np.ndarray, lons: np.ndarray, scale: float = 1.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Candidate (position, zone) pairs for many positions.
+
+        Args:
+            lats, lons: Positions (arrays)
+            scale: Search radius as a multiple of the zone radius
+
+        Returns:
+            Tuple of (point_indices, zone_indices) arrays of equal length
+        """
+        if self.tree is None or len(lats) == 0:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+        pairs = self.tree.sparse_distance_matrix(
+            cKDTree(self._project(lats, lons)), self._search_radius_m(scale), output_type="ndarray"
+        )
+
+        return pairs["j"].astype(int), pairs["i"].astype(int)
 
 
 class ThreatPredictor:
@@ -34,7 +179,10 @@ class ThreatPredictor:
         self.incidents: Optional[pd.DataFrame] = None
         self.prophet_model: Optional[Prophet] = None
         self.kill_zones: List[Dict] = []
+        self.kill_zone_index = KillZoneIndex(self.kill_zones)
         self.study_area = STUDY_AREA_BOUNDS
+        self.forecast_table: Dict[pd.Timestamp, float] = {}
+        self._avg_incidents: Optional[float] = None
 
     def generate_synthetic_incidents(
         self,
@@ -134,12 +282,21 @@ class ThreatPredictor:
 
         return df
 
-    def train_temporal_model(self, incidents: Optional[pd.DataFrame] = None) -> None:
+    def train_temporal_model(
+        self,
+        incidents: Optional[pd.DataFrame] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         """
         Train Prophet model for temporal threat prediction.
 
+        With cache_dir, the fitted model is stored as JSON keyed by a hash of
+        the incident data and hyperparameters, and reloaded instead of refit
+        when neither has changed.
+
         Args:
             incidents: Incident DataFrame (uses self.incidents if None)
+            cache_dir: Directory for the Prophet model cache (disabled if None)
         """
         if incidents is not None:
             self.incidents = incidents
@@ -147,27 +304,71 @@ class ThreatPredictor:
         if self.incidents is None:
             raise ValueError("No incidents data available. Generate or load incidents first.")
 
+        self.forecast_table = {}
+        self._avg_incidents = None
+
+        model_path = None
+        if cache_dir is not None:
+            model_path = self._model_cache_path(cache_dir)
+
+            if model_path.exists():
+                try:
+                    self.prophet_model = model_from_json(model_path.read_text())
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning(f"Failed to load cached Prophet model {model_path}: {e}")
+                else:
+                    logger.info(f"Loaded Prophet model from {model_path}")
+                    return
+
         logger.info("Training Prophet temporal threat model...")
 
-        hourly_counts = self.incidents.set_index("timestamp").resample("H").size().reset_index()
+        hourly_counts = self.incidents.set_index("timestamp").resample("h").size().reset_index()
         hourly_counts.columns = ["ds", "y"]
 
         hourly_counts["hour"] = hourly_counts["ds"].dt.hour
         hourly_counts["day_of_week"] = hourly_counts["ds"].dt.dayofweek
 
-        self.prophet_model = Prophet(
-            yearly_seasonality=False,
-            weekly_seasonality=True,
-            daily_seasonality=True,
-            changepoint_prior_scale=0.05,
-        )
+        self.prophet_model = Prophet(**PROPHET_PARAMS)
 
-        self.prophet_model.add_regressor("hour")
+        for regressor in PROPHET_REGRESSORS:
+            self.prophet_model.add_regressor(regressor)
 
         self.prophet_model.fit(hourly_counts)
 
         logger.info("Prophet model trained successfully")
 
+        if model_path is not None:
+            tmp_path = model_path.with_name(f"{model_path.stem}.{os.getpid()}.tmp.json")
+            tmp_path.write_text(model_to_json(self.prophet_model))
+            os.replace(tmp_path, model_path)
+
+            logger.info(f"Saved Prophet model to {model_path}")
+
+    def _model_cache_path(self, cache_dir: str) -> Path:
+        """
+        Path of the cached Prophet model for the current incidents.
+
+        Args:
+            cache_dir: Model cache directory
+
+        Returns:
+            JSON file path keyed by incident data, hyperparameters and Prophet version
+        """
+        directory = Path(cache_dir) / "prophet"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        row_hashes = pd.util.hash_pandas_object(self.incidents, index=False).values
+
+        key = ArrayCache.make_key(
+            array_fingerprint(row_hashes),
+            list(self.incidents.columns),
+            sorted(PROPHET_PARAMS.items()),
+            PROPHET_REGRESSORS,
+            prophet.__version__,
+        )
+
+        return directory / f"{key}.json"
+
     def identify_kill_zones(
         self,
         eps_km: float = THREAT_CLUSTER_EPS_KM,
@@ -193,9 +394,9 @@ class ThreatPredictor:
         ref_lat = self.study_area["south"]
         ref_lon = self.study_area["west"]
 
-        coords_meters = np.array([
-            latlon_to_meters(lat, lon, ref_lat, ref_lon) for lat, lon in coords
-        ])
+        coords_meters = np.column_stack(
+            latlon_to_meters(coords[:, 0], coords[:, 1], ref_lat, ref_lon)
+        )
 
         eps_meters = eps_km * 1000
 
@@ -232,14 +433,57 @@ class ThreatPredictor:
 
             self.kill_zones.append(kill_zone)
 
+        self.kill_zone_index = KillZoneIndex(self.kill_zones)
+
         logger.info(f"Identified {len(self.kill_zones)} kill zones")
 
         return self.kill_zones
 
+    def build_forecast_table(
+        self,
+        start: datetime,
+        horizon_hours: int = THREAT_FORECAST_HORIZON_HOURS,
+    ) -> Dict[pd.Timestamp, float]:
+        """
+        Forecast threat multipliers hourly over a mission horizon in one pass.
+
+        predict_threat_at_time then answers from the table for any timestamp
+        within the horizon instead of running Prophet.
+
+        Args:
+            start: First hour of the horizon (floored to the hour)
+            horizon_hours: Number of hours to forecast
+
+        Returns:
+            Dict mapping hour timestamps to threat multipliers (0.1-2.0)
+        """
+        if self.prophet_model is None:
+            logger.warning("Prophet model not trained, forecast table not built")
+            return self.forecast_table
+
+        hours = pd.date_range(pd.Timestamp(start).floor("h"), periods=horizon_hours, freq="h")
+
+        forecast = self.prophet_model.predict(pd.DataFrame({"ds": hours, "hour": hours.hour}))
+
+        multipliers = self._threat_multipliers(forecast["yhat"].values)
+
+        self.forecast_table = dict(zip(hours, multipliers.tolist()))
+
+        logger.info(f"Built threat forecast table: {horizon_hours} hours from {hours[0]}")
+
+        return self.forecast_table
+
+    def covers(self, timestamp: datetime) -> bool:
+        """Check whether the forecast table contains a timestamp's hour."""
+        return pd.Timestamp(timestamp).floor("h") in self.forecast_table
+
     def predict_threat_at_time(self, timestamp: datetime) -> float:
         """
         Predict threat level at specific time.
 
+        Looks up the forecast table when it covers the timestamp's hour,
+        otherwise runs Prophet for this timestamp.
+
         Args:
             timestamp: Time to predict
 
@@ -250,6 +494,10 @@ class ThreatPredictor:
             logger.warning("Prophet model not trained, using baseline")
             return 1.0
 
+        cached = self.forecast_table.get(pd.Timestamp(timestamp).floor("h"))
+        if cached is not None:
+            return cached
+
         future_df = pd.DataFrame({
             "ds": [timestamp],
             "hour": [timestamp.hour],
@@ -257,15 +505,30 @@ class ThreatPredictor:
 
         forecast = self.prophet_model.predict(future_df)
 
-        predicted_incidents = max(forecast["yhat"].values[0], 0)
+        return float(self._threat_multipliers(forecast["yhat"].values)[0])
 
-        avg_incidents = self.incidents.groupby(self.incidents["timestamp"].dt.hour).size().mean()
+    def _threat_multipliers(self, predicted: np.ndarray) -> np.ndarray:
+        """
+        Convert predicted hourly incident counts to threat multipliers.
 
-        threat_multiplier = predicted_incidents / avg_incidents if avg_incidents > 0 else 1.0
+        Args:
+            predicted: Prophet yhat values
 
-        threat_multiplier = np.clip(threat_multiplier, 0.1, 2.0)
+        Returns:
+            Multipliers relative to the average incidents per hour of day, clipped to 0.1-2.0
+        """
+        if self._avg_incidents is None:
+            hourly = self.incidents.groupby(self.incidents["timestamp"].dt.hour)
+            self._avg_incidents = hourly.size().mean()
 
-        return threat_multiplier
+        predicted_incidents = np.maximum(predicted, 0)
+
+        if self._avg_incidents > 0:
+            threat_multiplier = predicted_incidents / self._avg_incidents
+        else:
+            threat_multiplier = np.ones_like(predicted_incidents)
+
+        return np.clip(threat_multiplier, 0.1, 2.0)
 
     def risk_at(
         self,
@@ -287,14 +550,7 @@ class ThreatPredictor:
         Returns:
             Risk probability (0-1)
         """
-        if road_type == "primary":
-            base_risk = THREAT_BASE_DETECTION_ROAD
-        elif road_type in ["secondary", "tertiary"]:
-            base_risk = THREAT_BASE_DETECTION_ROAD * 0.8
-        elif road_type in ["track", "path"]:
-            base_risk = THREAT_BASE_DETECTION_TRACK
-        else:
-            base_risk = THREAT_BASE_DETECTION_OFFROAD
+        base_risk = ROAD_BASE_RISK.get(road_type, THREAT_BASE_DETECTION_OFFROAD)
 
         temporal_mult = self.predict_threat_at_time(timestamp)
 
@@ -306,16 +562,11 @@ class ThreatPredictor:
         if is_night:
             temporal_mult *= (1.0 / THREAT_DAY_NIGHT_RATIO)
 
-        weather_mult = 1.0
-        if weather == "rain":
-            weather_mult = 1.0 - THREAT_RAIN_REDUCTION
-        elif weather == "fog":
-            weather_mult = 1.0 - THREAT_FOG_REDUCTION
-        elif weather == "snow":
-            weather_mult = 1.0 - THREAT_SNOW_REDUCTION
+        weather_mult = WEATHER_RISK_FACTORS.get(weather, 1.0)
 
         spatial_mult = 1.0
-        for kz in self.kill_zones:
+        for zone in self._get_kill_zone_index().candidates(lat, lon):
+            kz = self.kill_zones[zone]
             distance = haversine_distance(lat, lon, kz["center"][0], kz["center"][1])
             if distance <= kz["radius_km"]:
                 intensity = kz["num_incidents"] / SYNTHETIC_NUM_INCIDENTS
@@ -326,6 +577,99 @@ class ThreatPredictor:
 
         return min(total_risk, 1.0)
 
+    def risk_at_many(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        timestamps: Union[datetime, Sequence[datetime]],
+        road_types: Union[str, Sequence[str]] = "track",
+        weather: Union[str, Sequence[str]] = "clear",
+    ) -> np.ndarray:
+        """
+        Vectorized risk_at over arrays of positions, times and road types.
+
+        Temporal multipliers are read from the forecast table (built over the
+        queried hours if it does not cover them); kill-zone distances use the
+        spherical haversine formula.
+
+        Args:
+            lats, lons: Positions (arrays)
+            timestamps: Time, or one time per position
+            road_types: Road type, or one road type per position
+            weather: Weather condition, or one condition per position
+
+        Returns:
+            Risk probabilities (0-1)
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        n = len(lats)
+
+        road_codes = pd.Categorical(
+            np.broadcast_to(np.asarray(road_types, dtype=object), n),
+            categories=list(ROAD_BASE_RISK),
+        ).codes
+        # Unknown road types have code -1, which picks the trailing off-road risk
+        base_risk = np.append(
+            list(ROAD_BASE_RISK.values()), THREAT_BASE_DETECTION_OFFROAD
+        )[road_codes]
+
+        if isinstance(timestamps, datetime):
+            times = pd.DatetimeIndex([timestamps]).repeat(n)
+        else:
+            times = pd.DatetimeIndex(pd.to_datetime(timestamps))
+
+        hour_index, unique_hours = pd.factorize(times.floor("h"), sort=True)
+
+        if self.prophet_model is not None and not all(self.covers(h) for h in unique_hours):
+            first = unique_hours[0]
+            span = int((unique_hours[-1] - first) / pd.Timedelta(hours=1)) + 1
+            self.build_forecast_table(first, max(span, THREAT_FORECAST_HORIZON_HOURS))
+
+        hourly_mult = np.array([self.predict_threat_at_time(h) for h in unique_hours])
+        temporal_mult = hourly_mult[hour_index]
+
+        hour_of_day = times.hour.values
+        temporal_mult = np.where(
+            ((hour_of_day >= 6) & (hour_of_day <= 8)) | ((hour_of_day >= 16) & (hour_of_day <= 18)),
+            temporal_mult * 1.3,
+            temporal_mult,
+        )
+        temporal_mult = np.where(
+            (hour_of_day < 6) | (hour_of_day > 20),
+            temporal_mult * (1.0 / THREAT_DAY_NIGHT_RATIO),
+            temporal_mult,
+        )
+
+        if isinstance(weather, str):
+            weather_mult = WEATHER_RISK_FACTORS.get(weather, 1.0)
+        else:
+            weather_mult = np.array([WEATHER_RISK_FACTORS.get(w, 1.0) for w in weather])
+
+        index = self._get_kill_zone_index()
+        point_idx, zone_idx = index.query(lats, lons)
+
+        distance = haversine_distances(
+            lats[point_idx], lons[point_idx], index.centers[zone_idx, 0], index.centers[zone_idx, 1]
+        )
+        radius = index.radii_km[zone_idx]
+        inside = distance <= radius
+
+        intensity = (
+            np.array([kz["num_incidents"] for kz in self.kill_zones]) / SYNTHETIC_NUM_INCIDENTS
+        )
+
+        spatial_mult = np.ones(n)
+        np.add.at(
+            spatial_mult,
+            point_idx[inside],
+            intensity[zone_idx[inside]] * (1.0 - distance[inside] / radius[inside]),
+        )
+
+        total_risk = base_risk * temporal_mult * weather_mult * spatial_mult
+
+        return np.minimum(total_risk, 1.0)
+
     def get_kill_zone_at(self, lat: float, lon: float) -> Optional[Dict]:
         """
         Check if position is in a kill zone.
@@ -336,9 +680,17 @@ class ThreatPredictor:
         Returns:
             Kill zone dict or None
         """
-        for kz in self.kill_zones:
+        for zone in self._get_kill_zone_index().candidates(lat, lon):
+            kz = self.kill_zones[zone]
             distance = haversine_distance(lat, lon, kz["center"][0], kz["center"][1])
             if distance <= kz["radius_km"]:
                 return kz
 
         return None
+
+    def _get_kill_zone_index(self) -> KillZoneIndex:
+        """Return the kill zone index, rebuilt if kill_zones changed."""
+        if not self.kill_zone_index.matches(self.kill_zones):
+            self.kill_zone_index = KillZoneIndex(self.kill_zones)
+
+        return self.kill_zone_index
@@ -0,0 +1,461 @@
+"""Vectorized viewshed engines based on radial horizon propagation."""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ghost_supply.utils.array_cache import ArrayCache
+from ghost_supply.utils.parallel import SharedArray, attach_shared_array
+from ghost_supply.utils.raster import RasterGrid
+
+
+def pack_layer(layer: np.ndarray) -> np.ndarray:
+    """
+    Bit-pack a binary layer (1 bit per cell).
+
+    Args:
+        layer: Array of 0/1 (or bool) values
+
+    Returns:
+        Flat uint8 array of packed bits
+    """
+    return np.packbits(np.asarray(layer, dtype=bool), axis=None)
+
+
+def unpack_layer(packed: np.ndarray, shape: Tuple[int, int], dtype: type = float) -> np.ndarray:
+    """
+    Unpack a layer produced by pack_layer.
+
+    Args:
+        packed: Packed bits
+        shape: Original layer shape
+        dtype: Output dtype
+
+    Returns:
+        Layer of 0/1 values with the given shape
+    """
+    count = int(np.prod(shape))
+
+    return np.unpackbits(packed, count=count).reshape(shape).astype(dtype)
+
+
+def ray_offsets(radius: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the perimeter offsets of the square ring of Chebyshev radius `radius`.
+
+    One ray is cast from the observer to every perimeter cell, so every cell of
+    the enclosing square lies within half a cell of at least one ray.
+
+    Args:
+        radius: Ring radius in cells
+
+    Returns:
+        Tuple of (row_offsets, col_offsets), each of length 8 * radius
+    """
+    side = np.arange(-radius, radius)
+
+    ray_rows = np.concatenate([
+        np.full(2 * radius, -radius), side, np.full(2 * radius, radius), -side
+    ])
+    ray_cols = np.concatenate([
+        side, np.full(2 * radius, radius), -side, np.full(2 * radius, -radius)
+    ])
+
+    return ray_rows, ray_cols
+
+
+def assign_rays(
+    d_rows: np.ndarray, d_cols: np.ndarray, radius: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Map cell offsets to the ray passing through them and the step along that ray.
+
+    Args:
+        d_rows, d_cols: Cell offsets from the ray origin (not both zero)
+        radius: Ring radius used by ray_offsets
+
+    Returns:
+        Tuple of (ray_index, step) arrays; step is the Chebyshev distance (>= 1)
+    """
+    ray_rows, ray_cols = ray_offsets(radius)
+
+    ray_lookup = np.full((2 * radius + 1, 2 * radius + 1), -1, dtype=np.int64)
+    ray_lookup[ray_rows + radius, ray_cols + radius] = np.arange(len(ray_rows))
+
+    steps = np.maximum(np.abs(d_rows), np.abs(d_cols))
+    scale = radius / np.maximum(steps, 1)
+
+    perimeter_rows = np.rint(d_rows * scale).astype(np.int64)
+    perimeter_cols = np.rint(d_cols * scale).astype(np.int64)
+
+    return ray_lookup[perimeter_rows + radius, perimeter_cols + radius], steps
+
+
+def march_rays(
+    elevation: np.ndarray, origin_row: int, origin_col: int, radius: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample the terrain along every ray cast from an origin cell.
+
+    Args:
+        elevation: 2D elevation array
+        origin_row, origin_col: Ray origin in array coordinates
+        radius: Number of steps per ray
+
+    Returns:
+        Tuple of (terrain, distance_cells, valid), each shaped (8 * radius, radius).
+        Column k holds the sample at Chebyshev step k + 1; out-of-bounds samples
+        are flagged invalid.
+    """
+    height, width = elevation.shape
+    ray_rows, ray_cols = ray_offsets(radius)
+
+    t = np.arange(1, radius + 1) / radius
+
+    sample_d_rows = np.rint(np.outer(ray_rows, t)).astype(np.int64)
+    sample_d_cols = np.rint(np.outer(ray_cols, t)).astype(np.int64)
+
+    rows = origin_row + sample_d_rows
+    cols = origin_col + sample_d_cols
+
+    valid = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+
+    terrain = elevation[np.clip(rows, 0, height - 1), np.clip(cols, 0, width - 1)]
+    distance_cells = np.hypot(sample_d_rows, sample_d_cols)
+
+    return terrain, distance_cells, valid
+
+
+def sweep_viewshed_window(
+    elevation: np.ndarray,
+    obs_row: int,
+    obs_col: int,
+    observer_height: float,
+    target_height: float,
+    max_distance_cells: int,
+) -> Tuple[slice, slice, np.ndarray]:
+    """
+    Compute a binary viewshed restricted to the observer's footprint window.
+
+    Rays are cast to every cell of the bounding ring (R2-style) and the running
+    maximum terrain slope is propagated outward along each ray. A cell is visible
+    when the slope to the target height on top of it is at least the horizon
+    slope accumulated by its ray up to the previous ring.
+
+    Args:
+        elevation: 2D elevation array
+        obs_row, obs_col: Observer position in array coordinates
+        observer_height: Height of observer above ground (m)
+        target_height: Height of target above ground (m)
+        max_distance_cells: Maximum observation distance in cells
+
+    Returns:
+        Tuple of (row_slice, col_slice, window) where window is a float 0/1 array
+    """
+    height, width = elevation.shape
+
+    grid_extent = max(obs_row, height - 1 - obs_row, obs_col, width - 1 - obs_col)
+    radius = max(min(int(max_distance_cells), grid_extent), 1)
+
+    row_min = max(0, obs_row - radius)
+    row_max = min(height, obs_row + radius + 1)
+    col_min = max(0, obs_col - radius)
+    col_max = min(width, obs_col + radius + 1)
+
+    observer_elevation = elevation[obs_row, obs_col] + observer_height
+
+    terrain, distance_cells, valid = march_rays(elevation, obs_row, obs_col, radius)
+
+    slopes = np.where(valid, (terrain - observer_elevation) / distance_cells, -np.inf)
+    horizon = np.maximum.accumulate(slopes, axis=1)
+    horizon_before = np.concatenate(
+        [np.full((horizon.shape[0], 1), -np.inf), horizon[:, :-1]], axis=1
+    )
+
+    d_rows, d_cols = np.meshgrid(
+        np.arange(row_min, row_max) - obs_row,
+        np.arange(col_min, col_max) - obs_col,
+        indexing="ij",
+    )
+
+    window = np.zeros(d_rows.shape, dtype=float)
+
+    in_range = np.hypot(d_rows, d_cols) <= max_distance_cells
+    in_range[obs_row - row_min, obs_col - col_min] = False
+
+    target_d_rows = d_rows[in_range]
+    target_d_cols = d_cols[in_range]
+
+    rays, steps = assign_rays(target_d_rows, target_d_cols, radius)
+
+    target_elevation = elevation[obs_row + target_d_rows, obs_col + target_d_cols] + target_height
+    target_slope = (target_elevation - observer_elevation) / np.hypot(target_d_rows, target_d_cols)
+
+    window[in_range] = (target_slope >= horizon_before[rays, steps - 1]).astype(float)
+    window[obs_row - row_min, obs_col - col_min] = 1.0
+
+    return slice(row_min, row_max), slice(col_min, col_max), window
+
+
+def sweep_viewshed(
+    elevation: np.ndarray,
+    obs_row: int,
+    obs_col: int,
+    observer_height: float,
+    target_height: float,
+    max_distance_cells: int,
+) -> np.ndarray:
+    """
+    Compute a full-raster binary viewshed with the sweep engine.
+
+    Args:
+        elevation: 2D elevation array
+        obs_row, obs_col: Observer position in array coordinates
+        observer_height: Height of observer above ground (m)
+        target_height: Height of target above ground (m)
+        max_distance_cells: Maximum observation distance in cells
+
+    Returns:
+        Binary viewshed array with the same shape as elevation
+    """
+    rows, cols, window = sweep_viewshed_window(
+        elevation, obs_row, obs_col, observer_height, target_height, max_distance_cells
+    )
+
+    viewshed = np.zeros(elevation.shape, dtype=float)
+    viewshed[rows, cols] = window
+
+    return viewshed
+
+
+def composite_viewshed_worker(
+    elevation_handle: SharedArray,
+    observers: List[Tuple[int, int, Optional[str]]],
+    observer_height: float,
+    target_height: float,
+    max_distance_cells: int,
+    store: Optional[ArrayCache] = None,
+) -> np.ndarray:
+    """
+    Sum sweep viewsheds for a chunk of observers inside a worker process.
+
+    The elevation raster is read from shared memory rather than pickled.
+
+    Args:
+        elevation_handle: Shared elevation array handle
+        observers: List of (row, col, store_key) observer positions
+        observer_height: Height of observer above ground (m)
+        target_height: Height of target above ground (m)
+        max_distance_cells: Maximum observation distance in cells
+        store: Persistent viewshed store receiving each bit-packed layer (optional)
+
+    Returns:
+        Partial composite: per-cell count of observers seeing the cell
+    """
+    elevation = attach_shared_array(elevation_handle)
+
+    partial = np.zeros(elevation.shape, dtype=float)
+
+    for obs_row, obs_col, store_key in observers:
+        rows, cols, window = sweep_viewshed_window(
+            elevation, obs_row, obs_col, observer_height, target_height, max_distance_cells
+        )
+        partial[rows, cols] += window
+
+        if store is not None and store_key is not None:
+            layer = np.zeros(elevation.shape, dtype=bool)
+            layer[rows, cols] = window
+            store.save(store_key, pack_layer(layer))
+
+    return partial
+
+
+Window = Tuple[slice, slice]
+
+
+class CompositeViewshed:
+    """
+    Composite viewshed maintained incrementally as observers change.
+
+    Keeps each observer's footprint window (bit-packed) and a running uint16
+    per-cell count, so adding, moving or removing one observer only touches
+    that observer's footprint. Cells changed since the last pop_dirty() are tracked as a
+    bounding window for downstream refreshes.
+    """
+
+    def __init__(
+        self,
+        elevation: np.ndarray,
+        grid: RasterGrid,
+        observer_height: float,
+        target_height: float,
+        max_distance_cells: int,
+    ):
+        """
+        Initialize an empty composite viewshed.
+
+        Args:
+            elevation: 2D elevation array
+            grid: RasterGrid mapping coordinates to elevation cells
+            observer_height: Height of observer above ground (m)
+            target_height: Height of target above ground (m)
+            max_distance_cells: Maximum observation distance in cells
+        """
+        self.elevation = elevation
+        self.grid = grid
+        self.observer_height = observer_height
+        self.target_height = target_height
+        self.max_distance_cells = max_distance_cells
+
+        self.counts = np.zeros(elevation.shape, dtype=np.uint16)
+        self.layers: Dict[int, Tuple[slice, slice, np.ndarray]] = {}
+        self.positions: Dict[int, Tuple[float, float]] = {}
+
+        self._next_id = 0
+        self._dirty: Optional[Window] = None
+
+    @property
+    def num_observers(self) -> int:
+        """Number of observers in the composite."""
+        return len(self.layers)
+
+    @property
+    def viewshed(self) -> np.ndarray:
+        """Fraction of observers seeing each cell (0 to 1), as calculate_viewshed."""
+        if not self.layers:
+            return np.zeros(self.counts.shape, dtype=float)
+
+        return self.counts / self.num_observers
+
+    def add_observer(self, lat: float, lon: float) -> int:
+        """
+        Add an observer and accumulate its footprint.
+
+        Args:
+            lat, lon: Observer position
+
+        Returns:
+            Observer id used by move_observer/remove_observer
+        """
+        observer_id = self._next_id
+        self._next_id += 1
+
+        self._insert(observer_id, lat, lon, *self._footprint(lat, lon))
+
+        return observer_id
+
+    def remove_observer(self, observer_id: int) -> None:
+        """
+        Remove an observer and subtract its footprint.
+
+        Args:
+            observer_id: Id returned by add_observer
+        """
+        if observer_id not in self.layers:
+            raise ValueError(f"Unknown observer id {observer_id}")
+
+        rows, cols, packed = self.layers.pop(observer_id)
+        del self.positions[observer_id]
+
+        self.counts[rows, cols] -= unpack_layer(packed, self._window_shape(rows, cols), np.uint16)
+        self._mark_dirty(rows, cols)
+
+    def move_observer(self, observer_id: int, lat: float, lon: float) -> None:
+        """
+        Move an observer, updating only its old and new footprints.
+
+        The new footprint is computed first, so a move out of bounds raises
+        without touching the observer.
+
+        Args:
+            observer_id: Id returned by add_observer
+            lat, lon: New observer position
+        """
+        if observer_id not in self.layers:
+            raise ValueError(f"Unknown observer id {observer_id}")
+
+        footprint = self._footprint(lat, lon)
+
+        self.remove_observer(observer_id)
+        self._insert(observer_id, lat, lon, *footprint)
+
+    def pop_dirty(self) -> Optional[Window]:
+        """
+        Return the window changed since the last call and reset it.
+
+        Returns:
+            (row_slice, col_slice) bounding all changed cells, or None
+        """
+        dirty, self._dirty = self._dirty, None
+
+        return dirty
+
+    def sample(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Sample composite visibility at many coordinates.
+
+        Args:
+            lats, lons: Coordinate arrays
+
+        Returns:
+            Visibility fractions (0 outside bounds)
+        """
+        if not self.layers:
+            return np.zeros(np.shape(lats), dtype=float)
+
+        return self.grid.sample(self.counts, lats, lons, fill=0.0) / self.num_observers
+
+    def _footprint(self, lat: float, lon: float) -> Tuple[slice, slice, np.ndarray]:
+        """Compute an observer's footprint window (raises if outside bounds)."""
+        obs_row, obs_col = (int(v) for v in self.grid.rowcol(lat, lon))
+
+        if not self.grid.contains(obs_row, obs_col):
+            raise ValueError(f"Observer position ({lat}, {lon}) outside bounds")
+
+        rows, cols, window = sweep_viewshed_window(
+            self.elevation, obs_row, obs_col,
+            self.observer_height, self.target_height, self.max_distance_cells,
+        )
+
+        return rows, cols, window.astype(np.uint16)
+
+    def _insert(
+        self, observer_id: int, lat: float, lon: float, rows: slice, cols: slice, window: np.ndarray
+    ) -> None:
+        """Add a footprint window under a given id."""
+        self.layers[observer_id] = (rows, cols, pack_layer(window))
+        self.positions[observer_id] = (lat, lon)
+
+        self.counts[rows, cols] += window
+        self._mark_dirty(rows, cols)
+
+    @staticmethod
+    def _window_shape(rows: slice, cols: slice) -> Tuple[int, int]:
+        """Shape of a footprint window."""
+        return rows.stop - rows.start, cols.stop - cols.start
+
+    def layer(self, observer_id: int) -> np.ndarray:
+        """
+        Unpack one observer's footprint window.
+
+        Args:
+            observer_id: Id returned by add_observer
+
+        Returns:
+            Window of 0/1 values (see layers for its slices)
+        """
+        rows, cols, packed = self.layers[observer_id]
+
+        return unpack_layer(packed, self._window_shape(rows, cols))
+
+    def _mark_dirty(self, rows: slice, cols: slice) -> None:
+        """Grow the dirty window to include a footprint."""
+        if self._dirty is None:
+            self._dirty = (rows, cols)
+            return
+
+        dirty_rows, dirty_cols = self._dirty
+        self._dirty = (
+            slice(min(dirty_rows.start, rows.start), max(dirty_rows.stop, rows.stop)),
+            slice(min(dirty_cols.start, cols.start), max(dirty_cols.stop, cols.stop)),
+        )
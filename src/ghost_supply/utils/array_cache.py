@@ -0,0 +1,166 @@
+"""Content-addressed on-disk cache and bounded in-memory cache for NumPy rasters."""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+import numpy as np
+from loguru import logger
+
+
+def array_fingerprint(array: np.ndarray) -> str:
+    """
+    Hash the shape, dtype and content of an array.
+
+    Args:
+        array: Array to fingerprint
+
+    Returns:
+        Hex SHA-1 digest
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((array.shape, array.dtype.str)).encode())
+
+    contiguous = np.ascontiguousarray(array)
+    digest.update(memoryview(contiguous.reshape(-1).view(np.uint8)))
+
+    return digest.hexdigest()
+
+
+class ArrayCache:
+    """Stores arrays as .npy files named by a hash of their inputs."""
+
+    def __init__(self, cache_dir: str, namespace: str):
+        """
+        Initialize array cache.
+
+        Args:
+            cache_dir: Root cache directory
+            namespace: Sub-directory separating kinds of arrays
+        """
+        self.directory = Path(cache_dir) / namespace
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from hashable parameters.
+
+        Args:
+            parts: Values identifying the cached array (floats, strings, hashes)
+
+        Returns:
+            Hex SHA-1 digest
+        """
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return the file path for a key."""
+        return self.directory / f"{key}.npy"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        """
+        Load a cached array lazily as a read-only memory map.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Memory-mapped array or None if missing or unreadable
+        """
+        path = self.path(key)
+
+        if not path.exists():
+            return None
+
+        try:
+            return np.load(path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load cached array {path}: {e}")
+            return None
+
+    def save(self, key: str, array: np.ndarray) -> None:
+        """
+        Save an array under a key (atomic replace).
+
+        Args:
+            key: Cache key
+            array: Array to store
+        """
+        path = self.path(key)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+
+        np.save(tmp_path, array)
+        os.replace(tmp_path, path)
+
+
+class LRUArrayCache:
+    """In-memory array cache with a byte budget and least-recently-used eviction."""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_bytes: Memory budget for stored arrays (bytes)
+        """
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Return a cached array and mark it as most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached array or None
+        """
+        if key not in self._entries:
+            return None
+
+        self._entries.move_to_end(key)
+
+        return self._entries[key]
+
+    def put(self, key: Hashable, array: np.ndarray) -> None:
+        """
+        Store an array, evicting least recently used entries over budget.
+
+        Arrays larger than the whole budget are not stored.
+
+        Args:
+            key: Cache key
+            array: Array to store
+        """
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key).nbytes
+
+        if array.nbytes > self.max_bytes:
+            logger.warning(f"Array of {array.nbytes} bytes exceeds cache budget, not cached")
+            return
+
+        self._entries[key] = array
+        self.nbytes += array.nbytes
+
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.nbytes = 0
@@ -38,11 +38,32 @@ RF_RX_ANTENNA_HEIGHT_M = 50    # Drone/receiver height
 RF_MIN_SIGNAL_DBM = -90        # Minimum signal for control
 RF_JAMMING_THRESHOLD_DBM = -70  # Vulnerability to jamming threshold
 RF_GOOD_SIGNAL_DBM = -60       # Good signal threshold
+RF_JAMMING_TOLERANCE = 1e-3    # Vulnerability change below which cells leave a jammer's footprint
+
+# Terrain clearance required for line of sight
+RF_LOS_CLEARANCE_M = 5
+
+# Routing reward for RF shadow corridors (risk reduced by up to 30% on fully shadowed edges)
+RF_SHADOW_RISK_REDUCTION = 0.3
 
 # Fresnel zone obstruction limits
 RF_FRESNEL_CRITICAL = 0.6      # >60% obstruction = critical
 RF_FRESNEL_DEGRADED = 0.4      # >40% obstruction = degraded
 
+# Coverage computation
+# NumPy kernel, ray marching, per-cell reference
+RF_COVERAGE_METHODS = ["vectorized", "radial", "scalar"]
+RF_CHUNK_CELLS = 8192          # Cells per batch in the vectorized kernel
+RF_PROFILE_SAMPLES = 101       # Samples per terrain profile (covers the 1/50 and 1/20 steps)
+RF_STATION_CACHE_MAX_MB = 256  # Budget of the in-memory per-station coverage cache
+RF_STORE_SCALE = 100           # Stored coverage maps are int16 in 1/100 dB (range +-327 dBm)
+
+# Adaptive (coarse-to-fine) coverage
+RF_ADAPTIVE_BLOCK_CELLS = 8        # Coarse grid spacing (cells)
+RF_ADAPTIVE_TOLERANCE_DB = 3.0     # Refine blocks whose signal comes this close to a threshold
+RF_ADAPTIVE_TERRAIN_STD_M = 15.0   # Refine blocks with rougher terrain than this
+RF_ADAPTIVE_VALIDATION_CELLS = 256 # Interpolated cells per station checked for the error estimate
+
 # =============================================================================
 # THREAT MODEL PARAMETERS
 # =============================================================================
@@ -51,6 +72,7 @@ RF_FRESNEL_DEGRADED = 0.4      # >40% obstruction = degraded
 THREAT_DAY_NIGHT_RATIO = 3.0   # 3x more dangerous during day
 THREAT_DAWN_PEAK_MULTIPLIER = 1.5  # Peak activity 6-8h
 THREAT_DUSK_PEAK_MULTIPLIER = 1.3  # Peak activity 16-18h
+THREAT_FORECAST_HORIZON_HOURS = 48  # Hours forecast at once for risk lookups
 
 # Weather impact on threat detection
 THREAT_RAIN_REDUCTION = 0.5    # 50% reduction in detection under rain
@@ -60,6 +82,7 @@ THREAT_SNOW_REDUCTION = 0.4    # 60% reduction under snow
 # Threat clustering (DBSCAN)
 THREAT_CLUSTER_EPS_KM = 2.0    # 2km radius for kill zone clustering
 THREAT_CLUSTER_MIN_SAMPLES = 5 # Minimum incidents to form kill zone
+THREAT_KILLZONE_INDEX_MARGIN = 0.1  # Search radius margin covering projection error (fraction)
 
 # Base detection probabilities
 THREAT_BASE_DETECTION_ROAD = 0.4    # 40% on major roads
@@ -114,6 +137,8 @@ SLOPE_PENALTY: Dict[str, float] = {
     "15-20": 0.5,   # 50% reduction
     ">20": 0.3,     # 70% reduction
 }
+SLOPE_PENALTY_BINS_PCT = [5, 10, 15, 20]  # Upper edges of the SLOPE_PENALTY bands (%)
+EDGE_SLOPE_REDUCTIONS = ["max", "mean"]    # Per-edge slope: steepest or length-weighted
 
 # =============================================================================
 # CVAR OPTIMIZATION PARAMETERS
@@ -194,9 +219,17 @@ WEATHER_IMPACT: Dict[str, Dict[str, float]] = {
 VIEWSHED_MAX_DISTANCE_KM = 10.0    # Maximum observation distance
 VIEWSHED_OBSERVER_HEIGHT_M = 3.0   # Observer height (e.g., watchtower)
 VIEWSHED_TARGET_HEIGHT_M = 2.5     # Vehicle height
+VIEWSHED_CACHE_MAX_MB = 256  # Budget of the in-memory (bit-packed) viewshed layer cache
+VIEWSHED_METHODS = ["sweep", "los"]  # Radial horizon sweep (fast) or per-cell LOS (reference)
+
+# Horizon map (LOS probe index) - build cost vs. share of queries settled by probes
+HORIZON_NUM_SECTORS = 16   # Azimuth sectors (angular resolution)
+HORIZON_NUM_BANDS = 8      # Distance bands (geometrically spaced)
+HORIZON_STEP_CELLS = 1     # Sampling stride along each sector (cells)
 
 # DEM resolution
 DEM_RESOLUTION_M = 30  # SRTM 30m resolution
+DEM_STRIP_ROWS = 512   # Rows per strip when streaming a DEM into a memory map
 
 # =============================================================================
 # MISSION PARAMETERS
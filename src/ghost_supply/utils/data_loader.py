@@ -9,7 +9,14 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import rasterio
+from affine import Affine
 from loguru import logger
+from rasterio.enums import Resampling
+from rasterio.errors import WindowError
+from rasterio.windows import Window, from_bounds
+
+from ghost_supply.utils.array_cache import ArrayCache
+from ghost_supply.utils.constants import DEM_STRIP_ROWS
 
 
 @dataclass
@@ -42,16 +49,41 @@ class DataLoader:
         for directory in [self.dem_dir, self.osm_dir, self.scenarios_dir, self.synthetic_dir]:
             directory.mkdir(parents=True, exist_ok=True)
 
-    def load_dem(self, filename: Optional[str] = None) -> Optional[Tuple[np.ndarray, Any]]:
+    def load_dem(
+        self,
+        filename: Optional[str] = None,
+        bounds: Optional[Dict[str, float]] = None,
+        decimation: int = 1,
+        memmap: bool = False,
+        strip_rows: int = DEM_STRIP_ROWS,
+    ) -> Optional[Tuple[np.ndarray, Any]]:
         """
         Load Digital Elevation Model.
 
+        Only the window covering `bounds` is read. With decimation > 1 the
+        window is read at reduced resolution (trimmed to a whole number of
+        output cells), which GDAL serves from the GeoTIFF overviews when
+        present; the returned transform carries the coarser cell size, which
+        TerrainAnalyzer and RFPropagationModel read their resolution from.
+        With memmap=True the band is streamed strip by strip into a .npy file
+        under dem/memmap and returned as a read-only memory map, so the read
+        never holds the whole band in RAM and point lookups only page in the
+        cells they touch. Whole-raster steps (slope, DEM fingerprinting,
+        sharing with worker processes) still load the full array.
+
         Args:
             filename: DEM file name, if None looks for first .tif file
+            bounds: Dict with north, south, east, west (whole raster if None)
+            decimation: Integer downsampling factor
+            memmap: Return a memory-mapped array instead of an in-memory one
+            strip_rows: Output rows read per strip when memory-mapping
 
         Returns:
             Tuple of (elevation_array, transform) or None if not found
         """
+        if decimation < 1:
+            raise ValueError(f"decimation must be >= 1, got {decimation}")
+
         if filename is None:
             tif_files = list(self.dem_dir.glob("*.tif"))
             if not tif_files:
@@ -67,14 +99,122 @@ class DataLoader:
 
         try:
             with rasterio.open(dem_path) as src:
-                elevation = src.read(1)
-                transform = src.transform
-                logger.info(f"Loaded DEM: {dem_path} ({elevation.shape})")
+                window = self._dem_window(src, bounds)
+                if window is None:
+                    logger.warning(f"Requested bounds {bounds} do not overlap DEM {dem_path}")
+                    return None
+
+                # Trim the window to a multiple of the decimation so every
+                # output cell (and every strip) covers whole source blocks
+                out_shape = (
+                    max(int(window.height) // decimation, 1),
+                    max(int(window.width) // decimation, 1),
+                )
+                window = Window(
+                    window.col_off, window.row_off,
+                    min(out_shape[1] * decimation, window.width),
+                    min(out_shape[0] * decimation, window.height),
+                )
+                transform = src.window_transform(window) * Affine.scale(
+                    window.width / out_shape[1], window.height / out_shape[0]
+                )
+
+                if memmap:
+                    elevation = self._read_dem_memmap(
+                        src, dem_path, window, out_shape, decimation, strip_rows
+                    )
+                else:
+                    elevation = src.read(
+                        1, window=window, out_shape=out_shape, resampling=Resampling.average
+                    )
+
+                logger.info(f"Loaded DEM: {dem_path} ({elevation.shape}, window {window})")
                 return elevation, transform
         except Exception as e:
             logger.error(f"Failed to load DEM: {e}")
             return None
 
+    def _dem_window(self, src: Any, bounds: Optional[Dict[str, float]]) -> Optional[Window]:
+        """
+        Compute the integer pixel window covering bounds, clipped to the raster.
+
+        Args:
+            src: Open rasterio dataset
+            bounds: Dict with north, south, east, west (full raster if None)
+
+        Returns:
+            Window or None if bounds fall outside the raster
+        """
+        full = Window(0, 0, src.width, src.height)
+
+        if bounds is None:
+            return full
+
+        window = from_bounds(
+            bounds["west"], bounds["south"], bounds["east"], bounds["north"],
+            transform=src.transform,
+        )
+        window = window.round_offsets(op="floor").round_lengths(op="ceil")
+
+        try:
+            return window.intersection(full)
+        except WindowError:
+            return None
+
+    def _read_dem_memmap(
+        self,
+        src: Any,
+        dem_path: Path,
+        window: Window,
+        out_shape: Tuple[int, int],
+        decimation: int,
+        strip_rows: int,
+    ) -> np.ndarray:
+        """
+        Stream a DEM window into a memory-mapped .npy file, strip by strip.
+
+        The file is keyed by DEM path, modification time, window and
+        decimation, and reused on later loads.
+
+        Returns:
+            Read-only memory-mapped elevation array
+        """
+        store = ArrayCache(str(self.dem_dir), "memmap")
+        key = ArrayCache.make_key(
+            str(dem_path.resolve()), dem_path.stat().st_mtime_ns,
+            window.col_off, window.row_off, window.width, window.height, decimation,
+        )
+
+        cached = store.load(key)
+        if cached is not None:
+            return cached
+
+        path = store.path(key)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+
+        elevation = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=src.dtypes[0], shape=out_shape
+        )
+
+        for out_row in range(0, out_shape[0], strip_rows):
+            out_end = min(out_row + strip_rows, out_shape[0])
+
+            src_row = window.row_off + out_row * decimation
+            src_end = min(window.row_off + out_end * decimation, window.row_off + window.height)
+
+            elevation[out_row:out_end] = src.read(
+                1,
+                window=Window(window.col_off, src_row, window.width, src_end - src_row),
+                out_shape=(out_end - out_row, out_shape[1]),
+                resampling=Resampling.average,
+            )
+
+        elevation.flush()
+        del elevation
+        os.replace(tmp_path, path)
+
+        return store.load(key)
+
     def create_synthetic_dem(
         self,
         bounds: Dict[str, float],
@@ -0,0 +1,100 @@
+"""Process-pool helpers sharing large arrays through shared memory."""
+
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Picklable handle to a NumPy array living in a shared memory block."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@contextmanager
+def shared_array(array: np.ndarray) -> Iterator[SharedArray]:
+    """
+    Copy an array into shared memory for the lifetime of the context.
+
+    Args:
+        array: Array to share with worker processes
+
+    Yields:
+        SharedArray handle to pass to workers
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+
+    try:
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        del view
+
+        yield SharedArray(block.name, tuple(array.shape), array.dtype.str)
+    finally:
+        block.close()
+        block.unlink()
+
+
+def attach_shared_array(handle: SharedArray) -> np.ndarray:
+    """
+    Attach to a shared array from a worker process (read-only view).
+
+    Attachments are kept per process so repeated tasks reuse the same mapping.
+
+    Args:
+        handle: SharedArray created by shared_array in the parent
+
+    Returns:
+        Read-only array backed by the shared block
+    """
+    if handle.name not in _attached:
+        block = shared_memory.SharedMemory(name=handle.name)
+
+        array = np.ndarray(handle.shape, dtype=np.dtype(handle.dtype), buffer=block.buf)
+        array.flags.writeable = False
+
+        _attached[handle.name] = (block, array)
+
+    return _attached[handle.name][1]
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Resolve a worker count, where -1 means all available cores.
+
+    Args:
+        n_jobs: Requested number of workers
+
+    Returns:
+        Number of workers (>= 1)
+    """
+    if n_jobs < 0:
+        return os.cpu_count() or 1
+
+    return max(n_jobs, 1)
+
+
+def split_chunks(items: Sequence[T], num_chunks: int) -> List[List[T]]:
+    """
+    Split items round-robin into at most num_chunks non-empty chunks.
+
+    Args:
+        items: Items to distribute
+        num_chunks: Maximum number of chunks
+
+    Returns:
+        List of chunks
+    """
+    chunks = [list(items[i::num_chunks]) for i in range(num_chunks)]
+
+    return [chunk for chunk in chunks if chunk]
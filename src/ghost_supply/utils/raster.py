@@ -0,0 +1,272 @@
+"""Georeferenced raster grid with vectorized coordinate conversion and sampling."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ghost_supply.utils.geo import haversine_distances
+
+RASTER_SAMPLE_METHODS = ["nearest", "bilinear"]
+RASTER_PATH_REDUCTIONS = ["max", "mean"]
+
+
+class RasterGrid:
+    """
+    Maps lat/lon arrays to raster cells through an affine geotransform.
+
+    The transform stored with the DEM (rasterio Affine, x = lon, y = lat) is
+    used when available; otherwise an equivalent north-up transform is derived
+    from the bounds.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        bounds: Dict[str, float],
+        transform: Optional[Any] = None,
+    ):
+        """
+        Initialize raster grid.
+
+        Args:
+            shape: Raster shape (height, width)
+            bounds: Dict with north, south, east, west
+            transform: Rasterio Affine transform (optional)
+        """
+        self.height, self.width = shape
+        self.bounds = bounds
+
+        if all(hasattr(transform, attr) for attr in ("a", "b", "c", "d", "e", "f")):
+            coefficients = (
+                transform.a, transform.b, transform.c, transform.d, transform.e, transform.f
+            )
+        else:
+            coefficients = (
+                (bounds["east"] - bounds["west"]) / self.width, 0.0, bounds["west"],
+                0.0, -(bounds["north"] - bounds["south"]) / self.height, bounds["north"],
+            )
+
+        self.a, self.b, self.c, self.d, self.e, self.f = (float(v) for v in coefficients)
+
+        determinant = self.a * self.e - self.b * self.d
+        if determinant == 0:
+            raise ValueError("Raster transform is not invertible")
+
+        self._determinant = determinant
+
+    def fractional_rowcol(self, lats: Any, lons: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert coordinates to continuous row/col positions.
+
+        Args:
+            lats, lons: Coordinates (scalars or arrays)
+
+        Returns:
+            Tuple of (rows, cols) float arrays; cell (i, j) spans [i, i + 1) x [j, j + 1)
+        """
+        dx = np.asarray(lons, dtype=float) - self.c
+        dy = np.asarray(lats, dtype=float) - self.f
+
+        cols = (self.e * dx - self.b * dy) / self._determinant
+        rows = (self.a * dy - self.d * dx) / self._determinant
+
+        return rows, cols
+
+    def rowcol(self, lats: Any, lons: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert coordinates to the indices of the cells containing them.
+
+        Args:
+            lats, lons: Coordinates (scalars or arrays)
+
+        Returns:
+            Tuple of (rows, cols) integer arrays (may fall outside the raster)
+        """
+        rows, cols = self.fractional_rowcol(lats, lons)
+
+        return np.floor(rows).astype(np.int64), np.floor(cols).astype(np.int64)
+
+    def xy(self, rows: Any, cols: Any, offset: str = "center") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert cell indices to coordinates.
+
+        Args:
+            rows, cols: Cell indices (scalars or arrays)
+            offset: "center" for cell centers, "ul" for upper-left corners
+
+        Returns:
+            Tuple of (lats, lons) arrays
+        """
+        if offset not in ("center", "ul"):
+            raise ValueError(f"Unknown offset '{offset}', expected 'center' or 'ul'")
+
+        shift = 0.5 if offset == "center" else 0.0
+
+        rows = np.asarray(rows, dtype=float) + shift
+        cols = np.asarray(cols, dtype=float) + shift
+
+        lons = self.a * cols + self.b * rows + self.c
+        lats = self.d * cols + self.e * rows + self.f
+
+        return lats, lons
+
+    def contains(self, rows: Any, cols: Any) -> np.ndarray:
+        """
+        Check which cell indices fall inside the raster.
+
+        Args:
+            rows, cols: Cell indices
+
+        Returns:
+            Boolean mask
+        """
+        rows = np.asarray(rows)
+        cols = np.asarray(cols)
+
+        return (rows >= 0) & (rows < self.height) & (cols >= 0) & (cols < self.width)
+
+    def sample(
+        self,
+        array: np.ndarray,
+        lats: Any,
+        lons: Any,
+        method: str = "nearest",
+        fill: float = np.nan,
+    ) -> np.ndarray:
+        """
+        Sample a raster aligned with this grid at many coordinates.
+
+        Args:
+            array: 2D array with the grid's shape
+            lats, lons: Coordinates (scalars or arrays)
+            method: "nearest" (containing cell) or "bilinear" (between cell centers)
+            fill: Value returned for points outside the raster
+
+        Returns:
+            Float array of sampled values
+        """
+        if method not in RASTER_SAMPLE_METHODS:
+            raise ValueError(
+                f"Unknown sample method '{method}', expected one of {RASTER_SAMPLE_METHODS}"
+            )
+
+        rows, cols = self.fractional_rowcol(lats, lons)
+        row_idx = np.floor(rows).astype(np.int64)
+        col_idx = np.floor(cols).astype(np.int64)
+
+        inside = self.contains(row_idx, col_idx)
+        values = np.full(rows.shape, fill, dtype=float)
+
+        if method == "nearest":
+            values[inside] = array[row_idx[inside], col_idx[inside]]
+            return values
+
+        center_rows = np.clip(rows[inside] - 0.5, 0, self.height - 1)
+        center_cols = np.clip(cols[inside] - 0.5, 0, self.width - 1)
+
+        row0 = np.floor(center_rows).astype(np.int64)
+        col0 = np.floor(center_cols).astype(np.int64)
+        row1 = np.minimum(row0 + 1, self.height - 1)
+        col1 = np.minimum(col0 + 1, self.width - 1)
+
+        weight_row = center_rows - row0
+        weight_col = center_cols - col0
+
+        top = (1 - weight_col) * array[row0, col0] + weight_col * array[row0, col1]
+        bottom = (1 - weight_col) * array[row1, col0] + weight_col * array[row1, col1]
+
+        values[inside] = (1 - weight_row) * top + weight_row * bottom
+
+        return values
+
+    def sample_along_paths(
+        self,
+        array: np.ndarray,
+        path_lats: List[np.ndarray],
+        path_lons: List[np.ndarray],
+        reduction: str = "max",
+        spacing_m: float = 30.0,
+    ) -> np.ndarray:
+        """
+        Sample a raster along polylines and reduce to one value per path.
+
+        All paths are densified and sampled together: segments are split into
+        pieces of about spacing_m, the raster is read at each piece's midpoint
+        and pieces are reduced per path with a max or a length-weighted mean.
+
+        Args:
+            array: 2D array with the grid's shape
+            path_lats, path_lons: Vertex coordinates of each path
+            reduction: "max" (largest sample) or "mean" (length-weighted)
+            spacing_m: Target distance between samples (m)
+
+        Returns:
+            Value per path (0 for degenerate or out-of-bounds paths)
+        """
+        if reduction not in RASTER_PATH_REDUCTIONS:
+            raise ValueError(
+                f"Unknown path reduction '{reduction}', expected one of {RASTER_PATH_REDUCTIONS}"
+            )
+
+        num_paths = len(path_lats)
+
+        if num_paths == 0:
+            return np.zeros(0)
+
+        lengths = np.array([len(lats) for lats in path_lats])
+        lats = np.concatenate([np.asarray(v, dtype=float) for v in path_lats])
+        lons = np.concatenate([np.asarray(v, dtype=float) for v in path_lons])
+        vertex_path = np.repeat(np.arange(num_paths), lengths)
+
+        # Segments join consecutive vertices of the same path
+        same_path = vertex_path[1:] == vertex_path[:-1]
+        seg_start = np.flatnonzero(same_path)
+        seg_path = vertex_path[seg_start]
+
+        seg_m = haversine_distances(
+            lats[seg_start], lons[seg_start], lats[seg_start + 1], lons[seg_start + 1]
+        ) * 1000
+        pieces = np.maximum(np.ceil(seg_m / spacing_m), 1).astype(np.int64)
+
+        sample_seg = np.repeat(np.arange(len(seg_start)), pieces)
+        piece_index = np.arange(len(sample_seg)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        t = (piece_index + 0.5) / pieces[sample_seg]
+
+        start = seg_start[sample_seg]
+        sample_lats = lats[start] + t * (lats[start + 1] - lats[start])
+        sample_lons = lons[start] + t * (lons[start + 1] - lons[start])
+
+        values = self.sample(array, sample_lats, sample_lons)
+        sample_path = seg_path[sample_seg]
+        valid = ~np.isnan(values)
+
+        if reduction == "max":
+            reduced = np.full(num_paths, -np.inf)
+            np.maximum.at(reduced, sample_path[valid], values[valid])
+
+            has_sample = np.bincount(sample_path[valid], minlength=num_paths) > 0
+            reduced[~has_sample] = 0.0
+        else:
+            reduced = np.zeros(num_paths)
+            weights = (seg_m / pieces)[sample_seg] * valid
+            total = np.bincount(sample_path, weights=weights, minlength=num_paths)
+            weighted = np.bincount(
+                sample_path, weights=weights * np.nan_to_num(values), minlength=num_paths
+            )
+            np.divide(weighted, total, out=reduced, where=total > 0)
+
+        return reduced
+
+    def cell_size_m(self) -> Tuple[float, float]:
+        """
+        Approximate cell size on the ground at the raster's center latitude.
+
+        Returns:
+            Tuple of (cell_height_m, cell_width_m)
+        """
+        lat = (self.bounds["north"] + self.bounds["south"]) / 2
+
+        cell_height_m = abs(self.e) * 111320.0
+        cell_width_m = abs(self.a) * 111320.0 * np.cos(np.radians(lat))
+
+        return cell_height_m, float(cell_width_m)
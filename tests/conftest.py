@@ -0,0 +1,13 @@
+"""Shared test fixtures."""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def ridge_elevation():
+    """Smooth synthetic ridge DEM (60x60) with real occlusion structure."""
+    x = np.linspace(0, 2 * np.pi, 60)
+    xx, yy = np.meshgrid(x, x)
+
+    return 200 + 50 * np.sin(xx) * np.cos(yy) + 30 * np.sin(2 * xx)
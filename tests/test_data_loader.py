@@ -0,0 +1,66 @@
+"""Tests for data loading utilities."""
+
+import numpy as np
+import pytest
+
+from ghost_supply.perception.terrain import TerrainAnalyzer
+from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
+from ghost_supply.utils.data_loader import DataLoader
+
+SUB_BOUNDS = {"north": 48.31, "south": 48.29, "east": 37.26, "west": 37.24}
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Create data loader with a synthetic DEM on disk."""
+    data_loader = DataLoader(str(tmp_path))
+    data_loader.create_synthetic_dem(STUDY_AREA_BOUNDS, save=True)
+
+    return data_loader
+
+
+def test_windowed_dem_load(loader):
+    """Test only the window covering the bounds is read."""
+    full, full_transform = loader.load_dem()
+    window, transform = loader.load_dem(bounds=SUB_BOUNDS)
+
+    assert window.shape[0] < full.shape[0] and window.shape[1] < full.shape[1]
+
+    col_off, row_off = ~full_transform * (transform.c, transform.f)
+    row_off, col_off = int(round(row_off)), int(round(col_off))
+
+    np.testing.assert_array_equal(
+        window, full[row_off:row_off + window.shape[0], col_off:col_off + window.shape[1]]
+    )
+
+
+def test_memmap_dem_matches_in_memory(loader):
+    """Test strip-streamed memory map equals the in-memory read."""
+    in_memory, transform = loader.load_dem(decimation=3)
+    mapped, mapped_transform = loader.load_dem(decimation=3, memmap=True, strip_rows=5)
+
+    assert isinstance(mapped, np.memmap)
+    assert mapped_transform == transform
+    np.testing.assert_allclose(mapped, in_memory)
+
+
+def test_decimated_dem_cell_size(loader):
+    """Test terrain analysis reads the decimated cell size from the transform."""
+    full, full_transform = loader.load_dem()
+    coarse, transform = loader.load_dem(decimation=3)
+
+    fine = TerrainAnalyzer(full, full_transform, STUDY_AREA_BOUNDS)
+    terrain = TerrainAnalyzer(coarse, transform, STUDY_AREA_BOUNDS)
+    assert terrain.resolution_m == pytest.approx(3 * fine.resolution_m, rel=0.05)
+
+    # 10 % grade to the north: same slope whatever the cell size
+    rows = np.arange(coarse.shape[0], dtype=float)[:, None]
+    plane = np.broadcast_to(-0.1 * terrain.cell_height_m * rows, coarse.shape).copy()
+    slope = TerrainAnalyzer(plane, transform, STUDY_AREA_BOUNDS).calculate_slope()
+
+    np.testing.assert_allclose(slope, np.degrees(np.arctan(0.1)))
+
+
+def test_dem_outside_bounds(loader):
+    """Test non-overlapping bounds return None."""
+    assert loader.load_dem(bounds={"north": 10.0, "south": 9.0, "east": 10.0, "west": 9.0}) is None
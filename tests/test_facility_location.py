@@ -0,0 +1,32 @@
+"""Tests for depot selection."""
+
+import pytest
+
+from ghost_supply.decision.facility_location import select_depots
+from ghost_supply.perception.rf_propagation import RFPropagationModel
+from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
+
+
+@pytest.fixture
+def rf_model(ridge_elevation):
+    """Create RF model over the synthetic ridge DEM."""
+    return RFPropagationModel(ridge_elevation, STUDY_AREA_BOUNDS)
+
+
+def test_covered_depot_outranks_uncovered(rf_model):
+    """Test a depot next to a base station ranks above an otherwise equal one out of coverage."""
+    base_stations = [(48.28, 37.23)]
+    candidates = [
+        (48.324, 37.274, "Far", 0.8, 0.8),
+        (48.281, 37.231, "Covered", 0.8, 0.8),
+    ]
+
+    # Both candidates 15-25 km from the front: equal distance scores
+    depots = select_depots(
+        candidates, 48.5, 37.25, num_depots=2, min_separation_km=0.0,
+        rf_model=rf_model, base_stations=base_stations,
+    )
+
+    assert [depot.name for depot in depots] == ["Covered", "Far"]
+    assert depots[0].rf_coverage_score == 1.0
+    assert depots[1].rf_coverage_score < 0.1
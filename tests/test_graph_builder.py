@@ -0,0 +1,141 @@
+"""Tests for graph builder."""
+
+import numpy as np
+import pytest
+
+from ghost_supply.decision.cvar_routing import CVaRRouter
+from ghost_supply.decision.graph_builder import GraphBuilder
+from ghost_supply.perception.rf_propagation import RFPropagationModel
+from ghost_supply.perception.terrain import TerrainAnalyzer
+from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
+
+
+@pytest.fixture
+def ridge_terrain(ridge_elevation):
+    """Create terrain analyzer over the synthetic ridge DEM."""
+    class MockTransform:
+        pass
+
+    return TerrainAnalyzer(ridge_elevation, MockTransform(), STUDY_AREA_BOUNDS)
+
+
+@pytest.fixture
+def rf_model(ridge_elevation):
+    """Create RF model over the synthetic ridge DEM."""
+    return RFPropagationModel(ridge_elevation, STUDY_AREA_BOUNDS)
+
+
+def synthetic_builder(*args, **kwargs):
+    """Create a graph builder holding the synthetic road grid over the study area."""
+    builder = GraphBuilder(*args, **kwargs)
+    builder.simplified_graph = builder._simplify_to_digraph(
+        builder._create_synthetic_graph(STUDY_AREA_BOUNDS)
+    )
+
+    return builder
+
+
+def edge_attribute(builder, name):
+    """Map each edge of the simplified graph to one of its attributes."""
+    return {(u, v): data.get(name) for u, v, data in builder.simplified_graph.edges(data=True)}
+
+
+def test_killzone_penalties_match_scalar():
+    """Test vectorized kill-zone penalties equal the scalar penalty per point."""
+    rng = np.random.default_rng(2)
+    kill_zones = [
+        {"center": (48.3 + rng.uniform(0, 0.2), 37.2 + rng.uniform(0, 0.3)), "radius_km": 1.5}
+        for _ in range(10)
+    ]
+    builder = GraphBuilder()
+
+    lats = rng.uniform(48.28, 48.52, 2000)
+    lons = rng.uniform(37.18, 37.52, 2000)
+
+    batch = builder._compute_killzone_penalties(lats, lons, kill_zones)
+    scalar = [
+        builder._compute_killzone_penalty(lat, lon, kill_zones) for lat, lon in zip(lats, lons)
+    ]
+
+    assert (batch > 1.0).sum() > 100
+    np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+
+
+def test_refresh_visibility_touches_only_moved_footprints(ridge_terrain):
+    """Test moving an observer only refreshes edges near its old and new positions."""
+    observers = [(48.3, 37.25), (48.28, 37.23)]
+    composite = ridge_terrain.create_composite_viewshed(observers, max_distance_km=1.0)
+
+    builder = synthetic_builder(ridge_terrain)
+    builder.enrich_graph(viewshed=composite.viewshed, slope_reduction=None)
+    assert builder.refresh_visibility(composite) == 0
+
+    before = edge_attribute(builder, "visibility")
+    old_rows, old_cols, _ = composite.layers[1]
+    composite.move_observer(1, 48.32, 37.27)
+    new_rows, new_cols, _ = composite.layers[1]
+
+    updated = builder.refresh_visibility(composite)
+    after = edge_attribute(builder, "visibility")
+    changed = [edge for edge in before if after[edge] != before[edge]]
+
+    assert updated == len(changed) > 0
+
+    nodes = builder.simplified_graph.nodes
+    for u, v in changed:
+        row, col = ridge_terrain.grid.rowcol(
+            (nodes[u]["y"] + nodes[v]["y"]) / 2, (nodes[u]["x"] + nodes[v]["x"]) / 2
+        )
+        assert any(
+            rows.start <= row < rows.stop and cols.start <= col < cols.stop
+            for rows, cols in [(old_rows, old_cols), (new_rows, new_cols)]
+        )
+
+    # Edges seen by the unmoved observer keep their visibility
+    assert any(after[edge] > 0 and edge not in changed for edge in after)
+
+    full = synthetic_builder(ridge_terrain)
+    full.enrich_graph(viewshed=composite.viewshed, slope_reduction=None)
+    assert after == edge_attribute(full, "visibility")
+
+
+def test_rf_shadows_reach_edges_and_cvar_cost(rf_model):
+    """Test the RF shadow fraction lands on edges and lowers their CVaR risk."""
+    coverage = rf_model.calculate_coverage_map([(48.3, 37.25)], tx_power_dbm=20.0)
+    shadows = rf_model.analyze_shadow_zones(coverage)
+
+    builder = synthetic_builder(rf_model=rf_model)
+    builder.enrich_graph(rf_shadows=shadows, slope_reduction=None)
+
+    edges = list(builder.simplified_graph.edges(data=True))
+    path_lats, path_lons = builder._edge_paths(edges)
+    fractions = np.array([data["rf_shadow_fraction"] for _, _, data in edges])
+
+    np.testing.assert_allclose(fractions, shadows.edge_fractions(path_lats, path_lons))
+    assert fractions.min() == 0.0 and fractions.max() == 1.0
+
+    router = CVaRRouter(builder.simplified_graph, num_scenarios=10)
+    scenario = {"visibility_mult": 1.0, "detection_mult": 1.0, "patrol_presence": 1.0}
+
+    u, v, data = edges[int(np.argmax(fractions))]
+    shadowed_risk = router._get_edge_risk((u, v), scenario, 7.0)
+    data.pop("rf_shadow_fraction")
+
+    assert shadowed_risk < router._get_edge_risk((u, v), scenario, 7.0)
+
+
+def test_sparse_edge_visibility_matches_dense_viewshed(ridge_terrain):
+    """Test point visibility at edge midpoints equals sampling the full LOS viewshed."""
+    observers = [(48.3, 37.25), (48.28, 37.23)]
+
+    sparse = synthetic_builder(ridge_terrain)
+    sparse.enrich_graph(observer_positions=observers, slope_reduction=None)
+
+    dense = synthetic_builder(ridge_terrain)
+    dense.enrich_graph(
+        viewshed=ridge_terrain.calculate_viewshed(observers, method="los"), slope_reduction=None
+    )
+
+    visibility = edge_attribute(sparse, "visibility")
+    assert visibility == edge_attribute(dense, "visibility")
+    assert 0 < sum(value > 0 for value in visibility.values()) < len(visibility)
@@ -0,0 +1,73 @@
+"""Tests for georeferenced raster grid."""
+
+import numpy as np
+import pytest
+from rasterio.transform import from_bounds
+
+from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
+from ghost_supply.utils.raster import RasterGrid
+
+
+@pytest.fixture
+def grid():
+    """Create grid from a rasterio transform over the study area."""
+    bounds = STUDY_AREA_BOUNDS
+    transform = from_bounds(
+        bounds["west"], bounds["south"], bounds["east"], bounds["north"], 40, 50
+    )
+
+    return RasterGrid((50, 40), bounds, transform)
+
+
+def test_transform_matches_bounds_fallback(grid):
+    """Test transform-based and bounds-based grids agree."""
+    fallback = RasterGrid((50, 40), STUDY_AREA_BOUNDS)
+
+    lats = np.random.uniform(STUDY_AREA_BOUNDS["south"], STUDY_AREA_BOUNDS["north"], 200)
+    lons = np.random.uniform(STUDY_AREA_BOUNDS["west"], STUDY_AREA_BOUNDS["east"], 200)
+
+    for expected, actual in zip(grid.rowcol(lats, lons), fallback.rowcol(lats, lons)):
+        np.testing.assert_array_equal(expected, actual)
+
+
+def test_rowcol_roundtrip(grid):
+    """Test cell centers map back to their cells."""
+    rows, cols = np.meshgrid(np.arange(50), np.arange(40), indexing="ij")
+
+    lats, lons = grid.xy(rows, cols)
+    back_rows, back_cols = grid.rowcol(lats, lons)
+
+    np.testing.assert_array_equal(back_rows, rows)
+    np.testing.assert_array_equal(back_cols, cols)
+
+
+def test_sample_nearest_and_bilinear(grid):
+    """Test sampling modes and out-of-bounds fill."""
+    rows, cols = np.meshgrid(np.arange(50), np.arange(40), indexing="ij")
+    array = 2.0 * rows + 3.0 * cols
+
+    lats, lons = grid.xy(np.array([10.0, 10.25]), np.array([20.0, 20.25]))
+
+    np.testing.assert_allclose(grid.sample(array, lats, lons), [80.0, 80.0])
+    np.testing.assert_allclose(grid.sample(array, lats, lons, method="bilinear"), [80.0, 81.25])
+
+    outside = grid.sample(array, [0.0], [0.0], fill=-1.0)
+    assert outside[0] == -1.0
+
+    with pytest.raises(ValueError):
+        grid.sample(array, lats, lons, method="cubic")
+
+
+def test_sample_along_paths_keeps_negative_maximum(grid):
+    """Test max reduction does not clamp negative rasters (e.g. dBm) to zero."""
+    signal = np.full((50, 40), -95.0)
+    signal[:, 20:] = -70.0
+
+    lats, lons = grid.xy(np.array([25, 25, 25]), np.array([2, 10, 30]))
+    east = STUDY_AREA_BOUNDS["east"]
+    path_lats = [lats[:2], lats[[0, 2]], lats[:2]]
+    path_lons = [lons[:2], lons[[0, 2]], np.array([east + 1.0, east + 1.1])]
+
+    np.testing.assert_allclose(
+        grid.sample_along_paths(signal, path_lats, path_lons, reduction="max"), [-95.0, -70.0, 0.0]
+    )
@@ -0,0 +1,380 @@
+"""Tests for RF propagation module."""
+
+import numpy as np
+import pytest
+
+from ghost_supply.perception.rf_propagation import RFPropagationModel
+from ghost_supply.utils.constants import (
+    RF_JAMMING_TOLERANCE,
+    RF_MIN_SIGNAL_DBM,
+    STUDY_AREA_BOUNDS,
+)
+from ghost_supply.utils.geo import haversine_distances
+
+
+@pytest.fixture
+def rf_model(ridge_elevation):
+    """Create RF model over a smooth synthetic ridge terrain."""
+    return RFPropagationModel(ridge_elevation, STUDY_AREA_BOUNDS, resolution_m=100.0)
+
+
+def test_horizon_shadow_matches_line_of_sight(rf_model):
+    """Test horizon-map shadowing equals the profile line-of-sight check.
+
+    Receivers sit above the LOS clearance so the profile walk does not flag
+    their own cell as an obstruction.
+    """
+    rng = np.random.default_rng(1)
+    tx = rng.integers(0, 60, size=(200, 2))
+    rx = rng.integers(0, 60, size=(200, 2))
+
+    reference = np.array([
+        rf_model._check_line_of_sight(r, c, rf_model.elevation[r, c] + 30.0,
+                                      tr, tc, rf_model.elevation[tr, tc] + 10.0)
+        for (r, c), (tr, tc) in zip(tx, rx)
+    ])
+
+    rf_model.build_horizon_map(tx_height_m=30.0)
+    fast = np.array([
+        rf_model._line_of_sight_clear(r, c, rf_model.elevation[r, c] + 30.0,
+                                      tr, tc, rf_model.elevation[tr, tc] + 10.0)
+        for (r, c), (tr, tc) in zip(tx, rx)
+    ])
+
+    np.testing.assert_array_equal(fast, reference)
+
+
+def test_is_shadowed_outside_area(rf_model):
+    """Test points outside the raster are reported as shadowed."""
+    assert rf_model.is_shadowed(0.0, 0.0, 48.3, 37.25) is True
+
+
+def test_vectorized_coverage_matches_scalar(rf_model):
+    """Test the NumPy coverage kernel reproduces the per-cell reference."""
+    stations = [(48.3, 37.25), (48.285, 37.235)]
+
+    scalar = rf_model.calculate_coverage_map(stations, method="scalar")
+    vectorized = rf_model.calculate_coverage_map(stations, method="vectorized")
+
+    np.testing.assert_allclose(vectorized, scalar, atol=0.1)
+
+
+def test_coverage_unknown_method(rf_model):
+    """Test unknown coverage method is rejected."""
+    with pytest.raises(ValueError):
+        rf_model.calculate_coverage_map([(48.3, 37.25)], method="itm")
+
+
+def test_radial_coverage_close_to_vectorized(rf_model):
+    """Test radial ray marching approximates the per-cell profile kernel."""
+    stations = [(48.3, 37.25)]
+
+    vectorized = rf_model.calculate_coverage_map(stations, method="vectorized")
+    radial = rf_model.calculate_coverage_map(stations, method="radial")
+
+    assert np.median(np.abs(radial - vectorized)) < 1.0
+    assert np.mean((radial > -90) == (vectorized > -90)) > 0.95
+
+
+def test_profile_reductions_match_scalar_helpers(rf_model):
+    """One extracted profile reproduces the LOS, diffraction and irregularity helpers."""
+    rng = np.random.default_rng(3)
+    tx_row, tx_col = 30, 30
+    tx_elev = rf_model.elevation[tx_row, tx_col] + 10.0
+
+    rx_rows = rng.integers(0, rf_model.height, size=200)
+    rx_cols = rng.integers(0, rf_model.width, size=200)
+    rx_elev = rf_model.elevation[rx_rows, rx_cols] + 10.0
+
+    profiles = rf_model.extract_profiles(tx_row, tx_col, rx_rows, rx_cols)
+    assert profiles.shape == (200, 101)
+
+    obstruction, blocked = rf_model._profile_obstruction(
+        profiles, tx_row, tx_col, tx_elev, rx_rows, rx_cols, rx_elev
+    )
+    diffraction = np.where(blocked, rf_model._diffraction_losses(obstruction, 900), 0.0)
+    irregularity = rf_model._terrain_irregularity_factors(profiles)
+
+    for k, (row, col) in enumerate(zip(rx_rows, rx_cols)):
+        los = rf_model._check_line_of_sight(tx_row, tx_col, tx_elev, row, col, rx_elev[k])
+        assert blocked[k] == (not los)
+
+        expected = 0.0 if los else rf_model._knife_edge_diffraction_loss(
+            tx_row, tx_col, tx_elev, row, col, rx_elev[k], 900
+        )
+        assert diffraction[k] == pytest.approx(expected)
+        assert irregularity[k] == pytest.approx(
+            rf_model._terrain_irregularity_factor(tx_row, tx_col, row, col)
+        )
+
+
+def test_parallel_coverage_matches_serial(rf_model):
+    """Process-pool coverage equals the serial maximum over stations."""
+    lats = np.linspace(STUDY_AREA_BOUNDS["south"] + 0.005, STUDY_AREA_BOUNDS["north"] - 0.005, 3)
+    lons = np.linspace(STUDY_AREA_BOUNDS["west"] + 0.005, STUDY_AREA_BOUNDS["east"] - 0.005, 3)
+    stations = list(zip(lats, lons))
+
+    parallel = rf_model.calculate_coverage_map(stations, method="radial", n_jobs=2)
+    assert len(rf_model.station_cache) == 3
+
+    serial_model = RFPropagationModel(rf_model.elevation, STUDY_AREA_BOUNDS, resolution_m=100.0)
+    serial = serial_model.calculate_coverage_map(stations, method="radial")
+
+    np.testing.assert_allclose(parallel, serial)
+
+    # Second call is served from the per-station cache
+    np.testing.assert_array_equal(
+        rf_model.calculate_coverage_map(stations, method="radial"), parallel
+    )
+
+
+def test_coverage_ignores_horizon_map(rf_model):
+    """Coverage maps read LOS from their profiles, with or without a horizon map."""
+    stations = [(48.3, 37.25), (48.35, 37.3)]
+    expected = rf_model.calculate_coverage_map(stations, method="vectorized")
+
+    rf_model.build_horizon_map()
+    rf_model.station_cache.clear()
+
+    parallel = rf_model.calculate_coverage_map(stations, method="vectorized", n_jobs=2)
+    rf_model.station_cache.clear()
+    serial = rf_model.calculate_coverage_map(stations, method="vectorized")
+
+    np.testing.assert_array_equal(parallel, expected)
+    np.testing.assert_array_equal(serial, expected)
+
+
+@pytest.mark.parametrize("method", ["vectorized", "radial"])
+def test_range_limited_coverage_keeps_useful_cells(rf_model, method):
+    """Windowed evaluation only drops cells below the minimum useful signal."""
+    station = [(48.3, 37.25)]
+
+    full = rf_model.calculate_coverage_map(station, tx_power_dbm=0.0, method=method)
+    limited = rf_model.calculate_coverage_map(
+        station, tx_power_dbm=0.0, method=method, range_limited=True
+    )
+
+    useful = full > RF_MIN_SIGNAL_DBM
+    assert useful.any()
+    np.testing.assert_allclose(limited[useful], full[useful], atol=0.05)
+
+    # Radial rays depend on the window radius, hence the tolerance
+    evaluated = limited > -200.0
+    assert evaluated.sum() < evaluated.size // 4
+    np.testing.assert_allclose(limited[evaluated], full[evaluated], atol=0.5)
+
+
+def test_coverage_store_reloads_station_maps(rf_model, tmp_path):
+    """A new model with the same cache directory loads maps instead of recomputing."""
+    stations = [(48.3, 37.25), (48.31, 37.24)]
+
+    first = RFPropagationModel(
+        rf_model.elevation, STUDY_AREA_BOUNDS, resolution_m=100.0, cache_dir=str(tmp_path)
+    )
+    expected = first.calculate_coverage_map(stations)
+    assert len(list((tmp_path / "rf_coverage").glob("*.npy"))) == 2
+
+    second = RFPropagationModel(
+        rf_model.elevation, STUDY_AREA_BOUNDS, resolution_m=100.0, cache_dir=str(tmp_path)
+    )
+    second._calculate_station = None  # any recomputation would fail
+
+    np.testing.assert_allclose(second.calculate_coverage_map(stations), expected, atol=0.01)
+
+
+def test_jamming_picture_tracks_added_and_removed_jammers(rf_model):
+    """Incremental jammer updates match a full recomputation."""
+    coverage = rf_model.calculate_coverage_map([(48.3, 37.25)], tx_power_dbm=0.0)
+    jammers = [(48.28, 37.23), (48.32, 37.27), (48.3, 37.26)]
+
+    picture = rf_model.create_jamming_picture(coverage)
+    ids = [picture.add_jammer(lat, lon) for lat, lon in jammers]
+
+    np.testing.assert_allclose(
+        picture.vulnerability, rf_model.calculate_jamming_vulnerability(coverage, jammers),
+        atol=2 * RF_JAMMING_TOLERANCE,
+    )
+
+    picture.pop_dirty()
+    picture.remove_jammer(ids[1])
+
+    assert picture.num_jammers == 2
+    assert picture.pop_dirty() is not None
+    np.testing.assert_allclose(
+        picture.vulnerability,
+        rf_model.calculate_jamming_vulnerability(coverage, [jammers[0], jammers[2]]),
+        atol=2 * RF_JAMMING_TOLERANCE,
+    )
+
+    with pytest.raises(ValueError):
+        picture.remove_jammer(ids[1])
+
+
+def test_jamming_picture_crops_footprint(rf_model):
+    """A weak jammer's layer covers only the cells it can make more vulnerable."""
+    coverage = rf_model.calculate_coverage_map([(48.3, 37.25)], tx_power_dbm=0.0)
+
+    picture = rf_model.create_jamming_picture(coverage, jammer_power_dbm=-80.0)
+    before = picture.vulnerability.copy()
+    jammer_id = picture.add_jammer(48.28, 37.23)
+
+    rows, cols, layer = picture.layers[jammer_id]
+    assert layer.dtype == np.int16
+    assert layer.size < rf_model.height * rf_model.width
+
+    far_row, far_col = rf_model._latlon_to_rowcol(48.32, 37.27)
+    assert not (rows.start <= far_row < rows.stop and cols.start <= far_col < cols.stop)
+    assert picture.vulnerability[far_row, far_col] == before[far_row, far_col]
+
+    np.testing.assert_allclose(
+        picture.vulnerability,
+        rf_model.calculate_jamming_vulnerability(coverage, [(48.28, 37.23)], -80.0),
+        atol=2 * RF_JAMMING_TOLERANCE,
+    )
+
+
+@pytest.mark.parametrize("method", ["vectorized", "radial"])
+def test_coverage_stack_matches_per_frequency_maps(rf_model, method):
+    """Each band of the stack equals a separate coverage run at that frequency."""
+    stations = [(48.3, 37.25), (48.28, 37.24)]
+    frequencies = [2400.0, 900.0]
+
+    stack = rf_model.calculate_coverage_stack(stations, frequencies, method=method)
+    assert stack.shape == (2, rf_model.height, rf_model.width)
+
+    for band, frequency in enumerate(frequencies):
+        fresh = RFPropagationModel(rf_model.elevation, STUDY_AREA_BOUNDS, resolution_m=100.0)
+        np.testing.assert_allclose(
+            stack[band],
+            fresh.calculate_coverage_map(stations, frequency_mhz=frequency, method=method),
+        )
+
+
+@pytest.mark.parametrize("method", ["vectorized", "radial"])
+def test_range_limited_stack_matches_per_frequency_maps(rf_model, method):
+    """Range-limited bands equal separate runs, and so do the maps cached by the stack."""
+    stations = [(48.3, 37.25)]
+    frequencies = [2400.0, 900.0]
+    kwargs = dict(tx_power_dbm=0.0, method=method, range_limited=True)
+
+    stack = rf_model.calculate_coverage_stack(stations, frequencies, **kwargs)
+
+    for band, frequency in enumerate(frequencies):
+        fresh = RFPropagationModel(rf_model.elevation, STUDY_AREA_BOUNDS, resolution_m=100.0)
+        expected = fresh.calculate_coverage_map(stations, frequency_mhz=frequency, **kwargs)
+
+        np.testing.assert_allclose(stack[band], expected)
+        np.testing.assert_allclose(
+            rf_model.calculate_coverage_map(stations, frequency_mhz=frequency, **kwargs), expected
+        )
+
+
+def test_point_path_loss_matches_per_cell_model(rf_model):
+    """Batched point-to-point losses equal the per-cell path loss."""
+    rng = np.random.default_rng(5)
+    rows = rng.integers(0, rf_model.height, size=50)
+    cols = rng.integers(0, rf_model.width, size=50)
+    rx_lats, rx_lons = rf_model.grid.xy(rows, cols)
+
+    tx = (48.3, 37.25)
+    tx_row, tx_col = rf_model._latlon_to_rowcol(*tx)
+
+    loss = rf_model.path_loss([tx], np.column_stack([rx_lats, rx_lons]), frequency_mhz=900.0)
+
+    distance_km = haversine_distances(tx[0], tx[1], rx_lats, rx_lons)
+    for k in range(50):
+        if distance_km[k] < 0.01:
+            continue
+        expected = rf_model._calculate_path_loss(
+            tx_row, tx_col, rf_model.elevation[tx_row, tx_col] + 10.0,
+            rows[k], cols[k], rf_model.elevation[rows[k], cols[k]] + 50.0,
+            distance_km[k], 900.0,
+        )
+        assert loss[k] == pytest.approx(expected)
+
+    outside = rf_model.path_loss([tx], [(0.0, 0.0)])
+    assert np.isinf(outside[0])
+
+
+def test_scalar_path_loss_ignores_horizon_map(rf_model, monkeypatch):
+    """The scalar reference walks the profile even with a horizon map loaded."""
+    tx_row, tx_col = 30, 30
+    rx_rows, rx_cols = np.arange(0, 60, 6), np.arange(59, 0, -6)
+
+    def losses():
+        return [
+            rf_model._calculate_path_loss(
+                tx_row, tx_col, rf_model.elevation[tx_row, tx_col] + 10.0,
+                r, c, rf_model.elevation[r, c] + 2.0, 1.0, 900.0,
+            )
+            for r, c in zip(rx_rows, rx_cols)
+        ]
+
+    expected = losses()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("horizon map consulted by the scalar reference")
+
+    rf_model.build_horizon_map(tx_height_m=10.0)
+    monkeypatch.setattr(rf_model.horizon_map, "is_visible", fail)
+
+    assert losses() == expected
+
+
+def test_signal_at_points_close_to_coverage_map(rf_model):
+    """Best-server signal at points agrees with the coverage raster."""
+    stations = [(48.3, 37.25), (48.28, 37.24)]
+    coverage = rf_model.calculate_coverage_map(stations)
+
+    rows, cols = np.meshgrid(np.arange(0, 60, 7), np.arange(0, 60, 7), indexing="ij")
+    lats, lons = rf_model.grid.xy(rows.ravel(), cols.ravel(), offset="ul")
+    lats, lons = lats - 1e-9, lons + 1e-9  # stay inside the cell
+
+    signal = rf_model.signal_at_points(stations, lats, lons)
+
+    np.testing.assert_allclose(signal, coverage[rows.ravel(), cols.ravel()], atol=0.01)
+    assert rf_model.signal_at_points([], lats, lons).max() == -200.0
+
+
+def test_adaptive_coverage_close_to_full_resolution(rf_model):
+    """Coarse-to-fine coverage keeps threshold crossings and reports its error."""
+    stations = [(48.3, 37.25), (48.28, 37.24)]
+    full = rf_model.calculate_coverage_map(stations)
+
+    result = rf_model.calculate_coverage_adaptive(stations, block_cells=6)
+
+    assert 0.0 < result.refined_fraction < 1.0
+    assert result.num_validation_cells > 0
+
+    error = np.abs(result.coverage_map - full)
+    assert np.median(error) < 1.0
+    assert ((result.coverage_map > RF_MIN_SIGNAL_DBM) == (full > RF_MIN_SIGNAL_DBM)).mean() > 0.99
+    assert result.mean_abs_error_db < 1.0
+
+    with pytest.raises(ValueError):
+        rf_model.calculate_coverage_adaptive(stations, block_cells=1)
+
+
+def test_shadow_overlay_regions_depth_and_edge_fraction(rf_model):
+    """Shadow regions are labelled, measured and projected on paths."""
+    coverage = np.full(rf_model.elevation.shape, -50.0)
+    coverage[:, 30:] = -120.0  # east half in shadow
+    coverage[5, 5] = -120.0  # isolated cell
+
+    overlay = rf_model.analyze_shadow_zones(coverage)
+    assert overlay.num_regions == 2
+    assert overlay.depth_m[5, 5] > 0
+    assert overlay.depth_m[~overlay.mask].max() == 0
+    assert overlay.depth_m[:, 59].min() > overlay.depth_m[:, 31].max()
+
+    assert rf_model.analyze_shadow_zones(coverage, min_region_cells=2).num_regions == 1
+
+    lat = (STUDY_AREA_BOUNDS["north"] + STUDY_AREA_BOUNDS["south"]) / 2
+    west, east = STUDY_AREA_BOUNDS["west"] + 1e-6, STUDY_AREA_BOUNDS["east"] - 1e-6
+    middle = (west + east) / 2
+
+    fractions = overlay.edge_fractions(
+        [np.full(2, lat), np.full(2, lat), np.full(2, lat)],
+        [np.array([west, east]), np.array([middle, east]), np.array([west, middle - 0.001])],
+    )
+    np.testing.assert_allclose(fractions, [0.5, 1.0, 0.0], atol=0.03)
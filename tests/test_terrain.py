@@ -3,6 +3,7 @@
 import numpy as np
 import pytest
 
+from ghost_supply.decision.graph_builder import GraphBuilder
 from ghost_supply.perception.terrain import TerrainAnalyzer
 from ghost_supply.utils.constants import STUDY_AREA_BOUNDS
 
@@ -50,6 +51,180 @@ def test_viewshed_calculation(simple_terrain):
     assert np.all(viewshed <= 1)
 
 
+def test_sweep_viewshed_matches_los_reference(ridge_elevation):
+    """Test sweep engine agrees with the per-cell LOS reference."""
+    class MockTransform:
+        pass
+
+    terrain = TerrainAnalyzer(ridge_elevation, MockTransform(), STUDY_AREA_BOUNDS)
+    observer_positions = [(48.3, 37.25)]
+
+    sweep = terrain.calculate_viewshed(observer_positions, method="sweep")
+    reference = terrain.calculate_viewshed(observer_positions, method="los")
+
+    assert sweep.shape == reference.shape
+    assert set(np.unique(sweep)) <= {0.0, 1.0}
+    assert (sweep == reference).mean() > 0.9
+
+
+def test_parallel_viewshed_matches_serial(simple_terrain):
+    """Test process-pool viewshed reduces to the serial composite."""
+    observer_positions = [(48.3, 37.25), (48.28, 37.23), (48.32, 37.27)]
+
+    serial = simple_terrain.calculate_viewshed(observer_positions)
+    simple_terrain.viewshed_cache.clear()
+    parallel = simple_terrain.calculate_viewshed(observer_positions, n_jobs=2)
+
+    np.testing.assert_allclose(parallel, serial)
+
+
+def test_persistent_viewshed_cache(tmp_path):
+    """Test viewsheds are reloaded from disk and keyed by all parameters."""
+    elevation = np.random.rand(60, 60) * 200 + 100
+    observer_positions = [(48.3, 37.25)]
+
+    class MockTransform:
+        pass
+
+    first = TerrainAnalyzer(elevation, MockTransform(), STUDY_AREA_BOUNDS, cache_dir=str(tmp_path))
+    viewshed = first.calculate_viewshed(observer_positions)
+    assert len(list((tmp_path / "viewshed").glob("*.npy"))) == 1
+
+    second = TerrainAnalyzer(elevation, MockTransform(), STUDY_AREA_BOUNDS, cache_dir=str(tmp_path))
+    np.testing.assert_array_equal(second.calculate_viewshed(observer_positions), viewshed)
+    assert len(list((tmp_path / "viewshed").glob("*.npy"))) == 1
+
+    second.calculate_viewshed(observer_positions, observer_height=30.0)
+    assert len(list((tmp_path / "viewshed").glob("*.npy"))) == 2
+
+
+@pytest.mark.parametrize("noise_m", [0.0, 10.0])
+def test_horizon_map_matches_line_of_sight(ridge_elevation, noise_m):
+    """Test horizon-map visibility equals dense line-of-sight checks.
+
+    Precision and recall against the profile walk must both be 1; the probes
+    must settle most hidden pairs without the full walk.
+    """
+    elevation = ridge_elevation + np.random.default_rng(2).normal(0, noise_m, (60, 60))
+
+    class MockTransform:
+        pass
+
+    terrain = TerrainAnalyzer(elevation, MockTransform(), STUDY_AREA_BOUNDS)
+    horizon_map = terrain.build_horizon_map(observer_height=10.0)
+
+    rng = np.random.default_rng(0)
+    observers = rng.integers(0, 60, size=(500, 2))
+    targets = rng.integers(0, 60, size=(500, 2))
+    num_samples = np.maximum(2, (3 * np.hypot(*(targets - observers).T)).astype(int))
+
+    reference = np.array([
+        terrain._check_line_of_sight(
+            r, c, elevation[r, c] + 10.0, tr, tc, elevation[tr, tc] + 2.0, num_samples=n,
+        )
+        for (r, c), (tr, tc), n in zip(observers, targets, num_samples)
+    ])
+
+    args = (observers[:, 0], observers[:, 1], targets[:, 0], targets[:, 1], 2.0, num_samples)
+    fast = horizon_map.is_visible(*args)
+    probed = horizon_map.probe_hidden(*args)
+
+    true_positive = np.sum(fast & reference)
+    assert true_positive / fast.sum() == 1.0
+    assert true_positive / reference.sum() == 1.0
+    np.testing.assert_array_equal(fast, reference)
+
+    assert not np.any(probed & reference)
+    assert probed.sum() > 0.8 * np.sum(~reference)
+
+    assert isinstance(terrain.is_visible(48.3, 37.25, 48.28, 37.23, observer_height=10.0), bool)
+
+
+def test_visibility_at_points_matches_raster(ridge_elevation):
+    """Test sparse target visibility equals the LOS raster at the same cells."""
+    class MockTransform:
+        pass
+
+    terrain = TerrainAnalyzer(ridge_elevation, MockTransform(), STUDY_AREA_BOUNDS)
+    observer_positions = [(48.3, 37.25), (48.4, 37.1)]
+
+    rows, cols = np.meshgrid(np.arange(0, 60, 7), np.arange(0, 60, 5), indexing="ij")
+    lats, lons = terrain.grid.xy(rows.ravel(), cols.ravel())
+
+    sparse = terrain.calculate_visibility_at_points(observer_positions, lats, lons)
+    raster = terrain.calculate_viewshed(observer_positions, method="los")
+
+    np.testing.assert_allclose(sparse, raster[rows.ravel(), cols.ravel()])
+
+
+def test_composite_viewshed_incremental_updates(simple_terrain):
+    """Test add/move/remove keep the composite equal to a full recomputation."""
+    composite = simple_terrain.create_composite_viewshed([(48.3, 37.25)], max_distance_km=1.0)
+    np.testing.assert_allclose(
+        composite.viewshed, simple_terrain.calculate_viewshed([(48.3, 37.25)], max_distance_km=1.0)
+    )
+
+    observer_id = composite.add_observer(48.29, 37.24)
+    composite.move_observer(observer_id, 48.31, 37.26)
+    expected = simple_terrain.calculate_viewshed(
+        [(48.3, 37.25), (48.31, 37.26)], max_distance_km=1.0
+    )
+    np.testing.assert_allclose(composite.viewshed, expected)
+
+    assert composite.pop_dirty() is not None
+    assert composite.pop_dirty() is None
+
+    footprint_rows, footprint_cols, _ = composite.layers[0]
+    composite.remove_observer(0)
+    assert composite.pop_dirty() == (footprint_rows, footprint_cols)
+    np.testing.assert_allclose(
+        composite.viewshed, simple_terrain.calculate_viewshed([(48.31, 37.26)], max_distance_km=1.0)
+    )
+
+    with pytest.raises(ValueError):
+        composite.remove_observer(0)
+
+
+def test_composite_viewshed_move_out_of_bounds(simple_terrain):
+    """Test an out-of-bounds move raises and leaves the observer in place."""
+    composite = simple_terrain.create_composite_viewshed([(48.3, 37.25)], max_distance_km=1.0)
+    counts = composite.counts.copy()
+    composite.pop_dirty()
+
+    with pytest.raises(ValueError):
+        composite.move_observer(0, 10.0, 10.0)
+
+    assert composite.positions[0] == (48.3, 37.25)
+    assert composite.num_observers == 1
+    np.testing.assert_array_equal(composite.counts, counts)
+    assert composite.pop_dirty() is None
+
+
+def test_viewshed_cache_budget():
+    """Test layers are cached bit-packed and evicted least-recently-used."""
+    elevation = np.random.rand(100, 100) * 200 + 100
+
+    class MockTransform:
+        pass
+
+    terrain = TerrainAnalyzer(elevation, MockTransform(), STUDY_AREA_BOUNDS, cache_max_mb=0.003)
+    observers = [(48.3, 37.25), (48.29, 37.24), (48.31, 37.26)]
+
+    composite = terrain.calculate_viewshed(observers, max_distance_km=1.0)
+
+    assert len(terrain.viewshed_cache) == 2
+    assert terrain.viewshed_cache.nbytes == 2 * elevation.size // 8
+    np.testing.assert_allclose(
+        terrain.calculate_viewshed(observers, max_distance_km=1.0), composite
+    )
+
+
+def test_viewshed_unknown_method(simple_terrain):
+    """Test unknown viewshed engine is rejected."""
+    with pytest.raises(ValueError):
+        simple_terrain.calculate_viewshed([(48.3, 37.25)], method="xdraw")
+
+
 def test_mobility_speed():
     """Test mobility speed calculation."""
     elevation = np.zeros((50, 50))
@@ -70,6 +245,31 @@ def test_mobility_speed():
     assert speed_mud < speed_rain
 
 
+def test_slope_along_paths():
+    """Test slope sampling along polylines and vectorized slope penalties."""
+    ramp = np.tile(np.arange(100, dtype=float), (100, 1)) * 3.0
+
+    class MockTransform:
+        pass
+
+    terrain = TerrainAnalyzer(ramp, MockTransform(), STUDY_AREA_BOUNDS)
+    expected = np.degrees(np.arctan(3.0 / terrain.cell_width_m))
+
+    lat = (STUDY_AREA_BOUNDS["north"] + STUDY_AREA_BOUNDS["south"]) / 2
+    lons = np.linspace(STUDY_AREA_BOUNDS["west"] + 0.01, STUDY_AREA_BOUNDS["east"] - 0.01, 3)
+
+    path_lats = [np.full(3, lat), np.array([lat])]
+    path_lons = [lons, lons[:1]]
+
+    for reduction in ["max", "mean"]:
+        slopes = terrain.sample_slope_along_paths(path_lats, path_lons, reduction=reduction)
+        np.testing.assert_allclose(slopes, [expected, 0.0])
+
+    speeds = terrain.get_mobility_speeds(["primary", "track"], "clear", slopes)
+    assert speeds[0] == terrain.get_mobility_speed("primary", "clear", expected)
+    assert speeds[1] == terrain.get_mobility_speed("track", "clear", 0.0)
+
+
 def test_elevation_lookup(simple_terrain):
     """Test elevation lookup at coordinates."""
     lat = (STUDY_AREA_BOUNDS["north"] + STUDY_AREA_BOUNDS["south"]) / 2
@@ -91,3 +291,19 @@ def test_visibility_lookup(simple_terrain):
     visibility = simple_terrain.get_visibility_at(lat, lon, viewshed)
 
     assert 0 <= visibility <= 1
+
+
+def test_enrich_graph_samples_rf_coverage_without_rf_model(simple_terrain):
+    """Test an RF coverage raster is read through the terrain grid when no RF model is set."""
+    builder = GraphBuilder(simple_terrain)
+    builder.simplified_graph = builder._simplify_to_digraph(
+        builder._create_synthetic_graph(STUDY_AREA_BOUNDS)
+    )
+
+    rf_coverage = np.full(simple_terrain.elevation.shape, -65.0)
+    builder.enrich_graph(rf_coverage=rf_coverage, slope_reduction=None)
+
+    signals = [data["rf_coverage_dbm"] for _, _, data in builder.simplified_graph.edges(data=True)]
+    # Edges leaving the raster read the out-of-bounds fill, never the -80 dBm default
+    assert -65.0 in signals
+    assert set(signals) <= {-65.0, -200.0}
@@ -0,0 +1,176 @@
+"""Tests for threat prediction module."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from prophet import Prophet
+
+from ghost_supply.perception.threat_model import KillZoneIndex, ThreatPredictor
+from ghost_supply.utils.geo import haversine_distances
+
+
+@pytest.fixture(scope="module")
+def trained_predictor():
+    """Threat predictor trained on a short synthetic incident history."""
+    predictor = ThreatPredictor()
+    predictor.generate_synthetic_incidents(num_incidents=400, days_history=14)
+    predictor.train_temporal_model()
+    predictor.identify_kill_zones()
+
+    return predictor
+
+
+def test_forecast_table_matches_prophet(trained_predictor):
+    """Test table lookups match single Prophet predictions at each hour."""
+    start = datetime(2026, 1, 10, 5, 30)
+
+    table = trained_predictor.build_forecast_table(start, horizon_hours=6)
+
+    assert len(table) == 6
+    assert trained_predictor.covers(start + timedelta(hours=5))
+    assert not trained_predictor.covers(start + timedelta(hours=6))
+
+    looked_up = [
+        trained_predictor.predict_threat_at_time(start + timedelta(hours=h)) for h in range(6)
+    ]
+
+    trained_predictor.forecast_table = {}
+
+    for h, value in enumerate(looked_up):
+        hour = datetime(2026, 1, 10, 5) + timedelta(hours=h)
+        assert value == pytest.approx(trained_predictor.predict_threat_at_time(hour))
+
+
+def test_forecast_table_skips_prophet(trained_predictor, monkeypatch):
+    """Test risk_at does not run Prophet inside the forecast horizon."""
+    start = datetime(2026, 1, 10, 12)
+    trained_predictor.build_forecast_table(start, horizon_hours=2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Prophet called inside forecast horizon")
+
+    monkeypatch.setattr(trained_predictor.prophet_model, "predict", fail)
+
+    risk = trained_predictor.risk_at(48.5, 37.5, start + timedelta(minutes=90), "primary")
+
+    assert 0 < risk <= 1.0
+
+
+def test_risk_at_many_matches_risk_at(trained_predictor):
+    """Test batch risk scoring matches scalar risk_at."""
+    assert trained_predictor.kill_zones
+
+    rng = np.random.default_rng(0)
+    centers = np.array([kz["center"] for kz in trained_predictor.kill_zones])
+    picks = rng.integers(0, len(centers), 40)
+
+    lats = centers[picks, 0] + rng.normal(0, 0.01, 40)
+    lons = centers[picks, 1] + rng.normal(0, 0.01, 40)
+    timestamps = [datetime(2026, 1, 10) + timedelta(hours=int(h)) for h in rng.integers(0, 30, 40)]
+    road_types = rng.choice(["primary", "secondary", "track", "offroad"], 40)
+    weather = rng.choice(["clear", "rain", "fog"], 40)
+
+    batch = trained_predictor.risk_at_many(lats, lons, timestamps, road_types, weather)
+
+    scalar = [
+        trained_predictor.risk_at(lat, lon, t, road, w)
+        for lat, lon, t, road, w in zip(lats, lons, timestamps, road_types, weather)
+    ]
+
+    # Kill-zone distances are spherical in the batch path, geodesic in risk_at
+    np.testing.assert_allclose(batch, scalar, rtol=1e-2)
+
+
+def test_kill_zone_index_finds_all_nearby_zones():
+    """Test index candidates include every zone within the search radius."""
+    rng = np.random.default_rng(1)
+    kill_zones = [
+        {
+            "center": (48.3 + rng.uniform(0, 0.4), 37.2 + rng.uniform(0, 0.6)),
+            "radius_km": rng.uniform(0.5, 3.0),
+        }
+        for _ in range(50)
+    ]
+    index = KillZoneIndex(kill_zones)
+
+    lats = rng.uniform(48.3, 48.7, 500)
+    lons = rng.uniform(37.2, 37.8, 500)
+
+    point_idx, zone_idx = index.query(lats, lons, scale=2.0)
+    found = set(zip(point_idx.tolist(), zone_idx.tolist()))
+
+    for zone, kz in enumerate(kill_zones):
+        distance = haversine_distances(lats, lons, kz["center"][0], kz["center"][1])
+        for point in np.flatnonzero(distance <= 2.0 * kz["radius_km"]):
+            assert (point, zone) in found
+
+    assert len(found) < len(lats) * len(kill_zones)
+    assert set(index.candidates(lats[0], lons[0], scale=2.0)) == {z for p, z in found if p == 0}
+
+
+def test_temporal_model_cache_skips_training(trained_predictor, tmp_path, monkeypatch):
+    """Test a warm model cache reloads Prophet instead of refitting."""
+    incidents = trained_predictor.incidents
+
+    first = ThreatPredictor()
+    first.train_temporal_model(incidents, cache_dir=str(tmp_path))
+
+    assert len(list((tmp_path / "prophet").glob("*.json"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Prophet refit on warm cache")
+
+    monkeypatch.setattr(Prophet, "fit", fail)
+
+    second = ThreatPredictor()
+    second.train_temporal_model(incidents, cache_dir=str(tmp_path))
+
+    timestamp = datetime(2026, 1, 10, 14)
+    assert second.predict_threat_at_time(timestamp) == pytest.approx(
+        first.predict_threat_at_time(timestamp)
+    )
+
+    changed = ThreatPredictor()
+    with pytest.raises(AssertionError):
+        changed.train_temporal_model(incidents.iloc[1:], cache_dir=str(tmp_path))
+
+
+def test_kill_zone_index_follows_in_place_edits():
+    """Test zones appended to or popped from the same list are picked up."""
+    predictor = ThreatPredictor()
+    zone = {"id": 0, "center": (48.5, 37.5), "radius_km": 2.0, "num_incidents": 50}
+
+    assert predictor.get_kill_zone_at(48.5, 37.5) is None
+
+    predictor.kill_zones.append(zone)
+    assert predictor.get_kill_zone_at(48.5, 37.5) is zone
+
+    predictor.kill_zones.append({**zone, "center": (48.6, 37.6), "num_incidents": 10})
+    predictor.kill_zones.pop(0)
+
+    noon = datetime(2026, 1, 10, 12)
+    risk = predictor.risk_at_many(np.array([48.5, 48.6]), np.array([37.5, 37.6]), noon)
+    assert risk[0] == pytest.approx(predictor.risk_at(48.5, 37.5, noon))
+    assert risk[1] == pytest.approx(predictor.risk_at(48.6, 37.6, noon))
+    assert risk[1] > risk[0]
+
+
+def test_kill_zone_index_reused_across_queries(monkeypatch):
+    """Test queries on unchanged zones reuse the index without rereading them."""
+    predictor = ThreatPredictor()
+    predictor.kill_zones = [
+        {"id": 0, "center": (48.5, 37.5), "radius_km": 2.0, "num_incidents": 50},
+    ]
+    predictor.get_kill_zone_at(48.5, 37.5)
+    index = predictor.kill_zone_index
+
+    def fail(*args, **kwargs):
+        raise AssertionError("kill zone geometry rebuilt on an unchanged list")
+
+    monkeypatch.setattr(KillZoneIndex, "_geometry", fail)
+
+    noon = datetime(2026, 1, 10, 12)
+    assert predictor.get_kill_zone_at(48.5, 37.5) is predictor.kill_zones[0]
+    predictor.risk_at_many(np.array([48.5, 48.6]), np.array([37.5, 37.6]), noon)
+    assert predictor.kill_zone_index is index